@@ -17,6 +17,7 @@
 from datetime import datetime
 import json
 import logging
+import os
 import pathlib
 
 import discord
@@ -25,13 +26,20 @@ from discord.ext import commands
 from godfather.database import DB
 from godfather.custom_help import CustomHelp
 from godfather.errors import PhaseChangeError
-from godfather.utils import CustomContext, ColoredFormatter, getlogger, alive_or_recent_jester, pluralize
+from godfather.utils import (CustomContext, ColoredFormatter, DMDispatcher, EmbedCache,
+                             WaiterRegistry, entropy_pool, getlogger, pluralize)
 from godfather.game.setup import Setup, SetupLoadError
+from godfather.game.guild_setups import GuildSetupLibrary
+from godfather.game.setup_cache import CustomSetupCache
+from godfather.game.setup_catalog import SetupCatalog
+from godfather.game.setup_generator import SetupGenerator
+from godfather.game.action_router import ActionRouter
 from godfather.game import Phase
 
 
 config = json.load(open('config.json'))
 global_prefix = config.get('prefix', '=')
+SETUPS_PATH = 'setups/setups.yaml'
 
 
 def prefix_callable(bot, _msg: discord.Message):
@@ -41,10 +49,6 @@ def prefix_callable(bot, _msg: discord.Message):
     return [global_prefix, f'<@{bot_id}> ', f'<@!{bot_id}> ']
 
 
-def remove_prefix(text, prefix):
-    return text[text.startswith(prefix) and len(prefix):]
-
-
 class Godfather(commands.Bot):
     def __init__(self):
         super().__init__(
@@ -59,9 +63,26 @@ class Godfather(commands.Bot):
         self.__release__ = 'beta'
         # needed for showing uptime
         self.connected_at = None
-        self.setups = {}
+        self.setups = SetupCatalog()
+        # modification time of the setup list when it was last loaded
+        self.setups_mtime = None
+        # seconds between checks for changes to the setup list, 0 to only reload on command
+        self.setup_reload_interval = config.get('setup_reload_interval', 0)
+        # setups submitted with usesetup, by code
+        self.custom_setups = CustomSetupCache(maxsize=config.get('custom_setup_cache_size', 256))
+        # setups for player counts setups.yaml doesn't cover
+        self.setup_generator = SetupGenerator()
         self.games = {}
         self.db = None
+        # every DM the bot sends goes through here, sharing one rate budget
+        self.dms = DMDispatcher(rate=config.get('dm_rate', 5.0),
+                                burst=config.get('dm_burst', 10))
+        # pending confirm/choice prompts, looked up by message/channel and user
+        self.waiters = WaiterRegistry()
+        # night actions sent in DMs
+        self.action_router = ActionRouter(self)
+        # role and help embeds, cleared whenever a cog is (re)loaded
+        self.embeds = EmbedCache()
 
         # set logger
         self.logger = getlogger(config.get('logging', dict()))
@@ -75,16 +96,71 @@ class Godfather(commands.Bot):
 
         # Load all extensions.
         self.load_extensions()
+        # loaded once, on_ready runs again on every reconnect
+        self.load_setups()
 
         # setup Postgres
         if 'postgres' in config:
             self.db = DB(**config.get('postgres')
                          )  # pylint: disable=invalid-name
+        # setups saved by guilds, empty without a database
+        self.guild_setups = GuildSetupLibrary(self.db)
 
     @property
     def invite(self):
         return 'https://discord.com/oauth2/authorize?client_id={}&scope=bot'.format(self.user.id)
 
+    def load_setups(self):
+        try:
+            self.setups_mtime = os.stat(SETUPS_PATH).st_mtime_ns
+            self.setups = Setup.load_setuplist(SETUPS_PATH)
+        except (OSError, SetupLoadError) as exc:
+            self.logger.error(str(exc))
+            return
+        self.logger.info('Successfully loaded %s setups', len(self.setups))
+
+    def setups_changed(self) -> bool:
+        try:
+            return os.stat(SETUPS_PATH).st_mtime_ns != self.setups_mtime
+        except OSError:
+            return False
+
+    async def reload_setups(self) -> int:
+        """
+        Parses the setup list off the event loop and swaps it in, returning the number of setups.
+        Raises SetupLoadError and keeps the current setups if the new list is invalid.
+        """
+        # recorded first so a broken list isn't retried until it changes again
+        self.setups_mtime = os.stat(SETUPS_PATH).st_mtime_ns
+        setups = await self.loop.run_in_executor(None, Setup.load_setuplist, SETUPS_PATH)
+        # running games keep their own Setup, nothing else holds on to the old catalog
+        self.setups = setups
+        return len(setups)
+
+    async def remove_game(self, channel_id: int):
+        """Drops the game in a channel, if there is one, along with its live board."""
+        game = self.games.pop(channel_id, None)
+        if game is None:
+            return None
+        for player in game.players:
+            self.action_router.untrack(player.user, game)
+        await game.board.close()
+        return game
+
+    def add_cog(self, cog):
+        super().add_cog(cog)
+        self.embeds.clear()
+
+    def remove_cog(self, name):
+        super().remove_cog(name)
+        self.embeds.clear()
+
+    async def close(self):
+        # DMs still queued on shutdown, like end of game results, get a chance to go out
+        await self.dms.drain(timeout=config.get('dm_drain_timeout', 10.0))
+        entropy_pool.close()
+        await super().close()
+
     def run(self, *args, **kwargs):
         self.connected_at = datetime.now()
         super().run(*args, **kwargs)
@@ -96,22 +172,28 @@ class Godfather(commands.Bot):
     async def on_ready(self):
         # initialize games map
         self.logger.info('Ready to serve %s guilds!', len(self.guilds))
-
-        setup_errors: int = 0
-        try:
-            self.setups = Setup.parse_setuplist(open("setups/setups.yaml"))
-        except SetupLoadError as exc:
-            self.logger.error(str(exc))
-            setup_errors += 1
-
-        self.logger.info('Successfully loaded %s setups',
-                         len(self.setups) - setup_errors)
+        # CREATE TABLE IF NOT EXISTS, cheap to repeat on reconnects
+        await self.guild_setups.create_table()
+        # prefetches random.org bytes for role shuffles, which use `secrets` without them
+        if config.get('random_org', True):
+            entropy_pool.start(self.loop)
 
     async def on_message(self, message):
+        self.waiters.feed_message(message)
         if message.content.replace('!', '') == self.user.mention:
             return await message.channel.send('My prefix in this server is: `{}`'.format(global_prefix))
+        if await self.action_router.route(message):
+            return
         return await super().on_message(message)
 
+    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
+        self.waiters.feed_reaction(reaction, user)
+
+    # reaction pagination flips pages on removal too, so users don't have to un-react.
+    # prompts like confirm() don't take removals, un-reacting can't answer them
+    async def on_reaction_remove(self, reaction: discord.Reaction, user: discord.User):
+        self.waiters.feed_reaction_remove(reaction, user)
+
     async def on_guild_join(self, guild: discord.Guild):
         if self.__release__ != 'beta':
             return
@@ -126,68 +208,55 @@ class Godfather(commands.Bot):
     async def on_guild_remove(self, guild: discord.Guild):
         # Go over each channel and try to remove it from games.
         for channel in guild.channels:
-            self.games.pop(channel.id, None)
+            await self.remove_game(channel.id)
 
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
-        self.games.pop(channel.id, None)
+        await self.remove_game(channel.id)
+
+    # keep the player name index and team messages in sync with name and nickname changes
+    async def on_member_update(self, _before: discord.Member, after: discord.Member):
+        game = self.action_router.game_for(after)
+        if game is not None:
+            game.players.renamed(game.players[after])
+
+    async def on_user_update(self, _before: discord.User, after: discord.User):
+        game = self.action_router.game_for(after)
+        if game is not None:
+            game.players.renamed(game.players[after])
 
     async def on_member_remove(self, member: discord.Member):
-        for game in self.games.values():
-            if member in game.players:
-                player = game.players.get(member)
-                if len(game.players.replacements) == 0:
-                    # Modkill user if no replacements.
-                    async with game.channel.typing():
-                        phase_str = 'd' if game.phase == Phase.DAY else 'n'
-                        await game.channel.send(
-                            f'{player.user.name} was modkilled for leaving the server.'
-                            f' They were a *{player.display_role}*.'
-                        )
-                        await player.remove(game, f'modkilled {phase_str}{game.cycle}', modkill=True)
-                        game_ended, winning_faction, independent_wins = game.check_endgame()
-                        if game_ended:
-                            await game.end(winning_faction, independent_wins)
-                        return
-                else:
-                    # Replace user.
-                    replacement = game.players.replacements.popleft()
-                    player.user = replacement
-                    await game.channel.send(
-                        f'{member} left the server.'
-                        f'\n{replacement} has replaced {member}.'
-                    )
-                    await player.send_pm(game)
-                    return
+        game = self.action_router.game_for(member)
+        if game is None:
+            return
+        player = game.players.get(member)
+        if len(game.players.replacements) == 0:
+            # Modkill user if no replacements.
+            async with game.channel.typing():
+                phase_str = 'd' if game.phase == Phase.DAY else 'n'
+                await game.channel.send(
+                    f'{player.user.name} was modkilled for leaving the server.'
+                    f' They were a *{player.display_role}*.'
+                )
+                await player.remove(game, f'modkilled {phase_str}{game.cycle}', modkill=True)
+                game_ended, winning_faction, independent_wins = game.check_endgame()
+                if game_ended:
+                    await game.end(winning_faction, independent_wins)
+        else:
+            # Replace user.
+            replacement = game.players.replacements.popleft()
+            game.replace(player, replacement)
+            await game.channel.send(
+                f'{member} left the server.'
+                f'\n{replacement} has replaced {member}.'
+            )
+            await player.send_pm(game)
 
     async def on_command_error(self, ctx, error):
         # pylint: disable=too-many-return-statements, arguments-differ, too-many-branches
         if hasattr(ctx.command, 'on_error'):
             return
         if isinstance(error, commands.CommandNotFound):
-            args = remove_prefix(ctx.message.content,
-                                 ctx.bot.global_prefix).split(' ')
-            command = args[0]
-
-            if ctx.guild is not None:  # DM only
-                return
-            games = [
-                *filter(lambda g: ctx.author in g.players, self.games.values())]
-            if len(games) == 0:
-                return
-            pl_game = games[0]
-            if pl_game.phase != Phase.NIGHT:
-                return
-            player = pl_game.players[ctx.author]
-
-            if not alive_or_recent_jester(player, pl_game) \
-                    or not hasattr(player.role, 'action'):
-                return
-            valid_actions = [player.role.action, 'noaction'] if not isinstance(player.role.action, list) \
-                else player.role.action + ['noaction']
-            if command.lower() not in valid_actions:
-                return
-            await player.role.on_pm_command(ctx, pl_game, player, args)
-
+            # night actions are handled by the action router before getting here
             return  # ignore invalid commands
 
         elif isinstance(error, commands.MissingRequiredArgument):
@@ -203,7 +272,7 @@ class Godfather(commands.Bot):
         elif isinstance(error, PhaseChangeError):
             # Inform users that game has ended and remove channel id from `self.games`.
             await ctx.send('There was an error incrementing the phase. The game has ended.')
-            self.games.pop(ctx.channel.id, None)
+            await self.remove_game(ctx.channel.id)
             return self.logger.exception(error, exc_info=(type(error), error, error.__traceback__))
 
         await ctx.send(f'Uncaught exception: ```{error}```')
@@ -211,7 +280,7 @@ class Godfather(commands.Bot):
         if config.get('ENV', '') == "production":
             # End game only if `env` is set to 'production'.
             await ctx.send('\nThe game has ended.')
-            self.games.pop(ctx.channel.id, None)
+            await self.remove_game(ctx.channel.id)
 
         self.logger.exception(error, exc_info=(
             type(error), error, error.__traceback__))
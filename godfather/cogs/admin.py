@@ -1,4 +1,10 @@
-from discord.ext import commands
+import logging
+
+from discord.ext import commands, tasks
+
+from godfather.game.setup import SetupLoadError
+
+logger = logging.getLogger('godfather')
 
 ADMINS = [292571834770128906, 244275194070433795,
           278094147901194242, 255449278808457218, 405761995544068107]
@@ -15,6 +21,40 @@ def staff_only():
 class Admin(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        if bot.setup_reload_interval:
+            self.watch_setups.change_interval(seconds=bot.setup_reload_interval)  # pylint: disable=no-member
+            self.watch_setups.start()  # pylint: disable=no-member
+
+    def cog_unload(self):
+        self.watch_setups.cancel()  # pylint: disable=no-member
+
+    @tasks.loop(seconds=60.0)
+    async def watch_setups(self):
+        if not self.bot.setups_changed():
+            return
+        try:
+            count = await self.bot.reload_setups()
+        except (OSError, SetupLoadError) as exc:
+            logger.error('Keeping the old setups, the changed setup list is invalid:\n%s', exc)
+            return
+        logger.info('Reloaded %s setups', count)
+
+    @watch_setups.before_loop
+    async def before_watch_setups(self):
+        await self.bot.wait_until_ready()
+
+    @commands.command(hidden=True)
+    @commands.is_owner()
+    async def reloadsetups(self, ctx):
+        """
+        Reloads setups/setups.yaml without restarting the bot.
+        Running games keep the setup they started with.
+        """
+        try:
+            count = await self.bot.reload_setups()
+        except (OSError, SetupLoadError) as exc:
+            return await ctx.send(f'Couldn\'t reload setups, keeping the old ones.\n```\n{exc}```')
+        await ctx.send(f'Reloaded {count} setups.')
 
     @commands.command()
     @staff_only()
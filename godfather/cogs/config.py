@@ -21,6 +21,8 @@ class Config(commands.Cog):
             await ctx.send(game.config.set(key, value))
         except GameConfigException as err:
             return await ctx.send(*err.args)
+        if key == 'live_board':
+            game.board.schedule()
 
     @commands.command()
     @host_only()
@@ -60,13 +62,11 @@ class Config(commands.Cog):
         confirmation = await ctx.send('{}, you still around?'.format(player.user.mention))
         await confirmation.add_reaction('✅')
 
-        def check(reaction, user):
-            return user == player.user and str(reaction.emoji) == '✅' and reaction.message.id == confirmation.id
         to_remove = True
 
         try:
-            _, _ = await self.bot.wait_for(
-                'reaction_add', timeout=45.0, check=check)
+            _, _ = await self.bot.waiters.wait_for_reaction(
+                confirmation.id, player.user.id, ['✅'], timeout=45.0)
             to_remove = False
             await ctx.message.add_reaction('❌')
             await confirmation.delete()
@@ -86,7 +86,7 @@ class Config(commands.Cog):
 
             else:
                 replacement = game.players.replacements.popleft()
-                player.user = replacement
+                game.replace(player, replacement)
                 await ctx.send(f'{replacement} has replaced {ctx.author}.')
                 await player.send_pm(game)
                 return
@@ -1,5 +1,4 @@
 import asyncio
-import inspect
 from datetime import datetime
 import typing
 from collections import defaultdict
@@ -9,21 +8,59 @@ import math
 import discord
 from discord.ext import commands
 
-from Levenshtein import jaro_winkler
-
 from godfather.cogs.mafia.checks import *  # pylint: disable=wildcard-import, unused-wildcard-import
 from godfather.errors import PhaseChangeError
 from godfather.game import Game, Phase, Player
 from godfather.game.vote_manager import VoteError
 from godfather.game.setup import Setup, SetupLoadError
-from godfather.roles import all_roles, role_categories
-from godfather.utils import (CustomContext, confirm, from_now,
-                             emotes)
+from godfather.game.types import LARGE_GAME_MAX_PLAYERS
+from godfather.roles import role_categories, role_registry
+from godfather.utils import (CustomContext, SearchIndex, chunk_lines, confirm, embed_pages,
+                             emotes, from_now, paginate, send_chunked)
+from godfather.utils.paginator import EMBED_FIELD_LIMIT
 
 
 class Mafia(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # roleinfo accepts categories too
+        self.role_search = SearchIndex([*role_registry, *role_categories])
+        self.category_search = SearchIndex(role_categories)
+        self._setup_search = None
+        self._indexed_setups = None
+
+    @property
+    def setup_search(self) -> SearchIndex:
+        # the setup list is replaced as a whole when it's reloaded
+        if self._indexed_setups is not self.bot.setups:
+            self._setup_search = SearchIndex(self.bot.setups)
+            self._indexed_setups = self.bot.setups
+        return self._setup_search
+
+    async def offer_suggestion(self, ctx: CustomContext, kind: str, name: str,
+                               index: SearchIndex, retry) -> bool:
+        """
+        Asks the author whether they meant the closest match to `name` and awaits `retry` with it if so.
+        Returns False if nothing came close.
+        """
+        matches = index.search(name)
+        if not matches:
+            return False
+        best, *others = (match for match, _ in matches)
+        out = f'Couldn\'t find the {kind} "{name}". Did you mean {best}?'
+        if others:
+            out += f' (Other matches: {", ".join(others)})'
+        await ctx.send(out)
+
+        def check(msg):
+            return msg.content.lower() in ['yes', 'y', 'yeah']
+        try:
+            await self.bot.waiters.wait_for_message(
+                ctx.channel.id, ctx.author.id, check=check, timeout=10.0)
+        except asyncio.TimeoutError:
+            return True
+        await retry(best)
+        return True
 
     @commands.command(aliases=['create', 'create-game'])
     @commands.guild_only()
@@ -38,15 +75,15 @@ class Mafia(commands.Cog):
                                   'in this channel.')
 
         # prevent the user from joining if they are already in a different game
-        other_games = list(filter(
-            lambda game: ctx.author in game.players, self.bot.games.values()))
-        if len(other_games) > 0:
-            other_game = other_games[0]
+        other_game = self.bot.action_router.game_for(ctx.author)
+        if other_game is not None:
             return await ctx.send(
                 'You are already playing another game in the channel {} ({})'.format(
                     other_game.channel.mention, other_game.channel.guild.name)
             )
 
+        # load the guild's saved setups now so starting the game doesn't have to
+        await self.bot.guild_setups.catalog(ctx.guild.id)
         new_game = Game.create(ctx, self.bot)
         self.bot.games[ctx.channel.id] = new_game
         return await ctx.send('Started a game of mafia in '
@@ -65,10 +102,8 @@ class Mafia(commands.Cog):
             return await ctx.send('You have already joined this game.')
 
         # prevent the user from joining if they are already in a different game
-        other_games = list(filter(
-            lambda game: ctx.author in game.players, self.bot.games.values()))
-        if len(other_games) > 0:
-            other_game = other_games[0]
+        other_game = self.bot.action_router.game_for(ctx.author)
+        if other_game is not None:
             return await ctx.send(
                 'You are already playing another game in the channel {} ({}).'.format(
                     other_game.channel.mention, other_game.channel.guild.name)
@@ -92,8 +127,8 @@ class Mafia(commands.Cog):
             game.players.add(ctx.author, replacement=True)
             return await ctx.send('You have decided to become a replacement.')
 
-        max_players = game.config['max_players']
-        if max_players and len(game.players) >= max_players:
+        max_players = game.config['max_players'] or LARGE_GAME_MAX_PLAYERS
+        if len(game.players) >= max_players:
             return await ctx.send('This game can accept a maximum of {} players.'.format(max_players))
 
         game.players.add(ctx.author)
@@ -166,10 +201,10 @@ class Mafia(commands.Cog):
         Shows everyone who has signed up for the current game.
         """
         game = self.bot.games[ctx.channel.id]
-        msg = f'**Players: {len(game.players)}**\n'
-        msg += game.players.show(show_replacements=True)
+        header = f'**Players: {len(game.players)}**\n'
+        players = game.players.show(show_replacements=True)
 
-        return await ctx.send(msg)
+        return await send_chunked(ctx, players.split('\n'), header=header)
 
     @commands.command()
     @game_started_only()
@@ -185,6 +220,9 @@ class Mafia(commands.Cog):
 
     # the status and remaining command both need this
     def _remaining(self, game, show_in=True):
+        if game.phase_end_at is None:
+            # night prompts are still being sent out
+            return 'once everyone has their prompt'
         if datetime.now() > game.phase_end_at:
             return 'any second now...'
         return from_now(game.phase_end_at, show_in)
@@ -198,18 +236,38 @@ class Mafia(commands.Cog):
             found_setup = ctx.game.setup
 
         if (found_setup is None and setup_name is None) or setup_name == 'all':
-            txt = ('**All available setups:** (to view a specific setup, use '
-                   f'{self.bot.global_prefix}setupinfo <name>)')
-            txt += '```\n'
-            for setup in self.bot.setups.values():
-                txt += f'{setup.name} ({len(setup.roles)} players)\n'
-            txt += '```'
-            return await ctx.send(txt)
-
+            setups = [f'{setup.name} ({len(setup.roles)} players)'
+                      for setup in self.bot.setups.values()]
+            # embed_pages has nothing to page through if the setup list didn't load
+            if not setups:
+                return await ctx.send('No setups are available right now.')
+            pages = embed_pages(setups, title='All available setups',
+                                prefix='```\n', suffix='```')
+            pages[-1].add_field(name='Tip', value='To view a specific setup, use '
+                                f'{self.bot.global_prefix}setupinfo <name>')
+            return await paginate(self.bot, ctx, ctx.author, pages)
+
+        if found_setup is None and ctx.guild is not None:
+            found_setup = (await self.bot.guild_setups.catalog(ctx.guild.id)).get(setup_name)
         if found_setup is None:
             found_setup = self.bot.setups.get(setup_name)
 
         if not found_setup:
+            # setupinfo <players> or <role> lists matching setups
+            if setup_name.isdigit():
+                candidates = self.bot.setups.for_players(int(setup_name))
+            else:
+                candidates = self.bot.setups.with_role(setup_name)
+            if candidates:
+                return await send_chunked(ctx, [f'{setup.name} ({setup.total_players} players)'
+                                                for setup in candidates],
+                                          header=f'Setups matching **{setup_name}**:\n',
+                                          prefix='```\n', suffix='```')
+
+            async def retry(name):
+                await ctx.invoke(ctx.command, setup_name=name)
+            if await self.offer_suggestion(ctx, 'setup', setup_name, self.setup_search, retry):
+                return
             return await ctx.send(
                 f"Couldn't find {setup_name}, use {self.bot.global_prefix}setupinfo to view all setups."
             )
@@ -222,6 +280,45 @@ class Mafia(commands.Cog):
 
         await ctx.send('\n'.join(txt))
 
+    def role_list_embed(self) -> discord.Embed:
+        def accumulator(facroles, role):
+            facroles[role.faction].append(role.name)
+            return facroles
+        fac_roles = reduce(
+            accumulator, role_registry.values(), defaultdict(list))
+        embed = discord.Embed()
+        embed.color = 0x000000
+        embed.set_author(name='All supported roles',
+                         icon_url=self.bot.user.avatar_url)
+        embed.set_footer(
+            text='For information on a specific role, use roleinfo command.')
+        embed.description = ''
+        for faction, roles in fac_roles.items():
+            roles.sort()
+            for role in roles:
+                emote_name = role if faction == 'Neutral' else faction
+                emote = emotes.get(emote_name, '❓')
+                embed.description += '{} **{}**\n'.format(emote, role)
+            embed.description += '\n'
+        return embed
+
+    def role_embed(self, role) -> discord.Embed:
+        annotations = []
+        annotations.append(role.faction)
+        if role.unique:
+            annotations.append('Unique')
+
+        embed = discord.Embed()
+        embed.color = 0x000000
+        embed.set_author(name=f'{role.name} ({"; ".join(annotations)})',
+                         icon_url=self.bot.user.avatar_url)
+        embed.description = '```diff\n'
+        embed.description += role.doc
+        embed.description += '```'
+        embed.set_footer(
+            text=f'Categories: {", ".join(sorted(role.categories))}')
+        return embed
+
     @ commands.command()
     @commands.cooldown(1, 5.0, commands.BucketType.channel)
     async def roleinfo(self, ctx: CustomContext, *, rolename: typing.Optional[str] = None):
@@ -230,65 +327,25 @@ class Mafia(commands.Cog):
         If used without any arguments, shows you a list of all roles supported in the bot.
         """
         if rolename is None:
-            def accumulator(facroles, role):
-                facroles[role().faction.category_name].append(role.name)
-                return facroles
-            fac_roles = reduce(
-                accumulator, all_roles.values(), defaultdict(list))
-            embed = discord.Embed()
-            embed.color = 0x000000
-            embed.set_author(name='All supported roles',
-                             icon_url=self.bot.user.avatar_url)
-            embed.set_footer(
-                text='For information on a specific role, use roleinfo command.')
-            embed.description = ''
-            for faction, roles in fac_roles.items():
-                roles.sort()
-                for role in roles:
-                    emote_name = role if faction == 'Neutral' else faction
-                    emote = emotes.get(emote_name, '❓')
-                    embed.description += '{} **{}**\n'.format(emote, role)
-                embed.description += '\n'
-            return await ctx.send(embed=embed)
-
-        if rolename in role_categories:
-            return await ctx.invoke(self.bot.get_command('categoryinfo'), category=rolename)
-
-        for role in all_roles.values():
-            role = role()  # initialize the class
-            if role.name.lower() == rolename.lower():
-                if role.__doc__ is None:
-                    return await ctx.send('No documentation on {} available.'.format(rolename))
-
-                annotations = []
-                annotations.append(role.faction.category_name)
-                if role.unique:
-                    annotations.append('Unique')
-
-                embed = discord.Embed()
-                embed.color = 0x000000
-                embed.set_author(name=f'{role.name} ({"; ".join(annotations)})',
-                                 icon_url=self.bot.user.avatar_url)
-                embed.description = '```diff\n'
-                embed.description += inspect.getdoc(role)
-                embed.description += '```'
-                embed.set_footer(
-                    text=f'Categories: {", ".join(sorted(role.categories))}')
-
-                return await ctx.send(embed=embed)
-
-        for role in all_roles.values():
-            if jaro_winkler(role.name.lower(), rolename.lower()) > 0.85:
-                await ctx.send('Couldn\'t find the role "{}". Did you mean {}?'.format(rolename, role.name))
-
-                def check(msg):
-                    return msg.author == ctx.author and msg.content.lower() in ['yes', 'y', 'yeah']
-                try:
-                    response = await self.bot.wait_for('message', timeout=10.0, check=check)
-                    return await ctx.invoke(ctx.command, rolename=role.name)
-                except asyncio.TimeoutError:
-                    return
-        await ctx.send("Couldn't find that role!")
+            return await ctx.send(embed=self.bot.embeds.get('rolelist', self.role_list_embed))
+
+        name = self.role_search.get(rolename)
+        if name in role_categories:
+            return await ctx.invoke(self.bot.get_command('categoryinfo'), category=name)
+
+        if name is None:
+            async def retry(name):
+                await ctx.invoke(ctx.command, rolename=name)
+            if not await self.offer_suggestion(ctx, 'role', rolename, self.role_search, retry):
+                await ctx.send("Couldn't find that role!")
+            return
+
+        role = role_registry[name]
+        if role.doc is None:
+            return await ctx.send('No documentation on {} available.'.format(rolename))
+
+        embed = self.bot.embeds.get(('roleinfo', role.name), lambda: self.role_embed(role))
+        return await ctx.send(embed=embed)
 
     @ commands.command()
     @ game_only()
@@ -437,7 +494,7 @@ class Mafia(commands.Cog):
         Shows the current vote count.
         """
         msg = ctx.game.votes.show()
-        return await ctx.send(msg)
+        return await send_chunked(ctx, msg.split('\n'))
 
     @commands.command(aliases=['delete'])
     @host_only()
@@ -451,7 +508,7 @@ class Mafia(commands.Cog):
                                          'Are you sure you want to delete an ongoing game?')
             if not confirmation:
                 return
-        del self.bot.games[ctx.channel.id]
+        await self.bot.remove_game(ctx.channel.id)
         return await ctx.message.add_reaction('✅')
 
     @commands.command()
@@ -470,17 +527,65 @@ class Mafia(commands.Cog):
         night_start: true
         name: your_setup_name
         ```
+
+        Every custom setup gets a code, use `usesetup <code>` to play it again without resending it.
         """
         setup_data = setup_data.strip('```yaml\n')
         try:
-            ctx.game.setup = Setup(setup_data)
+            code, setup = await self.bot.custom_setups.resolve(setup_data)
         except SetupLoadError as err:
             return await ctx.send(err)
+        ctx.game.setup = setup
 
-        return await ctx.send('Using the setup **{}** with {} players.'.format(
-            ctx.game.setup.name, len(ctx.game.setup.roles)
+        return await ctx.send('Using the setup **{}** with {} players. Setup code: `{}`'.format(
+            ctx.game.setup.name, len(ctx.game.setup.roles), code
         ))
 
+    @commands.command()
+    @commands.guild_only()
+    @commands.has_permissions(manage_guild=True)
+    async def savesetup(self, ctx: CustomContext, name: str, *, setup_data: str):
+        """
+        Saves a setup for this server, under the given name.
+        The setup can be a setup code from `usesetup` or anything `usesetup` accepts.
+        Saved setups can be started with `startgame <name>`.
+        """
+        if self.bot.db is None:
+            return await ctx.send('Saving setups needs a database, which this bot doesn\'t have.')
+        setup_data = setup_data.strip('```yaml\n')
+        try:
+            _, setup = await self.bot.custom_setups.resolve(setup_data)
+        except SetupLoadError as err:
+            return await ctx.send(err)
+
+        await self.bot.guild_setups.save(ctx.guild.id, setup.renamed(name))
+        await ctx.send(f'Saved the setup **{name}** with {setup.total_players} players.')
+
+    @commands.command()
+    @commands.guild_only()
+    @commands.has_permissions(manage_guild=True)
+    async def deletesetup(self, ctx: CustomContext, name: str):
+        """
+        Deletes a setup saved for this server.
+        """
+        if self.bot.db is None or not await self.bot.guild_setups.delete(ctx.guild.id, name):
+            return await ctx.send(f'This server has no setup called **{name}**.')
+        await ctx.send(f'Deleted the setup **{name}**.')
+
+    @commands.command()
+    @commands.guild_only()
+    async def serversetups(self, ctx: CustomContext):
+        """
+        Lists the setups saved for this server.
+        """
+        catalog = await self.bot.guild_setups.catalog(ctx.guild.id)
+        if len(catalog) == 0:
+            return await ctx.send(f'This server has no saved setups, use {self.bot.global_prefix}savesetup to add one.')
+        await send_chunked(ctx, [f'{setup.name} ({setup.total_players} players)'
+                                 for setup in catalog.values()],
+                           header=f'Setups saved for **{ctx.guild.name}**:\n',
+                           prefix='```\n', suffix='```')
+
     @commands.command()
     @game_only()
     async def status(self, ctx: CustomContext):
@@ -501,8 +606,13 @@ class Mafia(commands.Cog):
         embed.add_field(name='Phase', value=phase_str.format(ctx.game.cycle))
         embed.add_field(name='Time remaining',
                         value=self._remaining(ctx.game, show_in=False))
-        embed.add_field(name='Players', value='```diff\n{}```'.format(
-            ctx.game.players.show(codeblock=True)))
+        players = ctx.game.players.show(codeblock=True).split('\n')
+        for num, chunk in enumerate(chunk_lines(players, limit=EMBED_FIELD_LIMIT,
+                                                prefix='```diff\n', suffix='```')):
+            embed.add_field(name='Players' if num == 0 else '\u200b', value=chunk, inline=False)
+        queued_dms = self.bot.dms.backlog(ctx.game)
+        if queued_dms > 0:
+            embed.add_field(name='Queued DMs', value=queued_dms)
         return await ctx.send(embed=embed)
 
     @commands.command(name='changehost')
@@ -544,8 +654,14 @@ class Mafia(commands.Cog):
         """
         Shows the list of roles in a specific category
         """
-        if category not in role_categories:
-            return await ctx.send('Category "{}" not found'.format(category))
+        name = self.category_search.get(category)
+        if name is None:
+            async def retry(name):
+                await ctx.invoke(ctx.command, category=name)
+            if not await self.offer_suggestion(ctx, 'category', category, self.category_search, retry):
+                await ctx.send('Category "{}" not found'.format(category))
+            return
+        category = name
         category_roles = role_categories.get(category)
         out = 'Roles in {}: {}'.format(category, ', '.join(
             map(lambda role: role.name, category_roles)))
@@ -100,6 +100,10 @@ class Misc(commands.Cog):
             '**Users**: {}'.format(connected_users),
             '**Channels**: {}'.format(connected_channels)
         ])
+        games_field = '\n'.join([
+            '**Running**: {}'.format(len(self.bot.games)),
+            '**Queued DMs**: {}'.format(self.bot.dms.backlog())
+        ])
         server_stats_field = '\n'.join([
             '**RAM**: {}MB ({}%)'.format(proc_memory_used,
                                          proc_memory_used_percentage),
@@ -112,6 +116,7 @@ class Misc(commands.Cog):
         embed.description = invite_header
         embed.add_field(name='Connected to:', value=connected_to_field)
         embed.add_field(name='Server stats:', value=server_stats_field)
+        embed.add_field(name='Games:', value=games_field)
         embed.set_footer(text=footer_text, icon_url=self.bot.user.avatar_url)
         return await ctx.send(embed=embed)
 
@@ -8,6 +8,11 @@ SUPPORT_SERVER = 'https://discord.gg/gFhvChy'
 class CustomHelp(DefaultHelpCommand):
 
     async def send_bot_help(self, mapping):
+        # help commands are copied for every invocation, so the embed is kept on the bot
+        embed = self.context.bot.embeds.get('help', lambda: self.bot_help_embed(mapping))
+        await self.get_destination().send(embed=embed)
+
+    def bot_help_embed(self, mapping) -> Embed:
         embed = Embed()
         embed.color = EMBED_COLOR
         embed.description = '\n'.join([
@@ -27,7 +32,7 @@ class CustomHelp(DefaultHelpCommand):
             command_names = ', '.join(
                 [command.name for command in commands if not command.hidden])
             embed.add_field(name=cog_name, value=command_names, inline=False)
-        await self.get_destination().send(embed=embed)
+        return embed
 
     async def send_command_help(self, command):
         if command.hidden:
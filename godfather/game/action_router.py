@@ -0,0 +1,66 @@
+import typing
+
+import discord
+
+from godfather.utils import alive_or_recent_jester
+
+from .game import Game, Phase
+
+
+class ActionRouter:
+    """Routes night actions sent in DMs straight to the role handling them.
+
+    Keeps an index of user ids to the game they are playing, so the author's game is
+    found without scanning every running game, and looks the command up in the
+    role's `pm_commands` table.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.player_games: typing.Dict[int, Game] = {}
+
+    def track(self, user: discord.abc.User, game: Game):
+        self.player_games[user.id] = game
+
+    def untrack(self, user: discord.abc.User, game: Game = None):
+        if game is None or self.player_games.get(user.id) is game:
+            self.player_games.pop(user.id, None)
+
+    def game_for(self, user: discord.abc.User) -> typing.Optional[Game]:
+        """Returns the running game `user` is playing in, if any."""
+        game = self.player_games.get(user.id)
+        if game is None:
+            return None
+        # games can be deleted from many places, drop entries that went stale
+        if self.bot.games.get(game.channel.id) is not game or user not in game.players:
+            del self.player_games[user.id]
+            return None
+        return game
+
+    async def route(self, message: discord.Message) -> bool:
+        """Handles `message` if it is a night action. Returns whether it was handled."""
+        if message.guild is not None or message.author.bot:
+            return False
+        prefix = self.bot.global_prefix
+        if not message.content.startswith(prefix):
+            return False
+
+        args = message.content[len(prefix):].split(' ')
+        command = args[0].lower()
+        # regular commands still work in DMs
+        if command in self.bot.all_commands:
+            return False
+
+        game = self.game_for(message.author)
+        if game is None or game.phase != Phase.NIGHT:
+            return False
+        player = game.players[message.author]
+        if not alive_or_recent_jester(player, game):
+            return False
+        handler = player.role.pm_commands().get(command)
+        if handler is None:
+            return False
+
+        ctx = await self.bot.get_context(message)
+        await handler(ctx, game, player, args)
+        return True
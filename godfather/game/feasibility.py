@@ -0,0 +1,71 @@
+import typing
+
+from godfather.roles import role_categories, role_registry
+
+from .role_pool import RolePool
+
+
+def match_slots(candidates: typing.Dict[int, typing.List[str]]) -> typing.Dict[int, str]:
+    """Gives every slot a distinct role out of its candidates, using augmenting paths.
+    Slots left out of the result couldn't be given one."""
+    owner: typing.Dict[str, int] = {}
+
+    def assign(slot, seen):
+        for role in candidates[slot]:
+            if role in seen:
+                continue
+            seen.add(role)
+            if role not in owner or assign(owner[role], seen):
+                owner[role] = slot
+                return True
+        return False
+
+    for slot in candidates:
+        assign(slot, set())
+    return {slot: role for role, slot in owner.items()}
+
+
+def check_feasibility(roles: typing.Sequence[str],
+                      pools: typing.Mapping[str, RolePool]) -> typing.Dict[int, str]:
+    """
+    Raises ValueError if `roles` can't always be dealt without breaking unique constraints,
+    or if an Executioner could end up without a Town target.
+    Category slots that can only become unique roles are returned with one role each,
+    a way of dealing them that is known to work.
+    """
+    fixed_unique = set()
+    for role in roles:
+        if role not in role_categories and role_registry[role].unique:
+            if role in fixed_unique:
+                raise ValueError(f"Unique role '{role}' can only be used once.")
+            fixed_unique.add(role)
+
+    # slots that have to draw a unique role, and what they can draw
+    constrained: typing.Dict[int, typing.List[str]] = {}
+    slot_roles: typing.Dict[int, typing.List[str]] = {}
+    for slot, role in enumerate(roles):
+        if role not in role_categories:
+            continue
+        candidates = [name for name in pools[role].weights if name not in fixed_unique]
+        if not candidates:
+            raise ValueError(f"No roles are left to draw for '{role}'.")
+        slot_roles[slot] = candidates
+        if all(role_registry[name].unique for name in candidates):
+            constrained[slot] = candidates
+
+    matching = match_slots(constrained)
+    for slot in constrained:
+        if slot not in matching:
+            raise ValueError(f"There aren't enough unique roles left to fill every '{roles[slot]}' slot.")
+
+    def is_town(name):
+        return role_registry[name].faction == 'Town'
+
+    may_have_exe = any(role == 'Executioner' for role in roles) \
+        or any('Executioner' in candidates for candidates in slot_roles.values())
+    always_has_town = any(role not in role_categories and is_town(role) for role in roles) \
+        or any(all(map(is_town, candidates)) for candidates in slot_roles.values())
+    if may_have_exe and not always_has_town:
+        raise ValueError('Executioners need a Town target, but this setup might not have any Town roles.')
+
+    return matching
@@ -1,6 +1,7 @@
+import asyncio
 import math
+import typing
 from datetime import datetime, timedelta
-from enum import IntEnum, auto
 
 import discord
 
@@ -8,9 +9,12 @@ from godfather.errors import PhaseChangeError
 from godfather.game.game_config import GameConfig, GameConfigException
 from godfather.game.player_manager import PlayerManager
 from godfather.game.vote_manager import VoteManager
-from godfather.utils import alive_or_recent_jester, choice
-from godfather.game.types import STALEMATE_PRIORITY_ORDER
+from godfather.utils import alive_or_recent_jester, choice, chunk_lines, send_chunked
+from godfather.utils.paginator import MESSAGE_LIMIT
+from godfather.game.types import (LARGE_GAME_MAX_PLAYERS, MAX_PLAYERS,
+                                  STALEMATE_PRIORITY_ORDER, Phase)
 
+from .live_board import LiveBoard
 from .night_actions import NightActions
 from .player import Player
 
@@ -19,7 +23,8 @@ IDLE_TIMEOUT = 15 * 60  # 15 minutes
 DEFAULT_CONFIG = {
     'day_duration': 5 * 60,
     'night_duration': 2 * 60,
-    'max_players': None
+    'max_players': None,
+    'live_board': False
 }
 
 
@@ -35,29 +40,36 @@ def resolve_duration(arg: str):
 
 def resolve_max_players(arg: str):
     if arg == 'reset':
-        return 18
+        return MAX_PLAYERS
     if not arg.isdigit():
         raise GameConfigException('Duration must be a valid number.')
     num = int(arg)
-    if num < 3 or num > 18:
-        raise GameConfigException('Maximum players must be between 3 and 18.')
+    if num < 3 or num > LARGE_GAME_MAX_PLAYERS:
+        raise GameConfigException(
+            f'Maximum players must be between 3 and {LARGE_GAME_MAX_PLAYERS}.')
     return num
 
 
+def resolve_toggle(arg: str):
+    if arg.lower() in ['on', 'true', 'yes', 'enable']:
+        return True
+    if arg.lower() in ['off', 'false', 'no', 'disable']:
+        return False
+    raise GameConfigException('Value must be either "on" or "off".')
+
+
 def config_message(key, value):
     if key == 'day_duration':
         return 'Days will now last {} minutes.'.format(round(value / 60, 1))
     elif key == 'night_duration':
         return 'Nights will now last {} minutes.'.format(round(value / 60, 1))
     elif key == 'max_players':
+        if value > MAX_PLAYERS:
+            return 'This game will now accept up-to {} players. ' \
+                'Large games need a setup of that size.'.format(value)
         return 'This game will now accept up-to {} players'.format(value)
-
-
-class Phase(IntEnum):
-    PREGAME = auto()
-    DAY = auto()
-    NIGHT = auto()
-    STANDBY = auto()
+    elif key == 'live_board':
+        return 'The live board is now {}.'.format('enabled' if value else 'disabled')
 
 
 class Game:
@@ -69,6 +81,9 @@ class Game:
         self.cycle = 0
         # time at which the current phase ends
         self.phase_end_at: datetime = None
+        # playerlist shown in night prompts, rendered at the start of each night
+        # and split into codeblocks that fit in a DM
+        self.night_playerlist: typing.List[str] = []
         self.night_actions = NightActions(self)
         self.setup = None  # the setup used
         # host-configurable stuff
@@ -77,6 +92,9 @@ class Game:
         self.config.add_key(
             'night_duration', resolve_duration, config_message)
         self.config.add_key('max_players', resolve_max_players, config_message)
+        self.config.add_key('live_board', resolve_toggle, config_message)
+        # pinned status message, edited in place if enabled
+        self.board = LiveBoard(self)
 
         self.votes = VoteManager(self)
         # for drawing by timeout
@@ -98,7 +116,7 @@ class Game:
             diff = datetime.now() - self.created_at
             if diff.seconds >= IDLE_TIMEOUT:
                 await self.channel.send('The game took too long to start, deleting it.')
-                self.bot.games.pop(self.channel.id)
+                await self.bot.remove_game(self.channel.id)
                 return
 
         if self.phase == Phase.STANDBY:
@@ -122,12 +140,14 @@ class Game:
             except Exception as exc:
                 raise PhaseChangeError(None, *exc.args)
 
-    # finds a setup for the current player-size. if no setup is found, raises an Exception
+    # finds a setup for the current player-size. if no setup is found, generates one
     async def find_setup(self, setup_name: str = None):
         num_players = len(self.players)
+        # the guild's setups were loaded with the game, this doesn't touch the database
+        guild_setups = self.bot.guild_setups.cached(self.channel.guild.id)
 
         if setup_name:
-            setup = self.bot.setups.get(setup_name)
+            setup = guild_setups.get(setup_name) or self.bot.setups.get(setup_name)
 
             if not setup:
                 raise ValueError('Setup not found.')
@@ -140,19 +160,20 @@ class Game:
 
             return setup
 
-        possible_setups = dict(filter(lambda s: s[1].total_players == num_players,
-                                      self.bot.setups.items()))
+        # guild setups take precedence over global setups with the same name
+        possible_setups = {setup.name: setup for catalog in (self.bot.setups, guild_setups)
+                           for setup in catalog.for_players(num_players)}
         if len(possible_setups) == 0:
-            # wip: custom exception types?
-            raise ValueError('No possible setups found.')
+            # raises ValueError if the player count is out of range
+            return self.bot.setup_generator.get(num_players)
         if len(possible_setups) == 1:
-            return possible_setups[0]
+            return next(iter(possible_setups.values()))
 
         setup = await choice(
             self.bot, self.bot.get_user(self.host.id), self.channel,
             "Multiple setups found.\n"
             "Please choose one of the following:",
-            list(possible_setups.keys())
+            list(possible_setups)
         )
         if setup is None:
             raise ValueError('Prompt timed out.')
@@ -164,13 +185,17 @@ class Game:
         independent_wins = []
 
         alive_players = self.players.filter(is_alive=True)
+        # every player of a faction shares the same result, only check it once
+        faction_wins = {}
 
         for player in self.players:
-            win_check = player.role.faction.has_won(self)
-            if win_check:
-                winning_faction = player.role.faction.name
+            faction = player.role.faction
+            if faction.id not in faction_wins:
+                faction_wins[faction.id] = faction.has_won(self)
+            if faction_wins[faction.id]:
+                winning_faction = faction.name
 
-            if hasattr(player.role.faction, 'has_won_independent'):
+            if player.can_win_independently:
                 independent_check = player.role.faction.has_won_independent(
                     player)
                 if independent_check:
@@ -226,9 +251,12 @@ class Game:
                 self.night_with_no_kills = False
                 self.day_with_no_lynch = False
 
+            deaths = []
             for player in dead_players:
                 role_text = 'We could not determine their role.' if player.role.cleaned else f'They were a {player.display_role}.'
-                await self.channel.send(f'{player.user.name} died last night. {role_text}\n')
+                deaths.append(f'{player.user.name} died last night. {role_text}')
+            # big nights are announced in as few messages as possible
+            await send_chunked(self.channel, deaths)
 
             # 3 consecutive nights w/o no kills = draw by timeout
             if self.cycles_with_no_kills >= 3:
@@ -240,21 +268,13 @@ class Game:
             if game_ended:
                 return await self.end(winning_faction, independent_wins)
 
-            # clear visits
-            for player in self.players:
-                player.visitors.clear()
-
             # voting starts
             self.night_actions.reset()
             self.phase = Phase.DAY
             self.cycle = self.cycle + 1
             alive_players = self.players.filter(is_alive=True)
             # populate voting cache
-            self.votes['nolynch'] = []
-            self.votes['notvoting'] = []
-            for player in alive_players:
-                self.votes[player.user.id] = []
-                self.votes['notvoting'].append(player)
+            self.votes.start_day(alive_players)
 
             await self.channel.send(f'Day **{self.cycle}** will last {phase_t} minutes.'
                                     f' With {len(alive_players)} alive, it takes {self.majority_votes} to lynch.')
@@ -271,18 +291,48 @@ class Game:
             await self.channel.send(f'Night **{self.cycle}** will last {phase_t} minutes. '
                                     'Send in those actions quickly!')
 
+            # actions are accepted while prompts go out, but the timer only starts
+            # once every prompt has been dispatched
+            night = self.cycle
+            self.phase_end_at = None
+            self.phase = Phase.NIGHT
+            # every prompt shares the same playerlist, so it is only rendered once
+            self.night_playerlist = chunk_lines(self.players.show(codeblock=True).split('\n'),
+                                                prefix='```diff\n', suffix='```')
+
             # recently lynched jesters and alive players are allowed to send in actions
+            prompts = []
             for player in filter(lambda p: alive_or_recent_jester(p, self), self.players):
-                if hasattr(player.role, 'on_night'):
+                if player.has_hook('on_night'):
                     can_do, _ = player.role.can_do_action(self)
                     if not can_do:
                         continue
-                    await player.role.on_night(self.bot, player, self)
-
-            self.phase = Phase.NIGHT
+                    prompts.append(player.role.on_night(self.bot, player, self))
+
+            # the DM dispatcher keeps these within the bot's rate budget
+            results = await asyncio.gather(*prompts, return_exceptions=True)
+            errors = [result for result in results if isinstance(result, Exception)]
+            for error in errors:
+                if not isinstance(error, discord.Forbidden):
+                    raise error
+            if errors:
+                self.bot.logger.debug(
+                    "Couldn't send %s night prompts in %s", len(errors), self.channel.id)
+
+            # everyone sent in their actions before the prompts were out
+            if self.phase != Phase.NIGHT or self.cycle != night:
+                return
 
         self.phase_end_at = datetime.now() \
             + timedelta(seconds=phase_duration)
+        self.board.schedule()
+
+    def night_prompt(self, text: str) -> typing.List[str]:
+        """Adds the night playerlist to a prompt, split into as few DMs as possible."""
+        first, *rest = self.night_playerlist
+        if len(text) + len(first) <= MESSAGE_LIMIT:
+            return [text + first, *rest]
+        return [text, first, *rest]
 
     # lynch a player
     async def lynch(self, target: Player):
@@ -297,10 +347,10 @@ class Game:
     def replace(self, player: Player, replacement: discord.User):
         if self.phase == Phase.DAY:
             # swap all possible votes on player with the replacement
-            votes_on_player = self.votes[player.user.id]
-            self.votes[replacement.id] = votes_on_player
-            del self.votes[player.user.id]
-        player.user = replacement  
+            self.votes.replace(player.user.id, replacement.id)
+        self.bot.action_router.untrack(player.user, self)
+        self.players.replace_user(player, replacement)
+        self.bot.action_router.track(replacement, self)
 
     # WIP: End the game
     # If a winning faction is not provided, game is ended
@@ -313,16 +363,17 @@ class Game:
         else:
             await self.channel.send('The game is over. Nobody wins!')
 
-        full_rolelist = '\n'.join(
-            [f'{i+1}. {player.user.name} ({player.full_role})' for i, player in enumerate(self.players)])
+        full_rolelist = [f'{i+1}. {player.user.name} ({player.full_role})'
+                         for i, player in enumerate(self.players)]
 
         if independent_wins and len(independent_wins) > 0:
             ind_win_strings = [
                 f'{player.user.name} ({player.role.name})' for player in independent_wins]
             await self.channel.send(f'Independent wins: {", ".join(ind_win_strings)}')
 
-        await self.channel.send(f'**Final Rolelist**: ```{full_rolelist}```')
-        del bot.games[self.channel.id]
+        await send_chunked(self.channel, full_rolelist, header='**Final Rolelist**: ',
+                           prefix='```\n', suffix='```')
+        await bot.remove_game(self.channel.id)
         # update player stats
         if bot.db:
             with bot.db.conn.cursor() as cur:
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import typing
+
+from godfather.game.setup import Setup, SetupLoadError
+from godfather.game.setup_catalog import SetupCatalog
+
+logger = logging.getLogger('godfather')
+
+CREATE_TABLE = '''CREATE TABLE IF NOT EXISTS guild_setups (
+    guild_id BIGINT NOT NULL,
+    name TEXT NOT NULL,
+    setup TEXT NOT NULL,
+    PRIMARY KEY (guild_id, name)
+);'''
+
+
+class GuildSetupLibrary:
+    """Setups guilds saved for themselves, kept as one catalog per guild.
+
+    A guild's catalog is read from the database once and reloaded whenever the guild saves
+    or deletes a setup, so looking setups up never queries the database.
+    Queries run in an executor, psycopg2 would block the event loop otherwise.
+    """
+
+    def __init__(self, db=None):
+        self.db = db
+        self.catalogs: typing.Dict[int, SetupCatalog] = {}
+
+    @staticmethod
+    async def _run(func, *args):
+        return await asyncio.get_event_loop().run_in_executor(None, func, *args)
+
+    async def create_table(self):
+        """Creates the guild_setups table if it doesn't exist yet, run once on startup."""
+        if self.db is not None:
+            await self._run(self._execute, CREATE_TABLE, ())
+
+    def cached(self, guild_id: int) -> SetupCatalog:
+        """The guild's setups if they were loaded already, no setups otherwise."""
+        return self.catalogs.get(guild_id) or SetupCatalog()
+
+    async def catalog(self, guild_id: int) -> SetupCatalog:
+        catalog = self.catalogs.get(guild_id)
+        if catalog is None:
+            catalog = self.catalogs[guild_id] = await self._run(self.load, guild_id)
+        return catalog
+
+    def _execute(self, query: str, args: tuple) -> int:
+        with self.db.conn.cursor() as cur:
+            cur.execute(query, args)
+            rowcount = cur.rowcount
+        self.db.conn.commit()
+        return rowcount
+
+    def load(self, guild_id: int) -> SetupCatalog:
+        if self.db is None:
+            return SetupCatalog()
+        with self.db.conn.cursor() as cur:
+            cur.execute('SELECT name, setup FROM guild_setups WHERE guild_id=%s ORDER BY name;', (guild_id,))
+            rows = cur.fetchall()
+
+        setups = []
+        for name, setup_yaml in rows:
+            try:
+                setups.append(Setup(setup_yaml))
+            except SetupLoadError as exc:
+                # roles change between versions, a saved setup can stop being valid
+                logger.warning("Skipping saved setup '%s' of guild %s: %s", name, guild_id, exc)
+        return SetupCatalog(setups)
+
+    async def save(self, guild_id: int, setup: Setup):
+        await self._run(self._execute,
+                        'INSERT INTO guild_setups (guild_id, name, setup) VALUES (%s, %s, %s) '
+                        'ON CONFLICT (guild_id, name) DO UPDATE SET setup=EXCLUDED.setup;',
+                        (guild_id, setup.name, setup.to_yaml()))
+        self.catalogs[guild_id] = await self._run(self.load, guild_id)
+
+    async def delete(self, guild_id: int, name: str) -> bool:
+        deleted = await self._run(self._execute,
+                                  'DELETE FROM guild_setups WHERE guild_id=%s AND name=%s;',
+                                  (guild_id, name))
+        self.catalogs[guild_id] = await self._run(self.load, guild_id)
+        return deleted > 0
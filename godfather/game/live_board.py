@@ -0,0 +1,119 @@
+import asyncio
+import logging
+
+import discord
+
+from godfather.game.types import Phase
+from godfather.utils import from_now
+
+logger = logging.getLogger('godfather')
+
+EMBED_COLOR = 0x000000
+
+
+class LiveBoard:
+    """An opt-in pinned message per game, edited in place as the game goes on.
+
+    Changes (votes, deaths, phase changes) call `schedule`, which coalesces every change
+    made within `debounce` seconds into a single edit. Changes made while an edit is being
+    sent get an edit of their own once it's done.
+    """
+    debounce = 3.0
+
+    def __init__(self, game):
+        self.game = game
+        self.message: discord.Message = None
+        self._pending: asyncio.Task = None
+        # something changed after the pending update rendered the board
+        self._dirty = False
+
+    @property
+    def enabled(self):
+        return self.game.config['live_board'] and self.game.has_started
+
+    def schedule(self):
+        if not self.enabled:
+            # turned off mid-game, don't leave a stale board pinned
+            if self.message is not None or self._pending is not None:
+                asyncio.ensure_future(self.close())
+            return
+        if self._pending is not None and not self._pending.done():
+            self._dirty = True
+            return
+        self._pending = asyncio.ensure_future(self._update_later())
+
+    async def _update_later(self):
+        await asyncio.sleep(self.debounce)
+        # changes from here on aren't in this render
+        self._dirty = False
+        try:
+            await self.update()
+        except discord.HTTPException as exc:
+            logger.debug('Could not update the live board in %s: %s',
+                         self.game.channel.id, exc)
+        if self._dirty:
+            self._dirty = False
+            self._pending = asyncio.ensure_future(self._update_later())
+
+    def render(self) -> discord.Embed:
+        game = self.game
+
+        embed = discord.Embed()
+        embed.color = EMBED_COLOR
+        if game.phase == Phase.DAY:
+            embed.set_author(name=f'Day {game.cycle} 🌅')
+        elif game.phase == Phase.NIGHT:
+            embed.set_author(name=f'Night {game.cycle} 🌃')
+        elif game.phase == Phase.STANDBY:
+            embed.set_author(name='Processing... 👀')
+        else:
+            embed.set_author(name='Waiting for the game to start')
+        if game.phase_end_at is not None:
+            embed.description = 'Ends {}'.format(from_now(game.phase_end_at))
+
+        alive_players = game.players.filter(is_alive=True)
+        embed.add_field(name=f'Alive ({len(alive_players)})',
+                        value=', '.join(player.user.name for player in alive_players) or 'Nobody',
+                        inline=False)
+
+        if game.phase == Phase.DAY:
+            tally = []
+            for target, voters in game.votes.items():
+                if target in ['notvoting', 'nolynch'] or len(voters) == 0:
+                    continue
+                player = game.players.by_id(target)
+                tally.append(f'{player.user.name} ({len(voters)})')
+            if len(game.votes['nolynch']) > 0:
+                tally.append('No-lynch ({})'.format(len(game.votes['nolynch'])))
+            tally.append('Not voting ({})'.format(len(game.votes['notvoting'])))
+            embed.add_field(name=f'Votes ({game.majority_votes} to lynch)',
+                            value='\n'.join(tally), inline=False)
+        return embed
+
+    async def update(self):
+        embed = self.render()
+        if self.message is not None:
+            try:
+                return await self.message.edit(embed=embed)
+            except discord.NotFound:
+                # somebody deleted the board, post a new one
+                self.message = None
+
+        self.message = await self.game.channel.send(embed=embed)
+        try:
+            await self.message.pin()
+        except discord.HTTPException:
+            pass  # missing permissions, the board still works unpinned
+
+    async def close(self):
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        self._dirty = False
+        if self.message is None:
+            return
+        try:
+            await self.message.unpin()
+        except discord.HTTPException:
+            pass
+        self.message = None
@@ -0,0 +1,79 @@
+import typing
+from bisect import bisect_left
+from collections import defaultdict
+
+from Levenshtein import jaro_winkler
+
+# how close a name has to be to be considered a typo of the argument
+FUZZY_THRESHOLD = 0.85
+
+
+def name_keys(user) -> typing.FrozenSet[str]:
+    """Every casefolded name a player can be referred to by."""
+    names = [getattr(user, 'name', None), getattr(user, 'nick', None), str(user)]
+    return frozenset(name.casefold() for name in names if isinstance(name, str) and name)
+
+
+class NameIndex:
+    """Casefolded names, nicknames and name#discrims of a game's players.
+
+    Lookups try an exact match first, then every name starting with the argument,
+    then names that are only a typo away.
+    """
+
+    def __init__(self):
+        self.keys: typing.Dict[typing.Any, typing.FrozenSet[str]] = {}
+        self.exact: typing.Dict[str, list] = defaultdict(list)
+        self._sorted_keys: typing.Optional[typing.List[str]] = None
+
+    def add(self, player):
+        keys = name_keys(player.user)
+        self.keys[player] = keys
+        for key in keys:
+            self.exact[key].append(player)
+        self._sorted_keys = None
+
+    def remove(self, player):
+        for key in self.keys.pop(player, ()):
+            self.exact[key].remove(player)
+            if not self.exact[key]:
+                del self.exact[key]
+        self._sorted_keys = None
+
+    def refresh(self, player):
+        """Re-indexes `player` if their names changed."""
+        if self.keys.get(player) == name_keys(player.user):
+            return
+        self.remove(player)
+        self.add(player)
+
+    @property
+    def sorted_keys(self) -> typing.List[str]:
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.exact)
+        return self._sorted_keys
+
+    def find(self, argument: str) -> list:
+        """Returns every player `argument` could refer to, best matches only."""
+        argument = argument.casefold()
+        if argument in self.exact:
+            return list(self.exact[argument])
+
+        found = []
+        keys = self.sorted_keys
+        idx = bisect_left(keys, argument)
+        while idx < len(keys) and keys[idx].startswith(argument):
+            found.extend(player for player in self.exact[keys[idx]] if player not in found)
+            idx += 1
+        if found:
+            return found
+
+        best_score = FUZZY_THRESHOLD
+        for key in keys:
+            score = jaro_winkler(argument, key)
+            if score > best_score:
+                best_score = score
+                found = list(self.exact[key])
+            elif score == best_score:
+                found.extend(player for player in self.exact[key] if player not in found)
+        return found
@@ -1,8 +1,30 @@
 import typing
+from collections import defaultdict
 from discord import Member
 from .types import NightRecord
 
 
+class VisitGraph:
+    """Every visit made during a night, in both directions.
+    Players are kept in the order they visited/were visited in."""
+
+    def __init__(self):
+        self.visitors_of = defaultdict(dict)
+        self.visited_by = defaultdict(dict)
+
+    def add(self, visitor, target):
+        self.visitors_of[target][visitor] = None
+        self.visited_by[visitor][target] = None
+
+    def visitors(self, target) -> list:
+        """Everyone who visited `target`."""
+        return list(self.visitors_of.get(target, ()))
+
+    def visited(self, visitor) -> list:
+        """Everyone `visitor` visited."""
+        return list(self.visited_by.get(visitor, ()))
+
+
 class NightActions(list):
     """This class resolves and accepts night actions, abstracting all logic from Games.
     Night actions are first accepted in a list. Each action has the following attributes:
@@ -24,14 +46,43 @@ class NightActions(list):
         self.game = game
         self.record = NightRecord()
         self.framed_players = []
+        self.visits = VisitGraph()
+        # visits of every past night, by cycle
+        self.visit_history: typing.Dict[int, VisitGraph] = {}
+        # players that sent in actions, to their actions. keyed by Player rather than
+        # user id, replacements keep the Player so their actions stay theirs
+        self.by_player: typing.Dict['Player', typing.List[dict]] = {}
+        self._expected = None
 
     def reset(self):
         self.clear()
         self.framed_players.clear()
         self.record.clear()
+        self.visit_history[self.game.cycle] = self.visits
+        self.visits = VisitGraph()
+        self.by_player.clear()
+        self._expected = None
 
     def add_action(self, action):
         self.append(action)
+        self.by_player.setdefault(action['player'], []).append(action)
+
+    def discard(self, player):
+        """Removes every action sent in by `player`."""
+        if self.by_player.pop(player, None) is None:
+            return
+        self[:] = [action for action in self if action['player'] is not player]
+
+    @property
+    def expected(self) -> int:
+        """Number of players who can send in an action tonight.
+        Counted once per night instead of after every action."""
+        if self._expected is None:
+            self._expected = len(self.game.players.filter(action_only=True))
+        return self._expected
+
+    def forget_expected(self):
+        self._expected = None
 
     async def resolve(self) -> typing.List[Member]:
         # sort by ascending priorities
@@ -76,7 +127,7 @@ class NightActions(list):
         dead_players = []
         for pl_id, record in self.record.items():
             if record['nightkill']['result']:
-                nked_pl = self.game.players.filter(pl_id=pl_id)[0]
+                nked_pl = self.game.players.by_id(pl_id)
                 await nked_pl.remove(self.game, f'killed N{self.game.cycle}')
                 dead_players.append(nked_pl)
 
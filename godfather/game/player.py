@@ -1,57 +1,114 @@
+import re
 import typing
 import discord
-from discord.ext import commands
 from discord.ext.commands import errors
 
+from godfather.game.role_table import build_table, table_for
+from godfather.utils import DMPriority
 
-conv = commands.MemberConverter()
+
+MENTION_PATTERN = re.compile(r'<@!?([0-9]+)>$|([0-9]{15,21})$')
 
 INNOCENT_FACTIONS = ['town', 'neutral.executioner', 'neutral.jester', 'neutral.survivor', 'neutral.amnesiac']
 
+# role PMs only differ by the greeting, the rest is shared by every player with the same role
+_role_pm_bodies: typing.Dict[tuple, str] = {}
+
+
+def role_pm_body(role, display_role: str) -> str:
+    key = (type(role), role.cleaned, display_role)
+    if key not in _role_pm_bodies:
+        _role_pm_bodies[key] = (
+            f'you are a **{display_role}**. '
+            f'{role.description}'  # This follows the previous line.
+            f'\nWin Condition: {role.faction.win_con}'
+        )
+    return _role_pm_bodies[key]
+
 
 class Player:
     def __init__(self, user: discord.Member):
+        # the PlayerManager this player is in, told about role and life changes
+        self.manager = None
+        self._role = None
+        # capabilities of the current role, swapped along with it
+        self.table = None
+        self._is_alive = True
         self.user = user
-        self.role = None
         self.faction = None
-        self.is_alive = True
         self.votes: typing.List[Player] = []
         self.death_reason = ''
-        self.visitors = []
         # when roles change: Goon -> GF, Exe -> Jester
         self.previous_roles = []
         # retributionist stuff
         self.is_revived = False
         self.revived_on = None
 
-    async def send_pm(self, game, no_teammates=False):
-        role_pm = (
-            f'Hello {self.user}, you are a **{self.display_role}**. '
-            f'{self.role.description}'  # This follows the previous line.
-            f'\nWin Condition: {self.role.faction.win_con}'
-        )
+    @property
+    def role(self):
+        return self._role
+
+    @role.setter
+    def role(self, role):
+        # both the old and the new team change
+        self._team_changed()
+        self._role = role
+        self.table = table_for(role) if role is not None else None
+        self._team_changed()
+
+    @property
+    def is_alive(self):
+        return self._is_alive
 
-        await self.user.send(role_pm)
+    @is_alive.setter
+    def is_alive(self, is_alive):
+        self._is_alive = is_alive
+        self._team_changed()
+
+    def has_hook(self, hook: str) -> bool:
+        if self.table is not None:
+            return hook in self.table.hooks
+        return hasattr(self.role, hook)
+
+    @property
+    def verbs(self) -> typing.Tuple[str, ...]:
+        if self.table is not None:
+            return self.table.verbs
+        return build_table(self.role).verbs
+
+    @property
+    def can_win_independently(self) -> bool:
+        if self.table is not None:
+            return self.table.independent_win
+        return hasattr(self.role.faction, 'has_won_independent')
+
+    def _team_changed(self):
+        faction = getattr(self._role, 'faction', None)
+        if self.manager is not None and faction is not None:
+            self.manager.team_changed(faction.id)
+
+    async def send_pm(self, game, no_teammates=False):
+        await self.dm(game, self.role_pm, priority=DMPriority.ROLE_PM)
         if no_teammates:
             return
         if self.role.faction.informed:
-            teammates = map(lambda player: f'{player.user.name} ({player.role.name})', game.players.filter(
-                faction=self.role.faction.id, is_alive=True))
-            if len(teammates) > 1:
-                await self.user.send('Your team consists of: {}'.format(', '.join(teammates)))
+            team_message = game.players.team_message(self.role.faction.id)
+            if team_message is not None:
+                await self.dm(game, team_message, priority=DMPriority.ROLE_PM)
+
+    def dm(self, game, content=None, *, priority=DMPriority.ACTION_RESULT, **kwargs):
+        """Queues a DM to this player through the bot's dispatcher.
+        Returns a future that resolves once the message has been delivered."""
+        return game.bot.dms.enqueue(self.user, content, priority=priority, game=game, **kwargs)
 
     # generates the role's PM
     @property
     def role_pm(self):
-        return (
-            f'Hello {self.user}, you are a **{self.display_role}**. '
-            f'{self.role.description}'  # This follows the previous line.
-            f'\nWin Condition: {self.role.faction.win_con}'
-        )
+        return f'Hello {self.user}, ' + role_pm_body(self.role, self.display_role)
 
     @property
     def innocent(self):
-        if hasattr(self.role, 'innocence_modifier'):
+        if self.has_hook('innocence_modifier'):
             return self.role.innocence_modifier()
         if self.role.faction.id in INNOCENT_FACTIONS:
             return True
@@ -75,8 +132,8 @@ class Player:
     async def visit(self, visitor, actions):
         if visitor == self:
             return
-        self.visitors.append(visitor)
-        if hasattr(self.role, 'on_visit'):
+        actions.visits.add(visitor, self)
+        if self.has_hook('on_visit'):
             await self.role.on_visit(self, visitor, actions)
 
     # remove vote by 'user' from player
@@ -92,26 +149,30 @@ class Player:
         self.is_alive = False
         self.votes = []
         self.death_reason = reason
-        if hasattr(self.role, 'on_death') and not modkill:
+        game.night_actions.forget_expected()
+        game.board.schedule()
+        if self.has_hook('on_death') and not modkill:
             await self.role.on_death(game, self)
 
     @classmethod
     async def convert(cls, ctx, argument):
-        # follow the strategy: numbers, names, standard discord.py conversions
+        # follow the strategy: numbers, names, mentions and ids
         game = ctx.bot.games[ctx.channel.id]
         if argument.isdigit() and \
                 int(argument) > 0 and \
                 int(argument) <= len(game.players):
             return game.players[int(argument) - 1]
 
-        found_member = None
-        # case sensitive username search
-        for member in ctx.guild.members:
-            if member.name.lower() == argument.lower():
-                found_member = member
-
-        if found_member is None:
-            found_member = await conv.convert(ctx, argument)
-        if found_member is None or not found_member in game.players:
+        # only the game's players are searched, never the whole guild
+        found = game.players.names.find(argument)
+        if len(found) == 1:
+            return found[0]
+        if len(found) > 1:
+            raise errors.BadArgument('{} could be any of: {}'.format(
+                argument, ', '.join(str(player.user) for player in found)))
+
+        match = MENTION_PATTERN.match(argument)
+        found_player = match and game.players.by_id(int(match.group(1) or match.group(2)))
+        if not found_player:
             raise errors.BadArgument('Player {} not found'.format(argument))
-        return game.players[found_member]
+        return found_player
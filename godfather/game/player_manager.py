@@ -1,9 +1,10 @@
 import json
-from collections import deque
-from typing import Callable, Deque, List, Optional
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from discord.abc import User
 
+from godfather.game.name_index import NameIndex
 from godfather.game.player import Player
 from godfather.utils import alive_or_recent_jester
 
@@ -12,6 +13,13 @@ class PlayerManager:
     def __init__(self, game):
         self.game = game
         self.players: List[Player] = list()
+        # user ids to players, so lookups don't scan the whole playerlist
+        self.index: Dict[int, Player] = dict()
+        # names and nicknames, for resolving player arguments
+        self.names = NameIndex()
+        # bumped whenever a team's members change, so team messages are only rebuilt then
+        self.team_versions: Dict[str, int] = defaultdict(int)
+        self._team_messages: Dict[str, Tuple[int, Optional[str]]] = dict()
         self.replacements: Deque[User] = deque()
         # used for vote-kicking the host
         self.vote_kicks = set()
@@ -21,31 +29,79 @@ class PlayerManager:
             self.replacements.append(member)
         else:
             player = Player(member)
+            player.manager = self
             self.players.append(player)
+            self.index[member.id] = player
+            self.names.add(player)
             self.game.votes[member.id] = []
+            self.game.bot.action_router.track(member, self.game)
 
     def get(self, user_or_index):
         if isinstance(user_or_index, User):
-            return next(
-                player for player in self.players
-                if player.user.id == user_or_index.id
-            )
+            return self.index[user_or_index.id]
         elif isinstance(user_or_index, int):
             return self.players[user_or_index]
 
     def remove(self, user_or_player):
         if isinstance(user_or_player, Player):
             self.players.remove(user_or_player)
+            self.index.pop(user_or_player.user.id, None)
+            self.names.remove(user_or_player)
+            self.game.bot.action_router.untrack(user_or_player.user, self.game)
         elif isinstance(user_or_player, User):
-            self.players = [
-                player for player in self.players if player.user != user_or_player]
+            player = self.index.pop(user_or_player.id, None)
+            if player is not None:
+                self.players.remove(player)
+                self.names.remove(player)
+            self.game.bot.action_router.untrack(user_or_player, self.game)
         elif isinstance(user_or_player, Callable[Player]):
             self.players = [
                 player for player in self.players if not user_or_player(player)]
+            self.index = {player.user.id: player for player in self.players}
+            self.names = NameIndex()
+            for player in self.players:
+                self.names.add(player)
         else:
             raise TypeError(
                 'PlayerManager.remove must be called with a discord.User, Player or Callable<Player>')
 
+    def by_id(self, pl_id: int) -> Optional[Player]:
+        return self.index.get(pl_id)
+
+    # replacements keep the Player object, only the user changes
+    def replace_user(self, player: Player, replacement: User):
+        del self.index[player.user.id]
+        self.names.remove(player)
+        player.user = replacement
+        self.index[replacement.id] = player
+        self.names.add(player)
+        if player.role is not None:
+            self.team_changed(player.role.faction.id)
+
+    # team messages list names, so renaming a player rebuilds their team's
+    def renamed(self, player: Player):
+        self.names.refresh(player)
+        if player.role is not None:
+            self.team_changed(player.role.faction.id)
+
+    def team_changed(self, faction_id: str):
+        self.team_versions[faction_id] += 1
+
+    def team_message(self, faction_id: str) -> Optional[str]:
+        """The team list informed factions get, None if the player is alone."""
+        version = self.team_versions[faction_id]
+        cached = self._team_messages.get(faction_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        teammates = self.filter(faction=faction_id, is_alive=True)
+        message = None
+        if len(teammates) > 1:
+            message = 'Your team consists of: {}'.format(', '.join(
+                f'{player.user.name} ({player.role.name})' for player in teammates))
+        self._team_messages[faction_id] = (version, message)
+        return message
+
     def filter(self,
                role: Optional[str] = None,
                faction: Optional[str] = None,
@@ -58,6 +114,8 @@ class PlayerManager:
                is_alive: bool = False):
         # pylint: disable=too-many-arguments
         plist = self.players
+        if pl_id:
+            plist = [self.index[pl_id]] if pl_id in self.index else []
 
         def action_only_filter(player):
             if not alive_or_recent_jester(player, self.game):
@@ -70,8 +128,7 @@ class PlayerManager:
         if faction:
             plist = [*filter(lambda pl: pl.role.faction.id == faction, plist)]
         if action:
-            plist = [*filter(lambda pl: pl.role.action == action
-                             if hasattr(pl.role, 'action') else False)]
+            plist = [*filter(lambda pl: action in pl.verbs, plist)]
         if has_vote_on:
             plist = self.game.votes[has_vote_on.id]
         if is_voted_by:
@@ -82,8 +139,6 @@ class PlayerManager:
             plist = [*filter(action_only_filter, plist)]
         if is_alive:
             plist = [*filter(lambda pl: pl.is_alive, plist)]
-        if pl_id:
-            plist = [*filter(lambda pl: pl.user.id == pl_id, plist)]
 
         return plist
 
@@ -118,9 +173,9 @@ class PlayerManager:
     # syntactical sugar that eliminates the need for a Game#has_player method
     def __contains__(self, user_or_player):
         if isinstance(user_or_player, Player):
-            return user_or_player in self.players
+            return self.index.get(user_or_player.user.id) is user_or_player
         elif isinstance(user_or_player, User):
-            return any([player for player in self.players if player.user.id == user_or_player.id])
+            return user_or_player.id in self.index
         else:
             raise TypeError(
                 'PlayerManager.__contains__ must be called with a discord.abc.User or Player instance.')
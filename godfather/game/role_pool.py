@@ -0,0 +1,81 @@
+import random
+import typing
+
+
+class AliasTable:
+    """Weighted choice between items in constant time, using Vose's alias method."""
+
+    def __init__(self, items: typing.Sequence[str], weights: typing.Sequence[float]):
+        if not items or sum(weights) <= 0:
+            raise ValueError('Alias tables need at least one item with a positive weight.')
+        self.items = tuple(items)
+        count = len(items)
+        total = sum(weights)
+        self.prob = [weight * count / total for weight in weights]
+        self.alias = list(range(count))
+
+        small = [idx for idx, prob in enumerate(self.prob) if prob < 1]
+        large = [idx for idx, prob in enumerate(self.prob) if prob >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.alias[less] = more
+            self.prob[more] -= 1 - self.prob[less]
+            (small if self.prob[more] < 1 else large).append(more)
+        # whatever is left is only off by rounding errors
+        for idx in small + large:
+            self.prob[idx] = 1
+
+    def draw(self, rng: random.Random = random) -> str:
+        idx = rng.randrange(len(self.items))
+        return self.items[idx] if rng.random() < self.prob[idx] else self.items[self.alias[idx]]
+
+
+class RolePool:
+    """The roles a category slot can become, with their weights. Shared by every game of a setup."""
+
+    def __init__(self, category: str, weights: typing.Dict[str, float]):
+        self.category = category
+        # roles weighted 0 can't be drawn at all
+        self.weights = {role: weight for role, weight in weights.items() if weight > 0}
+        self.total = sum(self.weights.values())
+        self.table = AliasTable(list(self.weights), list(self.weights.values())) if self.weights else None
+
+
+class RoleSampler:
+    """Draws roles from a setup's pools for one game, never drawing an excluded role.
+
+    Excluded roles are rejected when drawn, a pool is only rebuilt once
+    half of its weight has been excluded, so draws stay constant time.
+    """
+
+    def __init__(self, pools: typing.Mapping[str, RolePool], rng: random.Random = random):
+        self.pools = pools
+        self.rng = rng
+        self.excluded: typing.Set[str] = set()
+        # category -> [table, weight in the table, excluded weight in the table]
+        self.state: typing.Dict[str, list] = {
+            category: [pool.table, pool.total, 0] for category, pool in pools.items()}
+
+    def exclude(self, role: str):
+        if role in self.excluded:
+            return
+        self.excluded.add(role)
+        for category, pool in self.pools.items():
+            if role in pool.weights:
+                self.state[category][2] += pool.weights[role]
+
+    def draw(self, category: str) -> str:
+        state = self.state[category]
+        table, weight, excluded = state
+        if table is None or excluded * 2 >= weight:
+            weights = {role: role_weight for role, role_weight in self.pools[category].weights.items()
+                       if role not in self.excluded}
+            if not weights:
+                raise ValueError(f'Every role in {category} has already been used.')
+            table = AliasTable(list(weights), list(weights.values()))
+            state[:] = [table, sum(weights.values()), 0]
+
+        while True:
+            role = table.draw(self.rng)
+            if role not in self.excluded:
+                return role
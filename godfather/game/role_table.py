@@ -0,0 +1,54 @@
+import typing
+
+# optional hooks roles may define, looked up once per role class
+ROLE_HOOKS = ('on_night', 'on_visit', 'on_death', 'innocence_modifier')
+
+
+class RoleTable(typing.NamedTuple):
+    """What a role class can do, so the engine doesn't probe roles with hasattr."""
+    hooks: typing.FrozenSet[str]
+    # commands accepted in DMs at night, noaction included
+    verbs: typing.Tuple[str, ...]
+    priority: typing.Optional[int]
+    # whether the role's faction can win alongside others
+    independent_win: bool
+
+
+_role_classes: typing.Set[type] = set()
+_tables: typing.Dict[type, RoleTable] = {}
+
+
+def register(role_cls: type):
+    _role_classes.add(role_cls)
+
+
+def build_table(role) -> RoleTable:
+    """Builds a table from a role class, or from an instance that isn't registered."""
+    action = getattr(role, 'action', None)
+    if not action:
+        verbs = ()
+    else:
+        verbs = (*(action if isinstance(action, list) else [action]), 'noaction')
+    return RoleTable(
+        hooks=frozenset(hook for hook in ROLE_HOOKS if hasattr(role, hook)),
+        verbs=verbs,
+        priority=getattr(role, 'action_priority', None),
+        independent_win=hasattr(getattr(role, 'faction', None), 'has_won_independent')
+    )
+
+
+def class_table(role_cls: type) -> RoleTable:
+    """Returns the table of a registered role class, built on first use."""
+    table = _tables.get(role_cls)
+    if table is None:
+        table = _tables[role_cls] = build_table(role_cls)
+    return table
+
+
+def table_for(role) -> typing.Optional[RoleTable]:
+    """Returns the table of `role`'s class.
+    Roles that aren't registered (mocks in tests, mostly) don't get one."""
+    role_cls = type(role)
+    if role_cls not in _role_classes:
+        return None
+    return class_table(role_cls)
@@ -1,14 +1,44 @@
-import copy
+import asyncio
+import hashlib
 from io import TextIOBase
+import json
+import logging
+from pathlib import Path
 import typing
 import random
 import re
+from types import MappingProxyType
 
 import discord
 import yaml
 
-from godfather.roles import all_roles, role_categories
-from godfather.utils import get_random_sequence
+from godfather.game.feasibility import check_feasibility
+from godfather.game.role_pool import RolePool, RoleSampler
+from godfather.game.setup_catalog import SetupCatalog
+from godfather.game.types import LARGE_GAME_MAX_PLAYERS
+from godfather.roles import all_roles, role_categories, role_registry
+from godfather.utils import DMPriority, get_random_sequence
+
+logger = logging.getLogger('godfather')
+
+# libyaml's loader is several times faster, the pure Python one is used without it
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# bump when the compiled form of setups changes, invalidating cached setup lists
+COMPILED_VERSION = 3
+# roles not given a weight in a setup are drawn this often relative to the others
+DEFAULT_WEIGHT = 1.0
+# random deals tried before falling back to the deal found when the setup was checked
+DEAL_ATTEMPTS = 20
+
+
+def setuplist_key(content: bytes) -> str:
+    """Hash of a setup list and the roles it was validated against."""
+    digest = hashlib.sha256(f'{COMPILED_VERSION}\0'.encode())
+    digest.update(content)
+    # setups are checked against the categories, factions and uniqueness of roles
+    for info in sorted(role_registry.values()):
+        digest.update(f'\0{info.name}:{info.faction}:{info.unique}:{",".join(info.categories)}'.encode())
+    return digest.hexdigest()
 
 
 class SetupLoadError(Exception):
@@ -41,10 +71,10 @@ class Setup:
         return role_name, quantity
 
     @classmethod
-    def parse_setuplist(cls, file: TextIOBase):
-        """Parse a YAML file and return a list of Setups"""
+    def parse_setuplist(cls, file: typing.Union[TextIOBase, str, bytes]) -> SetupCatalog:
+        """Parse a YAML file and return a catalog of its Setups"""
         try:
-            setuplist = yaml.safe_load(file)
+            setuplist = yaml.load(file, Loader=SafeLoader)
         except yaml.YAMLError as exc:
             raise SetupLoadError(
                 f"Error while parsing setup list file:\n{exc}")
@@ -53,33 +83,88 @@ class Setup:
         for setup in setuplist:
             setup_name = setup.get('name', 'unnamed')
             try:
-                setup_obj = cls(
-                    yaml.safe_dump(setup))
+                setup_obj = cls(setup)
                 setups[setup_name] = setup_obj
             except SetupLoadError as exc:
                 raise SetupLoadError(
                     f"While parsing setup '{setup_name}':\n{exc}")
 
+        return SetupCatalog(setups.values())
+
+    @classmethod
+    def load_setuplist(cls, path: typing.Union[str, Path],
+                       cache_path: typing.Union[str, Path, None] = None) -> SetupCatalog:
+        """
+        Load the setup list at `path`, validating it only if it changed since it was last loaded.
+        Validated setups are cached in `cache_path`, next to the list by default.
+        """
+        path = Path(path)
+        cache_path = Path(cache_path) if cache_path else path.with_name(f'.{path.name}.cache')
+        content = path.read_bytes()
+        key = setuplist_key(content)
+
+        try:
+            with open(cache_path, encoding='utf-8') as file:
+                cached = json.load(file)
+            if cached['key'] == key:
+                return SetupCatalog(map(cls.from_compiled, cached['setups']))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        setups = cls.parse_setuplist(content)
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as file:
+                json.dump({'key': key, 'setups': [setup.compiled() for setup in setups.values()]}, file)
+        except OSError as exc:
+            logger.warning("Couldn't cache the setup list: %s", exc)
         return setups
 
+    def compiled(self) -> dict:
+        """Validated form of the setup, turned back into a Setup by `from_compiled`"""
+        return {'name': self.name, 'roles': list(self.roles), 'flags': dict(self.flags),
+                'weights': dict(self.weights), 'matching': list(self.matching.items())}
+
+    @classmethod
+    def from_compiled(cls, compiled: dict) -> 'Setup':
+        """Create a setup from its validated form without validating it again"""
+        setup = cls.__new__(cls)
+        setup.name = compiled['name']
+        setup.roles = tuple(compiled['roles'])
+        setup.flags = MappingProxyType({**Setup.all_flags, **compiled['flags']})
+        setup.weights = MappingProxyType(compiled.get('weights', {}))
+        setup.total_players = len(setup.roles)
+        setup._pools = None
+        setup.matching = MappingProxyType({slot: role for slot, role in compiled['matching']})
+        return setup
+
+    def renamed(self, name: str) -> 'Setup':
+        """Copy of the setup under another name"""
+        return Setup.from_compiled({**self.compiled(), 'name': name})
+
     def to_yaml(self) -> str:
         """Convert setup to YAML format and return the string value of it"""
         return yaml.safe_dump({
-            **{"roles": self.roles, 'name': self.name},
+            **{"roles": list(self.roles), 'name': self.name},
+            **({'weights': dict(self.weights)} if self.weights else {}),
             **{key: val for key, val in self.flags.items()
                if Setup.all_flags[key] != val}  # only non-default flag values
         })
 
-    def __init__(self, setup_str: str):
-        """Read a YAML string and create a setup object from it"""
+    def __init__(self, setup: typing.Union[str, dict]):
+        """Create a setup object from a YAML string or an already parsed setup"""
         self.total_players: int = 0
-        self.flags: typing.Dict[str, bool] = {}
-        self.roles: typing.List[str] = []
+        flags: typing.Dict[str, bool] = {}
+        roles: typing.List[str] = []
+        # category pools, built the first time the setup is used
+        self._pools: typing.Optional[typing.Dict[str, RolePool]] = None
 
-        try:
-            setup_dict: dict = yaml.safe_load(setup_str)
-        except yaml.YAMLError as exc:
-            raise SetupLoadError(f"Error while parsing setup string:\n{exc}")
+        if isinstance(setup, str):
+            try:
+                setup_dict = yaml.load(setup, Loader=SafeLoader)
+            except yaml.YAMLError as exc:
+                raise SetupLoadError(f"Error while parsing setup string:\n{exc}")
+        else:
+            setup_dict = setup
 
         if isinstance(setup_dict, str) and ',' in setup_dict:
             setup_dict = {'roles': list(map(str.strip, setup_dict.split(',')))}
@@ -109,7 +194,7 @@ class Setup:
                     f"Expected 'bool' but got '{type(flag_value).__name__}'"
                 )
 
-            self.flags[flag_name] = flag_value
+            flags[flag_name] = flag_value
 
         if not isinstance(role_list, list):
             raise SetupLoadError("Invalid data-type for 'roles'.\n"
@@ -120,69 +205,131 @@ class Setup:
             if role_name not in all_roles and role_name not in role_categories:
                 raise SetupLoadError(f"Role '{role_name}' not found.")
 
-            self.roles.extend([role_name] * role_quantity)
-
+            roles.extend([role_name] * role_quantity)
+
+        weights = setup_dict.get('weights', {})
+        if not isinstance(weights, dict):
+            raise SetupLoadError("Invalid data-type for 'weights'.\n"
+                                 f"Expected 'dict' but got '{type(weights).__name__}'")
+        for role_name, weight in weights.items():
+            if role_name not in all_roles:
+                raise SetupLoadError(f"Role '{role_name}' in weights not found.")
+            if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+                raise SetupLoadError(f"Weight of '{role_name}' must be a number of at least 0.")
+
+        # setups are shared by every game using them
+        self.weights: typing.Mapping[str, float] = MappingProxyType(weights)
+        self.flags: typing.Mapping[str, bool] = MappingProxyType(flags)
+        self.roles: typing.Tuple[str, ...] = tuple(roles)
         self.total_players = len(self.roles)
 
         if self.total_players < 3:
             raise SetupLoadError("Setups must have at least 3 players.")
-        if self.total_players > 18:
-            raise SetupLoadError('Setups can have at most 18 players.')
+        if self.total_players > LARGE_GAME_MAX_PLAYERS:
+            raise SetupLoadError(f'Setups can have at most {LARGE_GAME_MAX_PLAYERS} players.')
 
-    async def assign_roles(self, game):
-        roles = copy.deepcopy(self.roles)
-        # convert categories to roles
-        # contains all unique roles already used in the setup
-        unique_roles = set()
-        for n, role in enumerate(roles):
-            if role in role_categories:
-                category_roles = role_categories.get(role)
-
-                def filter_unique(role):
-                    return role.name not in unique_roles
-
-                random_role = random.choice(
-                    list(filter(filter_unique, category_roles)))
-                if random_role.unique:
-                    unique_roles.add(random_role.name)
-                roles[n] = random_role.name
-            else:
-                role_cls = all_roles.get(role)
-                if role_cls.unique:
-                    unique_roles.add(role_cls.name)
+        try:
+            # category slots that can only become unique roles, with a deal known to work
+            self.matching: typing.Mapping[int, str] = MappingProxyType(
+                check_feasibility(self.roles, self.pools))
+        except ValueError as exc:
+            raise SetupLoadError(str(exc))
+
+    @property
+    def pools(self) -> typing.Dict[str, RolePool]:
+        """Weighted pools of the categories in this setup."""
+        if self._pools is None:
+            self._pools = {
+                category: RolePool(category, {
+                    info.name: self.weights.get(info.name, DEFAULT_WEIGHT)
+                    for info in role_registry.values() if category in info.categories
+                })
+                for category in set(self.roles) if category in role_categories
+            }
+        return self._pools
+
+    def deal_roles(self, forced: typing.Mapping[int, str] = MappingProxyType({})) -> typing.List[str]:
+        """Turns every category slot into a role, slots in `forced` get the role given there.
+        Raises ValueError if a category ran out of roles."""
+        roles = list(self.roles)
+        sampler = RoleSampler(self.pools)
+        # roles named outright come first, so categories can't draw them again if they're unique
+        for role in [*roles, *forced.values()]:
+            if role not in role_categories and role_registry[role].unique:
+                sampler.exclude(role)
+        for slot, role in forced.items():
+            roles[slot] = role
+        # slots that can only become unique roles are the likeliest to run out, so they go first
+        slots = sorted((n for n, role in enumerate(roles) if role in role_categories),
+                       key=lambda n: (n not in self.matching, len(self.pools[roles[n]].weights)))
+        for n in slots:
+            roles[n] = sampler.draw(roles[n])
+            if role_registry[roles[n]].unique:
+                sampler.exclude(roles[n])
+        return roles
+
+    def prepare_roles(self, game) -> typing.Dict[typing.Any, typing.List[str]]:
+        """Rand roles, teammates and Executioner targets without sending anything.
+        Returns every player mapped to the DMs they should receive, in order."""
+        for _ in range(DEAL_ATTEMPTS):
+            try:
+                roles = self.deal_roles()
+                break
+            except ValueError:
+                # random draws used up the unique roles a later slot needed
+                continue
+        else:
+            roles = self.deal_roles(self.matching)
 
         # Create a random sequence of role indexes, enumerate the player list.
         # And assign the nth number in the random sequence to the nth player.
         # Then use the resulting number as index for the role.
         role_sequence = get_random_sequence(0, len(roles)-1)
 
+        role_pms = {}
+        for num, player in enumerate(game.players):
+            player_role = roles[role_sequence[num]]
+
+            # assign role and faction to the player
+            player.role = all_roles.get(player_role)()
+
+        # team messages are built once per faction
+        for player in game.players:
+            role_pms[player] = [player.role_pm]
+            if player.role.faction.informed:
+                team_message = game.players.team_message(player.role.faction.id)
+                if team_message is not None:
+                    role_pms[player].append(team_message)
+
+        for player in game.players.filter(role='Executioner'):
+            targets = list(filter(lambda pl: pl.role.faction.name == 'Town' and pl.role.name not in [
+                'Jailor', 'Mayor'], game.players))
+            target = random.choice(targets)
+            player.target = target
+            role_pms[player].append('Your target is {}'.format(target.user))
+
+        return role_pms
+
+    async def send_role_pms(self, game, role_pms) -> typing.List[discord.User]:
+        """Deliver the output of `prepare_roles` to every player at once.
+        Returns the users the bot couldn't DM."""
         # people the bot couldn't dm
-        no_dms = []
+        no_dms = set()
+
+        async def deliver(player, messages):
+            # the dispatcher keeps each player's messages in order
+            pending = [player.dm(game, message, priority=DMPriority.ROLE_PM)
+                       for message in messages]
+            try:
+                await asyncio.gather(*pending)
+            except discord.Forbidden:
+                no_dms.add(player)
+
+        await asyncio.gather(*(deliver(player, messages)
+                               for player, messages in role_pms.items()))
+        return [player.user for player in role_pms if player in no_dms]
+
+    async def assign_roles(self, game):
+        role_pms = self.prepare_roles(game)
         async with game.channel.typing():
-            for num, player in enumerate(game.players):
-                player_role = roles[role_sequence[num]]
-
-                # assign role and faction to the player
-                player.role = all_roles.get(player_role)()
-
-                # send role PMs
-                try:
-                    await player.send_pm(game, no_teammates=True)
-                except discord.Forbidden:
-                    no_dms.append(player.user)
-
-            for player in filter(lambda pl: pl.role.faction.informed, game.players):
-                teammates = game.players.filter(faction=player.role.faction.id)
-                if len(teammates) > 1:
-                    await player.user.send(
-                        f'Your team consists of: {", ".join(map(lambda player: f"{player.user.name} ({player.role.name})", teammates))}'
-                    )
-
-            for player in game.players.filter(role='Executioner'):
-                targets = list(filter(lambda pl: pl.role.faction.name == 'Town' and pl.role.name not in [
-                    'Jailor', 'Mayor'], game.players))
-                target = random.choice(targets)
-                player.target = target
-                await player.user.send('Your target is {}'.format(target.user))
-
-        return no_dms
+            return await self.send_role_pms(game, role_pms)
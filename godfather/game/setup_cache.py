@@ -0,0 +1,73 @@
+import asyncio
+import hashlib
+import re
+import typing
+from collections import OrderedDict
+
+from godfather.game.setup import Setup, SetupLoadError
+
+# submissions at least this long are parsed in a worker thread
+THREADED_PARSE_SIZE = 512
+CODE_LENGTH = 10
+CODE_PATTERN = re.compile(f'[0-9a-f]{{{CODE_LENGTH}}}')
+
+
+def setup_code(setup_data: str) -> str:
+    """Short, content-addressed code of a setup submission."""
+    return hashlib.sha256(setup_data.strip().encode()).hexdigest()[:CODE_LENGTH]
+
+
+def is_setup_code(text: str) -> bool:
+    return CODE_PATTERN.fullmatch(text) is not None
+
+
+class CustomSetupCache:
+    """The last `maxsize` custom setups by code, shared by every game.
+
+    Setups can't be changed once built, so games can safely use the same one.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.setups: typing.Dict[str, Setup] = OrderedDict()
+
+    def get(self, code: str) -> typing.Optional[Setup]:
+        setup = self.setups.get(code)
+        if setup is not None:
+            self.setups.move_to_end(code)
+        return setup
+
+    def put(self, code: str, setup: Setup):
+        self.setups[code] = setup
+        self.setups.move_to_end(code)
+        while len(self.setups) > self.maxsize:
+            self.setups.popitem(last=False)
+
+    async def load(self, setup_data: str) -> typing.Tuple[str, Setup]:
+        """
+        Returns the code and setup for a submission, parsing it only if it isn't cached.
+        Raises SetupLoadError if the setup is invalid.
+        """
+        code = setup_code(setup_data)
+        setup = self.get(code)
+        if setup is None:
+            if len(setup_data) >= THREADED_PARSE_SIZE:
+                setup = await asyncio.get_event_loop().run_in_executor(None, Setup, setup_data)
+            else:
+                setup = Setup(setup_data)
+            self.put(code, setup)
+        return code, setup
+
+    async def resolve(self, setup_data: str) -> typing.Tuple[str, Setup]:
+        """
+        Returns the code and setup for a setup code or a submission.
+        Raises SetupLoadError if the setup is invalid or the code isn't cached (anymore).
+        """
+        code = setup_data.strip()
+        setup = self.get(code)
+        if setup is not None:
+            return code, setup
+        # codes would otherwise be parsed as a one role setup
+        if is_setup_code(code):
+            raise SetupLoadError('Unknown or expired setup code, send the whole setup again.')
+        return await self.load(setup_data)
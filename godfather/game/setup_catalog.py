@@ -0,0 +1,49 @@
+import typing
+from collections.abc import Mapping
+
+if typing.TYPE_CHECKING:
+    from godfather.game.setup import Setup
+
+
+class SetupCatalog(Mapping):
+    """Setups by name, also indexed by player count and by the roles and categories they use.
+
+    Catalogs aren't changed once built, reloading setups creates a new one.
+    """
+
+    def __init__(self, setups: typing.Iterable['Setup'] = ()):
+        self.by_name: typing.Dict[str, 'Setup'] = {}
+        self.by_players: typing.Dict[int, typing.List['Setup']] = {}
+        self.by_role: typing.Dict[str, typing.List['Setup']] = {}
+
+        for setup in setups:
+            self.by_name[setup.name] = setup
+        # a later setup with the same name replaces the earlier one
+        for setup in self.by_name.values():
+            self.by_players.setdefault(setup.total_players, []).append(setup)
+            # roles and categories as written in the setup, ie. 'Random Town' isn't expanded
+            for role in dict.fromkeys(setup.roles):
+                self.by_role.setdefault(role.casefold(), []).append(setup)
+
+        for candidates in self.by_players.values():
+            candidates.sort(key=lambda setup: setup.name)
+
+    def __getitem__(self, name: str) -> 'Setup':
+        return self.by_name[name]
+
+    def __iter__(self):
+        return iter(self.by_name)
+
+    def __len__(self):
+        return len(self.by_name)
+
+    def __contains__(self, name):
+        return name in self.by_name
+
+    def for_players(self, num_players: int) -> typing.List['Setup']:
+        """Setups that need exactly `num_players` players, ordered by name."""
+        return list(self.by_players.get(num_players, ()))
+
+    def with_role(self, role: str) -> typing.List['Setup']:
+        """Setups that include `role`, a role or category name in any case."""
+        return list(self.by_role.get(role.casefold(), ()))
@@ -0,0 +1,94 @@
+import random
+import typing
+
+from godfather.game.setup import Setup, SetupLoadError
+from godfather.game.types import LARGE_GAME_MAX_PLAYERS
+
+# share of the players that are mafia, and one neutral for every this many players
+MAFIA_RATIO = 0.25
+PLAYERS_PER_NEUTRAL = 8
+# setups tried for each player count, the best balanced one is kept
+CANDIDATES = 40
+
+TOWN_CATEGORIES = ['Vanilla', 'Random Town', 'Town Investigative',
+                   'Town Protective', 'Town Support', 'Town Killing']
+TOWN_WEIGHTS = [4, 3, 2, 2, 1, 1]
+NEUTRAL_CATEGORIES = ['Neutral Benign', 'Neutral Evil', 'Neutral Killing']
+
+# rough strength of a slot on top of the vote every player has
+SLOT_STRENGTH = {
+    'Vanilla': 0.0,
+    'Random Town': 0.9,
+    'Town Investigative': 1.5,
+    'Town Protective': 1.2,
+    'Town Support': 1.0,
+    'Town Killing': 1.3,
+    'Mafia Killing': 0.5,
+    'Random Mafia': 0.4,
+    # neutrals count against the town
+    'Neutral Benign': 0.3,
+    'Neutral Evil': 1.0,
+    'Neutral Killing': 2.5,
+}
+# an informed mafia member is worth this many town votes
+MAFIA_MEMBER = 4.0
+
+
+def balance(roles: typing.Sequence[str]) -> float:
+    """How far apart town and its opponents are, per player. 0 is perfectly balanced."""
+    town = sum(1 + SLOT_STRENGTH[role] for role in roles if role in TOWN_CATEGORIES)
+    mafia = sum(MAFIA_MEMBER + SLOT_STRENGTH[role] for role in roles if 'Mafia' in role)
+    neutral = sum(SLOT_STRENGTH[role] for role in roles if role in NEUTRAL_CATEGORIES)
+    return abs(town - mafia - neutral) / len(roles)
+
+
+class SetupGenerator:
+    """Builds setups out of categories for player counts no setup covers.
+
+    Only the best balanced candidate of each player count is kept, so every
+    generated game of a size uses the same categories and still draws its own roles.
+    """
+
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
+        self.best: typing.Dict[int, Setup] = {}
+
+    def candidate(self, num_players: int, num_mafia: int) -> typing.List[str]:
+        num_neutrals = num_players // PLAYERS_PER_NEUTRAL
+        num_town = num_players - num_mafia - num_neutrals
+        return [
+            *self.rng.choices(TOWN_CATEGORIES, weights=TOWN_WEIGHTS, k=num_town),
+            'Mafia Killing', *['Random Mafia'] * (num_mafia - 1),
+            *self.rng.choices(NEUTRAL_CATEGORIES, k=num_neutrals)
+        ]
+
+    def generate(self, num_players: int) -> Setup:
+        if not 3 <= num_players <= LARGE_GAME_MAX_PLAYERS:
+            raise ValueError(f'Setups can only be generated for 3 to {LARGE_GAME_MAX_PLAYERS} players.')
+        base_mafia = max(1, round(num_players * MAFIA_RATIO))
+        # mafia must stay a minority, and town needs someone left
+        mafia_counts = [count for count in (base_mafia - 1, base_mafia, base_mafia + 1)
+                        if 1 <= count <= (num_players - 1) // 2]
+
+        best, best_score = None, None
+        for _ in range(CANDIDATES):
+            roles = self.candidate(num_players, self.rng.choice(mafia_counts))
+            score = balance(roles)
+            if best_score is not None and score >= best_score:
+                continue
+            try:
+                best = Setup({'name': f'generated{num_players}', 'roles': roles})
+            except SetupLoadError:
+                continue
+            best_score = score
+        if best is None:
+            raise ValueError(f'Couldn\'t generate a setup for {num_players} players.')
+        return best
+
+    def get(self, num_players: int) -> Setup:
+        """The best setup generated for `num_players`, generated on first use.
+        A few milliseconds the first time, so it's fine on the event loop."""
+        setup = self.best.get(num_players)
+        if setup is None:
+            setup = self.best[num_players] = self.generate(num_players)
+        return setup
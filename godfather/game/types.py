@@ -1,6 +1,11 @@
 from collections import defaultdict
 from enum import IntEnum, auto
 
+# regular lobbies are capped at MAX_PLAYERS, hosts can raise it up to
+# LARGE_GAME_MAX_PLAYERS for large-game events
+MAX_PLAYERS = 18
+LARGE_GAME_MAX_PLAYERS = 100
+
 STALEMATE_PRIORITY_ORDER = [
     'Escort',
     'Goon',
@@ -17,6 +22,13 @@ class NightRecord(defaultdict):
             lambda: {'result': False, 'by': []}))
 
 
+class Phase(IntEnum):
+    PREGAME = auto()
+    DAY = auto()
+    NIGHT = auto()
+    STANDBY = auto()
+
+
 class Defense(IntEnum):
     NONE = auto()
     BASIC = auto()
@@ -8,9 +8,40 @@ class VoteManager(dict):
         # votes holds a dict of player IDs mapped to the player objects voting them
         # it includes a special notvoting and nolynch key for players not voting, and players voting to no-lynch
         super().__init__([('notvoting', []), ('nolynch', [])])
+        # voters mapped to the key they are in, so changing a vote doesn't scan every list
+        self.cast = {}
         # vote histories here
         self.vote_history = []
 
+    def start_day(self, alive_players):
+        self['nolynch'] = []
+        self['notvoting'] = []
+        self.cast.clear()
+        for player in alive_players:
+            self[player.user.id] = []
+            self['notvoting'].append(player)
+            self.cast[player] = 'notvoting'
+
+    def clear(self):
+        super().clear()
+        self.cast.clear()
+
+    def replace(self, old_id, new_id):
+        votes = self.pop(old_id)
+        self[new_id] = votes
+        for voter in votes:
+            self.cast[voter] = new_id
+
+    def _clear_vote(self, voter):
+        key = self.cast.pop(voter, None)
+        if key is not None and voter in self.get(key, []):
+            self[key].remove(voter)
+            return
+        # votes that weren't cast through the manager
+        for votes in self.values():
+            if voter in votes:
+                votes.remove(voter)
+
     def vote(self, voter, target=None) -> bool:
         if not target.is_alive:
             raise VoteError('You can\'t vote a dead player.')
@@ -21,11 +52,11 @@ class VoteManager(dict):
             raise VoteError('Self-voting is not allowed.')
 
         # clear any other possible votes
-        for votes in self.values():
-            if voter in votes:
-                votes.remove(voter)
+        self._clear_vote(voter)
 
         self[target.user.id].append(voter)
+        self.cast[voter] = target.user.id
+        self.game.board.schedule()
         votes_on_target = len(self[target.user.id])
         return votes_on_target >= self.game.majority_votes
 
@@ -34,23 +65,23 @@ class VoteManager(dict):
             raise VoteError('You have already voted to no-lynch.')
 
          # clear any other possible votes
-        for votes in self.values():
-            if voter in votes:
-                votes.remove(voter)
+        self._clear_vote(voter)
 
         self['nolynch'].append(voter)
+        self.cast[voter] = 'nolynch'
+        self.game.board.schedule()
         votes_on_target = len(self['nolynch'])
         return votes_on_target >= self.game.majority_votes
 
     def unvote(self, voter) -> bool:
-        for target, votes in self.items():
-            if target == 'notvoting' or voter not in votes:
-                continue
-            votes.remove(voter)
-            self['notvoting'].append(voter)
-            return True
+        if self.cast.get(voter, 'notvoting') == 'notvoting':
+            return False
 
-        return False
+        self._clear_vote(voter)
+        self['notvoting'].append(voter)
+        self.cast[voter] = 'notvoting'
+        self.game.board.schedule()
+        return True
 
     def show(self):
         num_alive = len(self.game.players.filter(is_alive=True))
@@ -59,7 +90,7 @@ class VoteManager(dict):
         for target, voters in self.items():
             if target in ['notvoting', 'nolynch']:
                 continue
-            player = self.game.players.filter(pl_id=target)[0]
+            player = self.game.players.by_id(target)
             if len(voters) > 0:
                 text.append(f'{player.user.name} ({len(voters)}) - ' +
                             ', '.join(
@@ -1,37 +1,16 @@
 # All roles need to follow a common method pattern, but not all roles need the required parameters
-from collections import defaultdict
-from pathlib import Path
-from importlib import import_module
+import typing
+from types import MappingProxyType
 
-all_roles = {}
-role_categories = defaultdict(list)
+from .manifest import LazyCategories, LazyRoles, RoleInfo, load_manifest, role_infos
 
+_registry: typing.Dict[str, RoleInfo] = {}
 
-def filter_func(path: Path):
-    return path.is_file() and path.name not in ['base.py', '__init__.py']
+# read-only views; roles importing this module while the manifest is rebuilt need them to exist
+role_registry: typing.Mapping[str, RoleInfo] = MappingProxyType(_registry)
+all_roles: typing.Mapping[str, type] = LazyRoles(role_registry)
+role_categories: typing.Mapping[str, typing.Tuple[type, ...]] = LazyCategories(all_roles)
 
-
-# automatically loads all Role classes in this directory to a dict of roles
-for file in Path('godfather/roles').iterdir():
-    if file.stem in ['__pycache__', 'mixins', '__init__', 'base']:
-        continue
-    if file.is_file():
-        role_mod = import_module(f'godfather.roles.{file.stem}')
-        # role_name files have RoleName classes
-        CLS_NAME = ''.join(map(str.title, file.stem.split('_')))
-        role_cls = getattr(role_mod, CLS_NAME)
-        all_roles[role_cls.name] = role_cls
-        role_instance = role_cls()
-        for category in role_instance.categories:
-            role_categories[category].append(role_cls)
-
-    else:
-        for nested_file in filter(filter_func, Path(f'godfather/roles/{file.stem}').iterdir()):
-            role_mod = import_module(
-                f'godfather.roles.{file.stem}.{nested_file.stem}')
-            CLS_NAME = ''.join(map(str.title, nested_file.stem.split('_')))
-            role_cls = getattr(role_mod, CLS_NAME)
-            all_roles[role_cls.name] = role_cls
-            role_instance = role_cls()
-            for category in role_instance.categories:
-                role_categories[category].append(role_cls)
+# roles are described by manifest.json and only imported once they're used,
+# run `python -m godfather.roles` to regenerate it after changing a role
+_registry.update(role_infos(load_manifest()))
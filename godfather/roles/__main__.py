@@ -0,0 +1,36 @@
+"""Regenerates the role manifest, or with --check, fails if it's stale or doesn't cover the setups."""
+import argparse
+import sys
+
+import yaml
+
+from .manifest import build_manifest, check_setups, read_manifest, role_infos, write_manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m godfather.roles', description=__doc__)
+    parser.add_argument('--check', action='store_true',
+                        help="don't write anything, exit with 1 if the manifest needs regenerating")
+    parser.add_argument('--setups', default='setups/setups.yaml',
+                        help='setup list the manifest is validated against')
+    args = parser.parse_args()
+
+    if args.check:
+        manifest = read_manifest()
+        if manifest is None:
+            print('Role manifest is missing or stale.')
+            return 1
+    else:
+        manifest = build_manifest()
+        write_manifest(manifest)
+        print(f"Wrote {len(manifest['roles'])} roles to the manifest.")
+
+    with open(args.setups) as file:
+        problems = check_setups(role_infos(manifest), yaml.safe_load(file))
+    for problem in problems:
+        print(problem)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,17 +1,38 @@
+import typing
+
+from godfather.game import role_table
 from godfather.game.types import Defense
 from godfather.roles import all_roles
+from godfather.utils import DMPriority
 
 
 class Role:
     name = ''
     description = ''
     unique = False
+    # every category a setup can draw this role from
+    categories: typing.Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        role_table.register(cls)
 
     def __init__(self, *args, **kwargs):
         self.cleaned = False
-        self.categories = []
+        self._pm_commands = None
         super().__init__(*args, **kwargs)
 
+    @property
+    def table(self) -> role_table.RoleTable:
+        return role_table.table_for(self) or role_table.build_table(self)
+
+    def pm_commands(self):
+        """Maps every command this role accepts in DMs at night to its handler."""
+        if self._pm_commands is None:
+            self._pm_commands = {command: self.on_pm_command
+                                 for command in self.table.verbs}
+        return self._pm_commands
+
     async def on_death(self, game, player):
         # exe only attacks townies
         if not player.role.faction.name == 'Town':
@@ -19,7 +40,7 @@ class Role:
         for exe in game.players.filter(role='Executioner', is_alive=True):
             if (exe.target == player and not
                     exe.target.death_reason.startswith('lynched')):
-                await exe.user.send('Your target has died. You are now a Jester!')
+                await exe.dm(game, 'Your target has died. You are now a Jester!', priority=DMPriority.ROLE_PM)
                 Jester = all_roles['Jester']
                 exe.previous_roles.append(exe.role)
                 exe.role = Jester()
@@ -12,12 +12,7 @@ class InsaneCop(Cop):
     + An insane cop will always show the opposite results for suspicion, showing innocent roles as suspicious and suspicious roles as innocent
     """
     name = 'Insane Cop'
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.categories.remove('Town Investigative')
-        self.categories.remove('Random Town')
-        self.categories.append('Dethy Cop')
+    categories = ('Dethy Cop',)
 
     def result_modifier(self, innocence):
         return not innocence
@@ -12,12 +12,7 @@ class NaiveCop(Cop):
     + A naive cop will always show innocent results regardless of the roles]
     """
     name = 'Naive Cop'
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.categories.remove('Town Investigative')
-        self.categories.remove('Random Town')
-        self.categories.append('Dethy Cop')
+    categories = ('Dethy Cop',)
 
     def result_modifier(self, _innocence):
         return True
@@ -12,12 +12,7 @@ class ParanoidCop(Cop):
     + A paranoid cop will always show suspicious results regardless of the roles
     """
     name = 'Paranoid Cop'
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.categories.remove('Town Investigative')
-        self.categories.remove('Random Town')
-        self.categories.append('Dethy Cop')
+    categories = ('Dethy Cop',)
 
     def result_modifier(self, _innocence):
         return False
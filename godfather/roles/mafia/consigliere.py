@@ -16,14 +16,11 @@ class Consigliere(MafiaMember, SingleAction):
     """
     name = 'Consigliere'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'check'
-        self.action_gerund = 'checking'
-        self.action_priority = Priority.CONSIG
-        self.action_text = 'check a player'
-        self.categories.append('Mafia Support')
+    categories = ('Random Mafia', 'Mafia Support')
+    action = 'check'
+    action_gerund = 'checking'
+    action_priority = Priority.CONSIG
+    action_text = 'check a player'
 
     async def tear_down(self, actions, player, target):
-        await player.user.send(f'Your target must be a **{target.role.name}**.')
+        await player.dm(actions.game, f'Your target must be a **{target.role.name}**.')
@@ -13,9 +13,4 @@ class Consort(MafiaMember, Escort):
     + You can talk with other mafia members.
     """
     name = 'Consort'
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.categories.remove('Town Support')
-        self.categories.remove('Random Town')
-        self.categories.append('Mafia Support')
+    categories = ('Random Mafia', 'Mafia Support')
@@ -16,14 +16,11 @@ class Framer(MafiaMember, SingleAction):
     """
     name = 'Framer'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'frame'
-        self.action_gerund = 'framing'
-        self.action_priority = Priority.FRAMER
-        self.action_text = 'frame a player'
-        self.categories.append('Mafia Deception')
+    categories = ('Random Mafia', 'Mafia Deception')
+    action = 'frame'
+    action_gerund = 'framing'
+    action_priority = Priority.FRAMER
+    action_text = 'frame a player'
 
     async def run_action(self, actions, player, target):
         actions.framed_players.append(target)
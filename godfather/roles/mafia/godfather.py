@@ -18,13 +18,10 @@ class Godfather(MafiaMember, Shooter, SingleAction):
     name = 'Godfather'
     description = DESCRIPTION
     unique = True
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'shoot'
-        self.action_gerund = 'shooting'
-        self.action_text = 'shoot a player'
-        self.categories.append('Mafia Killing')
+    categories = ('Random Mafia', 'Mafia Killing')
+    action = 'shoot'
+    action_gerund = 'shooting'
+    action_text = 'shoot a player'
 
     def defense(self):
         return Defense.BASIC
@@ -44,5 +41,5 @@ class Godfather(MafiaMember, Shooter, SingleAction):
         success = record['result'] and player in record['by']
 
         if not success:
-            return await player.user.send('Your target was too strong to kill!')
-        await target.user.send('You were shot by the Godfather. You have died!')
+            return await player.dm(actions.game, 'Your target was too strong to kill!')
+        await target.dm(actions.game, 'You were shot by the Godfather. You have died!')
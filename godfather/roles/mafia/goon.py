@@ -16,10 +16,7 @@ class Goon(MafiaMember, Shooter, SingleAction):
     name = 'Goon'
     description = DESCRIPTION
     unique = True
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.categories.append('Mafia Killing')
+    categories = ('Random Mafia', 'Mafia Killing')
 
     async def on_pm_command(self, ctx, game, player, args):
         if any(gf_action := list(filter(lambda action: action['player'].role.name == 'Godfather', game.night_actions))):
@@ -36,8 +33,8 @@ class Goon(MafiaMember, Shooter, SingleAction):
         success = record['result'] and player in record['by']
 
         if not success:
-            return await player.user.send('Your target was too strong to kill!')
-        await target.user.send('You were shot by a Goon. You have died!')
+            return await player.dm(actions.game, 'Your target was too strong to kill!')
+        await target.dm(actions.game, 'You were shot by a Goon. You have died!')
 
     def can_do_action(self, game):
         if game.setup.name == 'dethy' and game.cycle == 1:
@@ -16,14 +16,11 @@ class Janitor(MafiaMember, SingleAction):
     """
     name = 'Janitor'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'clean'
-        self.action_gerund = 'cleaning'
-        self.action_priority = Priority.JANITOR
-        self.action_text = 'clean a player'
-        self.categories.append('Mafia Deception')
+    categories = ('Random Mafia', 'Mafia Deception')
+    action = 'clean'
+    action_gerund = 'cleaning'
+    action_priority = Priority.JANITOR
+    action_text = 'clean a player'
 
     async def run_action(self, actions, player, target):
         record = actions.record[target.user.id]['nightkill']
@@ -33,4 +30,4 @@ class Janitor(MafiaMember, SingleAction):
     async def tear_down(self, actions, player, target):
         record = actions.record[target.user.id]['nightkill']
         if record['result']:
-            await player.user.send('You secretly know that your target\'s role was {}.'.format(target.role.name))
+            await player.dm(actions.game, 'You secretly know that your target\'s role was {}.'.format(target.role.name))
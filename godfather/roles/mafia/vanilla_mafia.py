@@ -15,3 +15,4 @@ class VanillaMafia(MafiaMember, Role):
     """
     name = 'Vanilla Mafia'
     description = DESCRIPTION
+    categories = ('Random Mafia',)
@@ -0,0 +1,179 @@
+import hashlib
+import inspect
+import json
+import logging
+import typing
+from collections.abc import Mapping
+from importlib import import_module
+from pathlib import Path
+
+logger = logging.getLogger('godfather')
+
+ROLES_DIR = Path(__file__).parent
+MANIFEST_PATH = ROLES_DIR / 'manifest.json'
+# modules that aren't roles and don't change what the manifest says
+SKIPPED = ['__pycache__', '__init__', '__main__', 'manifest']
+
+
+class RoleInfo(typing.NamedTuple):
+    """Static metadata of a role, read off its class."""
+    name: str
+    module: str
+    cls_name: str
+    # category name of the role's faction, eg. 'Town' or 'Neutral'
+    faction: str
+    categories: typing.Tuple[str, ...]
+    unique: bool
+    verbs: typing.Tuple[str, ...]
+    doc: typing.Optional[str]
+
+
+def source_files() -> typing.List[Path]:
+    """Every source file a role's metadata can come from, mixins and base included."""
+    return sorted(path for path in ROLES_DIR.rglob('*.py')
+                  if path.stem not in SKIPPED and '__pycache__' not in path.parts)
+
+
+def source_digest() -> str:
+    digest = hashlib.sha256()
+    for path in source_files():
+        digest.update(path.relative_to(ROLES_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def role_modules() -> typing.Iterator[typing.Tuple[str, str]]:
+    """Yields (module, class name) of every role, role_name files have RoleName classes."""
+    for path in source_files():
+        parts = path.relative_to(ROLES_DIR).with_suffix('').parts
+        # roles live either in this directory or one folder below; mixins are not roles
+        if parts[0] in ('base', 'mixins') or len(parts) > 2:
+            continue
+        yield '.'.join((__package__, *parts)), ''.join(map(str.title, parts[-1].split('_')))
+
+
+def build_manifest() -> dict:
+    """Imports every role and describes it. Slow, meant to be run when roles change."""
+    from godfather.game.role_table import class_table
+
+    roles = {}
+    for module, cls_name in role_modules():
+        role_cls = getattr(import_module(module), cls_name)
+        roles[role_cls.name] = {
+            'module': module,
+            'class': cls_name,
+            'faction': role_cls.faction.category_name,
+            'categories': list(role_cls.categories),
+            'unique': role_cls.unique,
+            'verbs': list(class_table(role_cls).verbs),
+            'doc': inspect.getdoc(role_cls) if role_cls.__doc__ is not None else None
+        }
+    return {'digest': source_digest(), 'roles': roles}
+
+
+def write_manifest(manifest: dict):
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def read_manifest() -> typing.Optional[dict]:
+    """Returns the manifest on disk, or None if it is missing or out of date."""
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('digest') != source_digest():
+        return None
+    return manifest
+
+
+def load_manifest() -> dict:
+    manifest = read_manifest()
+    if manifest is None:
+        logger.warning('Role manifest is missing or stale, importing every role instead. '
+                       'Run `python -m godfather.roles` to regenerate it.')
+        manifest = build_manifest()
+    return manifest
+
+
+def role_infos(manifest: dict) -> typing.Dict[str, RoleInfo]:
+    return {
+        name: RoleInfo(name=name, module=entry['module'], cls_name=entry['class'],
+                       faction=entry['faction'], categories=tuple(entry['categories']),
+                       unique=entry['unique'], verbs=tuple(entry['verbs']), doc=entry['doc'])
+        for name, entry in manifest['roles'].items()
+    }
+
+
+def check_setups(infos: typing.Mapping[str, RoleInfo], setups) -> typing.List[str]:
+    """Returns a description of every role in `setups` the manifest doesn't know about."""
+    from godfather.game.setup import Setup
+
+    categories = {category for info in infos.values() for category in info.categories}
+    problems = []
+    for setup in setups:
+        for role_str in setup.get('roles', []):
+            role_name, _ = Setup.parse_role_str(role_str)
+            if role_name not in infos and role_name not in categories:
+                problems.append(f"{setup.get('name', 'unnamed')}: unknown role '{role_name}'")
+    return problems
+
+
+class LazyRoles(Mapping):
+    """Role classes by name, imported the first time they're looked up."""
+
+    def __init__(self, infos: typing.Mapping[str, RoleInfo]):
+        self.infos = infos
+        self.loaded: typing.Dict[str, type] = {}
+
+    def __getitem__(self, name: str) -> type:
+        role_cls = self.loaded.get(name)
+        if role_cls is None:
+            info = self.infos[name]
+            role_cls = self.loaded[name] = getattr(import_module(info.module), info.cls_name)
+        return role_cls
+
+    def __iter__(self):
+        return iter(self.infos)
+
+    def __len__(self):
+        return len(self.infos)
+
+    def __contains__(self, name):
+        return name in self.infos
+
+
+class LazyCategories(Mapping):
+    """Tuples of role classes by category, imported with the first lookup of the category."""
+
+    def __init__(self, roles: LazyRoles):
+        self.roles = roles
+        self._names: typing.Optional[typing.Dict[str, typing.List[str]]] = None
+        self.loaded: typing.Dict[str, typing.Tuple[type, ...]] = {}
+
+    @property
+    def names(self) -> typing.Dict[str, typing.List[str]]:
+        # built on first use, the registry is filled after this mapping is created
+        if self._names is None:
+            self._names = {}
+            for info in self.roles.infos.values():
+                for category in info.categories:
+                    self._names.setdefault(category, []).append(info.name)
+        return self._names
+
+    def __getitem__(self, category: str) -> typing.Tuple[type, ...]:
+        roles = self.loaded.get(category)
+        if roles is None:
+            roles = self.loaded[category] = tuple(self.roles[name] for name in self.names[category])
+        return roles
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, category):
+        return category in self.names
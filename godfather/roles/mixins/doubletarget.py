@@ -1,6 +1,7 @@
 from godfather.roles.base import Role
 from godfather.errors import PhaseChangeError
 from godfather.game import Phase
+from godfather.utils import DMPriority
 
 
 class DoubleTarget(Role):
@@ -14,8 +15,8 @@ class DoubleTarget(Role):
     async def on_night(self, bot, player, game):
         output = f'It is now night {game.cycle}. Use the {bot.global_prefix}{self.action} command to {self.action_text}. ' \
             + f'Use {bot.global_prefix}noaction to stay home.\n'
-        output += f'```diff\n{game.players.show(codeblock=True)}```'
-        await player.user.send(output)
+        for message in game.night_prompt(output):
+            await player.dm(game, message, priority=DMPriority.NIGHT_PROMPT)
 
     async def on_pm_command(self, ctx, game, player, args):
         command = args.pop(0)
@@ -25,16 +26,14 @@ class DoubleTarget(Role):
             return await ctx.send(f'You cannot use your action today. {reason}')
 
         if command == 'noaction':
-            for action in game.night_actions:
-                if action['player'].user.id == player.user.id:
-                    game.night_actions.remove(action)
+            game.night_actions.discard(player)
 
             game.night_actions.add_action({
                 'action': None,
                 'player': player,
                 'priority': 0
             })
-            if len(game.players.filter(action_only=True)) == len(game.night_actions):
+            if game.night_actions.expected == len(game.night_actions):
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
             return await ctx.send('You decided to stay home tonight.')
@@ -61,9 +60,7 @@ class DoubleTarget(Role):
         if target1 == target2:
             return await ctx.send('Pick 2 distinct targets.')
 
-        for action in game.night_actions:
-            if action['player'].user.id == player.user.id:
-                game.night_actions.remove(action)
+        game.night_actions.discard(player)
 
         game.night_actions.add_action({
             'action': self.action,
@@ -76,7 +73,7 @@ class DoubleTarget(Role):
         })
         await ctx.send(f'You are {self.action_gerund} {" and ".join(map(lambda p: p.user.name, targets))} tonight.')
 
-        if len(game.players.filter(action_only=True)) == len(game.night_actions):
+        if game.night_actions.expected == len(game.night_actions):
             try:
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
@@ -1,5 +1,6 @@
 from godfather.factions import Mafia
 from godfather.roles import all_roles
+from godfather.utils import DMPriority
 
 
 def filter_func(player):
@@ -9,13 +10,7 @@ def filter_func(player):
 
 
 class MafiaMember:
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.faction = Mafia()
-        # this only works when MafiaMember is mixin'd with Role
-        if hasattr(self, 'categories'):
-            self.categories.append('Random Mafia')
+    faction = Mafia()
 
     async def on_death(self, game, player):
         # mafioso becomes new gf and stuff here
@@ -27,7 +22,7 @@ class MafiaMember:
                     new_goon = other_maf[0]
                     new_goon.previous_roles.append(new_goon.role)
                     new_goon.role = all_roles['Goon']()
-                    await new_goon.user.send('You have been promoted to a Goon!')
+                    await new_goon.dm(game, 'You have been promoted to a Goon!', priority=DMPriority.ROLE_PM)
                     await new_goon.send_pm(game)
                     return
                 return
@@ -36,7 +31,7 @@ class MafiaMember:
             goon.previous_roles.append(goon.role)
             # goon becomes the new Godfather
             goon.role = all_roles['Godfather']()
-            await goon.user.send('You have been promoted to a Godfather!')
+            await goon.dm(game, 'You have been promoted to a Godfather!', priority=DMPriority.ROLE_PM)
             await goon.send_pm(game)
 
         # other roles become new goon
@@ -47,5 +42,5 @@ class MafiaMember:
             new_goon = other_mafia[0]
             new_goon.previous_roles.append(new_goon.role)
             new_goon.role = all_roles['Goon']()
-            await new_goon.user.send('You have been promoted to a Goon!')
+            await new_goon.dm(game, 'You have been promoted to a Goon!', priority=DMPriority.ROLE_PM)
             await new_goon.send_pm(game)
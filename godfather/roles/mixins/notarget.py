@@ -1,6 +1,7 @@
 from godfather.roles.base import Role
 from godfather.errors import PhaseChangeError
 from godfather.game import Phase
+from godfather.utils import DMPriority
 
 
 class NoTarget(Role):
@@ -12,7 +13,7 @@ class NoTarget(Role):
     async def on_night(self, bot, player, game):
         output = f'It is now night {game.cycle}. Use the {bot.global_prefix}{self.action} command to {self.action_text}. ' \
             + f'Use {bot.global_prefix}noaction to stay home.\n'
-        await player.user.send(output)
+        await player.dm(game, output, priority=DMPriority.NIGHT_PROMPT)
 
     async def set_up(self, actions, player, target):
         pass
@@ -30,9 +31,7 @@ class NoTarget(Role):
             return await ctx.send(f'You cannot use your action today. {reason}')
 
         if command == 'noaction':
-            for action in game.night_actions:
-                if action['player'].user.id == player.user.id:
-                    game.night_actions.remove(action)
+            game.night_actions.discard(player)
 
             game.night_actions.add_action({
                 'action': None,
@@ -52,7 +51,7 @@ class NoTarget(Role):
         })
         await ctx.send('You have decided to {} tonight.'.format(self.action))
 
-        if len(game.players.filter(action_only=True)) == len(game.night_actions):
+        if game.night_actions.expected == len(game.night_actions):
             try:
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
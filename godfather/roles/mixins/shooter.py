@@ -2,12 +2,10 @@ from godfather.game.types import Attack, Defense, Priority
 
 
 class Shooter:
-    def __init__(self, *args, **kwargs):
-        self.action = 'shoot'
-        self.action_gerund = 'shooting'
-        self.action_priority = Priority.SHOOTER
-        self.action_text = 'shoot a player'
-        super().__init__(*args, **kwargs)
+    action = 'shoot'
+    action_gerund = 'shooting'
+    action_priority = Priority.SHOOTER
+    action_text = 'shoot a player'
 
     async def run_action(self, actions, player, target):
         if hasattr(player.role, 'bullets'):
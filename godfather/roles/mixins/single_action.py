@@ -2,6 +2,7 @@ from discord.ext import commands
 from godfather.roles.base import Role
 from godfather.errors import PhaseChangeError
 from godfather.game import Phase
+from godfather.utils import DMPriority
 
 conv = commands.MemberConverter()
 
@@ -17,8 +18,8 @@ class SingleAction(Role):
     async def on_night(self, bot, player, game):
         output = f'It is now night {game.cycle}. Use the {bot.global_prefix}{self.action} command to {self.action_text}. ' \
             + f'Use {bot.global_prefix}noaction to stay home.\n'
-        output += f'```diff\n{game.players.show(codeblock=True)}```'
-        await player.user.send(output)
+        for message in game.night_prompt(output):
+            await player.dm(game, message, priority=DMPriority.NIGHT_PROMPT)
 
     async def on_pm_command(self, ctx, game, player, args):
         command = args.pop(0)
@@ -29,16 +30,14 @@ class SingleAction(Role):
         args = ' '.join(args)
 
         if command == 'noaction':
-            for action in game.night_actions:
-                if action['player'].user.id == player.user.id:
-                    game.night_actions.remove(action)
+            game.night_actions.discard(player)
 
             game.night_actions.add_action({
                 'action': None,
                 'player': player,
                 'priority': 0
             })
-            if len(game.players.filter(action_only=True)) == len(game.night_actions):
+            if game.night_actions.expected == len(game.night_actions):
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
             return await ctx.send('You decided to stay home tonight.')
@@ -58,16 +57,12 @@ class SingleAction(Role):
         if not can_target:
             return await ctx.send(reason)
 
-        for action in game.night_actions:
-            if action['player'].user.id == player.user.id:
-                game.night_actions.remove(action)
+        game.night_actions.discard(player)
 
         # special godfather stuff
         if self.name == 'Godfather' and len(game.players.filter(role='Goon', is_alive=True)) > 0:
             goon = game.players.filter(role='Goon')[0]
-            for action in game.night_actions:
-                if action['player'].role.name == 'Goon':
-                    game.night_actions.remove(action)
+            game.night_actions.discard(goon)
 
             game.night_actions.add_action({
                 'action': self.action,
@@ -90,7 +85,7 @@ class SingleAction(Role):
         })
         await ctx.send(f'You are {self.action_gerund} {target} tonight.')
 
-        if len(game.players.filter(action_only=True)) == len(game.night_actions):
+        if game.night_actions.expected == len(game.night_actions):
             try:
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
@@ -2,7 +2,4 @@ from godfather.factions import Town
 
 
 class Townie:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.faction = Town()
-        self.categories.append('Random Town')
+    faction = Town()
@@ -3,6 +3,7 @@ from godfather.roles.mixins import SingleAction
 from godfather.factions import AmnesiacNeutral
 from godfather.game.types import Priority
 from godfather.roles import all_roles
+from godfather.utils import DMPriority
 
 DESCRIPTION = 'You may remember who you were by selecting a dead player.'
 
@@ -18,15 +19,12 @@ class Amnesiac(SingleAction):
     """
     name = 'Amnesiac'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.faction = AmnesiacNeutral()
-        self.action = 'remember'
-        self.action_gerund = 'remembering'
-        self.action_priority = Priority.SURVIVOR
-        self.action_text = 'remember your role'
-        self.categories.append('Neutral Benign')
+    categories = ('Neutral Benign',)
+    faction = AmnesiacNeutral()
+    action = 'remember'
+    action_gerund = 'remembering'
+    action_priority = Priority.SURVIVOR
+    action_text = 'remember your role'
 
     async def set_up(self, actions, player, target):
         # if 2 amnesiacs remember a unique role at the same time, the first person to send actions actually remembers
@@ -43,14 +41,11 @@ class Amnesiac(SingleAction):
         new_role = all_roles.get(target.role.name)()
         player.previous_roles.append(player.role)
         player.role = new_role
-        await player.user.send('You have remembered that you were a {}!'.format(new_role))
+        await player.dm(actions.game, 'You have remembered that you were a {}!'.format(new_role))
         if player.role.faction.informed:
-            teammates = actions.game.players.filter(
-                faction=player.role.faction.id)
-            if len(teammates) > 1:
-                await player.user.send(
-                    f'Your team consists of: {", ".join(map(lambda pl: pl.user.name, teammates))}'
-                )
+            team_message = actions.game.players.team_message(player.role.faction.id)
+            if team_message is not None:
+                await player.dm(actions.game, team_message, priority=DMPriority.ROLE_PM)
         await actions.game.channel.send('An Amnesiac has remembered that they were a **{}**'.format(new_role))
 
     def can_target(self, player, target):
@@ -3,6 +3,7 @@ from godfather.errors import PhaseChangeError
 from godfather.game.types import Attack, Defense, Priority
 from godfather.factions import ArsonistNeutral
 from godfather.game import Phase
+from godfather.utils import DMPriority
 
 DESCRIPTION = 'You may douse someone every night, and then ignite all your doused targets.'
 
@@ -18,14 +19,14 @@ class Arsonist(Role):
     """
     name = 'Arsonist'
     description = DESCRIPTION
+    categories = ('Neutral Killing',)
+    faction = ArsonistNeutral()
+    action = ['douse', 'ignite']
 
     def __init__(self):
         super().__init__()
-        self.faction = ArsonistNeutral()
-        self.action = ['douse', 'ignite']
         self.doused = set()
         self.ignited = False
-        self.categories.append('Neutral Killing')
 
     def can_do_action(self, command):
         if command == 'ignite' and len(self.doused) == 0:
@@ -43,8 +44,8 @@ class Arsonist(Role):
     async def on_night(self, bot, player, game):
         output = f'It is now night {game.cycle}. Use the {bot.global_prefix}douse command to douse a player. ' \
             + f'Use {bot.global_prefix}ignite to ignite all doused targets.\n'
-        output += f'```diff\n{game.players.show(codeblock=True)}```'
-        await player.user.send(output)
+        for message in game.night_prompt(output):
+            await player.dm(game, message, priority=DMPriority.NIGHT_PROMPT)
 
     async def on_pm_command(self, ctx, game, player, args):
         if self.ignited:
@@ -59,20 +60,14 @@ class Arsonist(Role):
         args = ' '.join(args)
 
         if command == 'noaction':
-            for action in game.night_actions:
-                if action['player'].user.id == player.user.id:
-                    game.night_actions.remove(action)
-
-            for action in game.night_actions:
-                if action['player'].user.id == player.user.id:
-                    game.night_actions.remove(action)
+            game.night_actions.discard(player)
 
             game.night_actions.add_action({
                 'action': None,
                 'player': player,
                 'priority': 0
             })
-            if len(game.players.filter(action_only=True)) == len(game.night_actions):
+            if game.night_actions.expected == len(game.night_actions):
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
             return await ctx.send('You decided to stay home tonight.')
@@ -91,7 +86,7 @@ class Arsonist(Role):
                 })
             self.ignited = True
             await ctx.send('You are igniting your doused targets today.')
-            total_actions = len(game.players.filter(action_only=True))
+            total_actions = game.night_actions.expected
             expected_total = total_actions + len(self.doused) - 1
             if expected_total == len(game.night_actions):
                 try:
@@ -116,9 +111,7 @@ class Arsonist(Role):
         if not can_target:
             return await ctx.send(reason)
 
-        for action in game.night_actions:
-            if action['player'].user.id == player.user.id:
-                game.night_actions.remove(action)
+        game.night_actions.discard(player)
 
         game.night_actions.add_action({
             'action': 'douse',
@@ -130,7 +123,7 @@ class Arsonist(Role):
         })
         await ctx.send(f'You are dousing {target} tonight.')
 
-        if len(game.players.filter(action_only=True)) == len(game.night_actions):
+        if game.night_actions.expected == len(game.night_actions):
             try:
                 if not game.phase == Phase.STANDBY:
                     await game.increment_phase()
@@ -160,4 +153,4 @@ class Arsonist(Role):
         success = record['result'] and player in record['by']
 
         if success:
-            await target.user.send('You were ignited by an arsonist. You have died!')
+            await target.dm(actions.game, 'You were ignited by an arsonist. You have died!')
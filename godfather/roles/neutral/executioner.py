@@ -15,12 +15,12 @@ class Executioner(Role):
     """
     name = 'Executioner'
     description = DESCRIPTION
+    categories = ('Neutral Evil',)
+    faction = ExecutionerNeutral()
 
     def __init__(self):
         super().__init__()
         self.target = None
-        self.faction = ExecutionerNeutral()
-        self.categories.append('Neutral Evil')
 
     def defense(self):
         return Defense.BASIC
@@ -15,20 +15,20 @@ class Jester(SingleAction):
     """
     name = 'Jester'
     description = DESCRIPTION
+    categories = ('Neutral Evil',)
+    faction = JesterNeutral()
+    action = 'haunt'
+    action_gerund = 'haunting'
+    action_priority = Priority.JESTER_HAUNT
+    action_text = 'haunt a player'
 
     def __init__(self):
         super().__init__()
-        self.faction = JesterNeutral()
         self.can_haunt = False
         self.voted = None
         self.can_block = False
         self.can_transport = False
         self.can_visit = False
-        self.action = 'haunt'
-        self.action_gerund = 'haunting'
-        self.action_priority = Priority.JESTER_HAUNT
-        self.action_text = 'haunt a player'
-        self.categories.append('Neutral Evil')
 
     async def on_night(self, bot, player, game):
         if not self.can_haunt:
@@ -48,7 +48,7 @@ class Jester(SingleAction):
         await game.channel.send('The jester will get revenge from his grave!')
 
     async def tear_down(self, actions, player, target):
-        await target.user.send('You were haunted by a Jester! You have died!')
+        await target.dm(actions.game, 'You were haunted by a Jester! You have died!')
 
     def can_do_action(self, _game):
         if self.can_haunt:
@@ -16,15 +16,12 @@ class SerialKiller(SingleAction):
     """
     name = 'Serial Killer'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.faction = SerialKillerNeutral()
-        self.action = 'stab'
-        self.action_gerund = 'stabbing'
-        self.action_priority = Priority.SERIAL_KILLER
-        self.action_text = 'stab a player'
-        self.categories.append('Neutral Killing')
+    categories = ('Neutral Killing',)
+    faction = SerialKillerNeutral()
+    action = 'stab'
+    action_gerund = 'stabbing'
+    action_priority = Priority.SERIAL_KILLER
+    action_text = 'stab a player'
 
     def defense(self):
         return Defense.BASIC
@@ -42,5 +39,5 @@ class SerialKiller(SingleAction):
         success = record['result'] and player in record['by']
 
         if not success:
-            return await player.user.send('Your target was too strong to kill!')
-        await target.user.send('You were stabbed by a Serial Killer. You have died!')
+            return await player.dm(actions.game, 'Your target was too strong to kill!')
+        await target.dm(actions.game, 'You were stabbed by a Serial Killer. You have died!')
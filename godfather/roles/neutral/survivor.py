@@ -16,17 +16,17 @@ class Survivor(NoTarget):
     """
     name = 'Survivor'
     description = DESCRIPTION
+    categories = ('Neutral Benign',)
+    faction = SurvivorNeutral()
+    action = 'vest'
+    action_gerund = 'vesting'
+    action_priority = Priority.SURVIVOR
+    action_text = 'protect yourself at night.'
 
     def __init__(self):
         super().__init__()
-        self.faction = SurvivorNeutral()
-        self.action = 'vest'
-        self.action_gerund = 'vesting'
-        self.action_priority = Priority.SURVIVOR
-        self.action_text = 'protect yourself at night.'
         self.vests = 4
         self.vested = False
-        self.categories.append('Neutral Benign')
 
     def can_do_action(self, _game):
         if self.vests > 0:
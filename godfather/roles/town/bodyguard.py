@@ -15,15 +15,15 @@ class Bodyguard(Townie, SingleAction):
     """
     name = 'Bodyguard'
     description = DESCRIPTION
+    categories = ('Random Town', 'Town Protective')
+    action = 'guard'
+    action_gerund = 'guarding'
+    action_priority = Priority.BODYGUARD
+    action_text = 'guard a player'
 
     def __init__(self):
         super().__init__()
-        self.action = 'guard'
-        self.action_gerund = 'guarding'
-        self.action_priority = Priority.BODYGUARD
-        self.action_text = 'guard a player'
         self.can_self_target = False
-        self.categories.append('Town Protective')
 
     async def run_action(self, actions, player, target):
         pl_record = actions.record[target.user.id]
@@ -31,7 +31,7 @@ class Bodyguard(Townie, SingleAction):
         if pl_record['nightkill']['result'] and pl_record['nightkill']['type'] < Attack.UNSTOPPABLE:
             # kill the attacker
             attacker = pl_record['nightkill']['by'].pop()
-            await attacker.user.send('You were killed by a bodyguard. You have died!')
+            await attacker.dm(actions.game, 'You were killed by a bodyguard. You have died!')
             actions.record[attacker.user.id]['nightkill']['result'] = True
             actions.record[attacker.user.id]['nightkill']['type'] = Attack.POWERFUL
             actions.record[attacker.user.id]['nightkill']['by'].append(player)
@@ -49,4 +49,4 @@ class Bodyguard(Townie, SingleAction):
         success = record['result'] and player.user.id in record['by']
 
         if success:
-            await target.user.send('You were attacked but somebody fought off your attacker!')
+            await target.dm(actions.game, 'You were attacked but somebody fought off your attacker!')
@@ -15,14 +15,11 @@ class Cop(Townie, SingleAction):
     """
     name = 'Cop'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'check'
-        self.action_gerund = 'checking'
-        self.action_priority = Priority.COP
-        self.action_text = 'check a player'
-        self.categories.append('Town Investigative')
+    categories = ('Random Town', 'Town Investigative')
+    action = 'check'
+    action_gerund = 'checking'
+    action_priority = Priority.COP
+    action_text = 'check a player'
 
     # this ensures all cop modifiers show up as regular Cops
     def display_role(self):
@@ -32,7 +29,7 @@ class Cop(Townie, SingleAction):
         innocence = self.result_modifier(target.innocent)
         if target in actions.framed_players:
             innocence = False
-        await player.user.send(f"Your target is {'innocent' if innocence else 'suspicious'}.")
+        await player.dm(actions.game, f"Your target is {'innocent' if innocence else 'suspicious'}.")
 
     def result_modifier(self, innocence):
         return innocence
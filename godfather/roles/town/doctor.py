@@ -16,15 +16,15 @@ class Doctor(Townie, SingleAction):
     """
     name = 'Doctor'
     description = DESCRIPTION
+    categories = ('Random Town', 'Town Protective')
+    action = 'heal'
+    action_gerund = 'healing'
+    action_priority = Priority.DOCTOR
+    action_text = 'heal a player'
 
     def __init__(self):
         super().__init__()
-        self.action = 'heal'
-        self.action_gerund = 'healing'
-        self.action_priority = Priority.DOCTOR
-        self.action_text = 'heal a player'
         self.can_self_target = True  # one self-heal allowed
-        self.categories.append('Town Protective')
 
     def can_target(self, player, target):
         if player == target and not self.can_self_target:
@@ -46,4 +46,4 @@ class Doctor(Townie, SingleAction):
         success = record['result'] and player.user.id in record['by']
 
         if success:
-            await target.user.send('You were attacked but nursed back to health!')
+            await target.dm(actions.game, 'You were attacked but nursed back to health!')
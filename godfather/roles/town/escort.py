@@ -15,14 +15,11 @@ class Escort(Townie, SingleAction):
     """
     name = 'Escort'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'block'
-        self.action_gerund = 'blocking'
-        self.action_priority = Priority.ESCORT
-        self.action_text = 'roleblock a player'
-        self.categories.append('Town Support')
+    categories = ('Random Town', 'Town Support')
+    action = 'block'
+    action_gerund = 'blocking'
+    action_priority = Priority.ESCORT
+    action_text = 'roleblock a player'
 
     async def set_up(self, actions, player, target):
         for action in filter(lambda act: act['player'] == target, actions):
@@ -45,4 +42,4 @@ class Escort(Townie, SingleAction):
         success = record['result'] and player.user.id in record['by']
 
         if success:
-            await target.user.send('Somebody occupied your night. You were roleblocked!')
+            await target.dm(actions.game, 'Somebody occupied your night. You were roleblocked!')
@@ -15,22 +15,17 @@ class Lookout(Townie, SingleAction):
     """
     name = 'Lookout'
     description = DESCRIPTION
+    categories = ('Random Town', 'Town Investigative')
+    action = 'watch'
+    action_gerund = 'watching'
+    action_priority = Priority.LOOKOUT
+    action_text = 'watch a player'
 
-    def __init__(self):
-        super().__init__()
-        self.action = 'watch'
-        self.action_gerund = 'watching'
-        self.action_priority = Priority.LOOKOUT
-        self.action_text = 'watch a player'
-        self.categories.append('Town Investigative')
-
-    async def tear_down(self, _actions, player, target):
-        if len(target.visitors) > 1:
-            # get all visitors except self
-            visitors = [*filter(lambda v: v.user.id !=
-                                player.user.id, target.visitors)]
-            # turn all visitors objects into their names
-            visitors = map(lambda v: v.user.name, visitors)
-            await player.user.send('Your target was visited by {}'.format(', '.join(visitors)))
+    async def tear_down(self, actions, player, target):
+        # get all visitors except self
+        visitors = [visitor.user.name for visitor in actions.visits.visitors(target)
+                    if visitor is not player]
+        if len(visitors) > 0:
+            await player.dm(actions.game, 'Your target was visited by {}'.format(', '.join(visitors)))
         else:
-            await player.user.send('Your target was visited by no one')
+            await player.dm(actions.game, 'Your target was visited by no one')
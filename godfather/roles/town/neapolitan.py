@@ -15,14 +15,11 @@ class Neapolitan(Townie, SingleAction):
     """
     name = 'Neapolitan'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'check'
-        self.action_gerund = 'checking'
-        self.action_priority = Priority.COP
-        self.action_text = 'check a player'
-        self.categories.remove('Random Town')
+    categories = ()
+    action = 'check'
+    action_gerund = 'checking'
+    action_priority = Priority.COP
+    action_text = 'check a player'
 
     async def tear_down(self, actions, player, target):
-        await player.user.send(f"Your target is{' ' if target.display_role == 'Town Vanilla' else ' not '}a Town Vanilla.")
+        await player.dm(actions.game, f"Your target is{' ' if target.display_role == 'Town Vanilla' else ' not '}a Town Vanilla.")
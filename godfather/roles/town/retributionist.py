@@ -16,15 +16,15 @@ class Retributionist(Townie, SingleAction):
     name = 'Retributionist'
     description = DESCRIPTION
     unique = True
+    categories = ('Random Town', 'Town Support')
+    action = 'revive'
+    action_gerund = 'reviving'
+    action_priority = Priority.RETRIBUTIONIST
+    action_text = 'revive a dead townie'
 
     def __init__(self):
         super().__init__()
-        self.action = 'revive'
-        self.action_gerund = 'reviving'
-        self.action_priority = Priority.RETRIBUTIONIST
-        self.action_text = 'revive a dead townie'
         self.has_revived = False
-        self.categories.append('Town Support')
 
     async def tear_down(self, actions, _player, target):
         target.is_alive = True
@@ -33,7 +33,7 @@ class Retributionist(Townie, SingleAction):
         target.revived_on = actions.game.cycle
         self.has_revived = True
         await actions.game.channel.send('**{}** was resurrected back to life!'.format(target.user))
-        await target.user.send('You were revived by a Retributionist!')
+        await target.dm(actions.game, 'You were revived by a Retributionist!')
 
     def can_do_action(self, game):
         if self.has_revived:
@@ -15,6 +15,7 @@ class SuperSaint(Townie, Role):
     """
     name = 'Super Saint'
     description = DESCRIPTION
+    categories = ('Random Town',)
 
     async def on_lynch(self, game, player):
         last_voted = game.votes[player.user.id][-1]
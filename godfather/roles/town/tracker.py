@@ -16,17 +16,13 @@ class Tracker(Townie, SingleAction):
     """
     name = 'Tracker'
     description = DESCRIPTION
-
-    def __init__(self):
-        super().__init__()
-        self.action = 'track'
-        self.action_gerund = 'tracking'
-        self.action_priority = Priority.TRACKER
-        self.action_text = 'track a player'
-        self.categories.append('Town Investigative')
+    categories = ('Random Town', 'Town Investigative')
+    action = 'track'
+    action_gerund = 'tracking'
+    action_priority = Priority.TRACKER
+    action_text = 'track a player'
 
     async def tear_down(self, actions, player, target):
-        visited_players = [
-            visited.user.name for visited in actions.game.players if target in visited.visitors]
+        visited_players = [visited.user.name for visited in actions.visits.visited(target)]
         if len(visited_players) > 0:
-            await player.user.send('Your target visited {}.'.format(', '.join(visited_players)))
+            await player.dm(actions.game, 'Your target visited {}.'.format(', '.join(visited_players)))
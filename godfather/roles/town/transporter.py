@@ -19,17 +19,17 @@ class Transporter(Townie, DoubleTarget):
     """
     name = 'Transporter'
     description = DESCRIPTION
+    categories = ('Random Town', 'Town Support')
+    action = 'transport'
+    action_gerund = 'transporting'
+    action_priority = Priority.TRANSPORTER
+    action_text = 'transport 2 players'
 
     def __init__(self):
         super().__init__()
         self.can_block = False
         self.can_transport = False
         self.can_self_target = True
-        self.action = 'transport'
-        self.action_gerund = 'transporting'
-        self.action_priority = Priority.TRANSPORTER
-        self.action_text = 'transport 2 players'
-        self.categories.append('Town Support')
 
     async def set_up(self, actions, _player, target):
         target1, target2 = target
@@ -41,6 +41,6 @@ class Transporter(Townie, DoubleTarget):
             elif 'target' in action and action['target'] == target2:
                 action['target'] = target1
 
-    async def tear_down(self, _actions, _player, target):
+    async def tear_down(self, actions, _player, target):
         for individual in target:
-            await individual.user.send('You were transported to another location.')
+            await individual.dm(actions.game, 'You were transported to another location.')
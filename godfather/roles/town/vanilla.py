@@ -12,3 +12,4 @@ class Vanilla(Townie, Role):
     """
     name = 'Vanilla'
     description = DESCRIPTION
+    categories = ('Random Town',)
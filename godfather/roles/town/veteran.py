@@ -18,19 +18,19 @@ class Veteran(Townie, NoTarget):
     name = 'Veteran'
     description = DESCRIPTION
     unique = True
+    categories = ('Random Town', 'Town Killing')
+    action = 'alert'
+    action_gerund = 'alerting'
+    action_priority = Priority.VETERAN
+    action_text = 'go on alert'
 
     def __init__(self):
         super().__init__()
-        self.action = 'alert'
-        self.action_gerund = 'alerting'
-        self.action_text = 'go on alert'
         # whether the vet has alerted this night
         self.alerted = False
         self.alerts = 3
         self.can_block = False
         self.can_transport = False
-        self.action_priority = Priority.VETERAN
-        self.categories.append('Town Killing')
 
     def defense(self):
         return Defense.BASIC if self.alerted else Defense.NONE
@@ -55,5 +55,5 @@ class Veteran(Townie, NoTarget):
             actions.record[visitor.user.id]['nightkill']['result'] = True
             actions.record[visitor.user.id]['nightkill']['type'] = Attack.POWERFUL
             actions.record[visitor.user.id]['nightkill']['by'].append(player)
-            await player.user.send('You shot someone visiting you!')
-            await visitor.user.send('You were killed by the veteran you visited!')
+            await player.dm(actions.game, 'You shot someone visiting you!')
+            await visitor.dm(actions.game, 'You were killed by the veteran you visited!')
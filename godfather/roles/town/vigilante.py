@@ -1,5 +1,6 @@
 from godfather.roles.mixins import SingleAction, Shooter, Townie
 from godfather.game.types import Priority
+from godfather.utils import DMPriority
 
 DESCRIPTION = 'You may shoot someone every night. If you shoot a townie, you will die of guilt the next night.'
 
@@ -16,16 +17,16 @@ class Vigilante(Townie, Shooter, SingleAction):
     """
     name = 'Vigilante'
     description = DESCRIPTION
+    categories = ('Random Town', 'Town Killing')
 
     def __init__(self):
         super().__init__()
         self.guilty = False
         self.bullets = 3  # vigs only get 3 shots
-        self.categories.append('Town Killing')
 
     async def on_night(self, bot, player, game):
         if self.guilty:
-            await player.user.send('You threw away your gun in guilt.')
+            await player.dm(game, 'You threw away your gun in guilt.', priority=DMPriority.NIGHT_PROMPT)
             game.night_actions.add_action({
                 'action': self.action,
                 'player': player,
@@ -54,5 +55,5 @@ class Vigilante(Townie, Shooter, SingleAction):
         if success and target.role.faction.id == 'town':
             self.guilty = True
         if not success:
-            return await player.user.send('Your target was too strong to kill!')
-        await target.user.send('You were shot by a Vigilante. You have died!')
+            return await player.dm(actions.game, 'Your target was too strong to kill!')
+        await target.dm(actions.game, 'You were shot by a Vigilante. You have died!')
@@ -1,5 +1,10 @@
 from .rng import *
 from .utils import *
 from .logger import getlogger, ColoredFormatter
+from .dm_dispatcher import DMDispatcher, DMPriority
+from .waiters import WaiterRegistry
+from .paginator import chunk_lines, embed_pages, paginate, send_chunked
+from .search import SearchIndex
+from .embed_cache import EmbedCache
 from .ctx import CustomContext
 from .meta import *
@@ -1,9 +1,13 @@
+import typing
+
 from discord.ext.commands import Context
-from godfather.game import Game
+
+if typing.TYPE_CHECKING:
+    from godfather.game import Game
 
 
 class CustomContext(Context):
 
     @property
-    def game(self) -> Game:
+    def game(self) -> 'Game':
         return self.bot.games.get(self.channel.id, None)
@@ -0,0 +1,187 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import defaultdict, deque, namedtuple
+from enum import IntEnum
+
+import discord
+
+logger = logging.getLogger('godfather')
+
+QueuedDM = namedtuple('QueuedDM', 'priority user content kwargs future game_id')
+
+
+class DMPriority(IntEnum):
+    # lower values are delivered first
+    ACTION_RESULT = 0
+    NIGHT_PROMPT = 1
+    ROLE_PM = 2
+    FLAVOR = 3
+
+
+class TokenBucket:
+    """Refills `rate` tokens every second, holding at most `capacity` of them."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def release(self):
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+def _consume_exception(future):
+    # DMs that nobody awaits shouldn't spam "exception was never retrieved"
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if isinstance(exc, discord.Forbidden):
+        logger.debug('Could not DM a user: %s', exc)
+    elif exc is not None:
+        logger.warning('Failed to deliver a DM: %s', exc)
+
+
+class DMDispatcher:
+    """Bot-wide queue that every direct message goes through.
+
+    Messages are delivered in priority order across recipients (see `DMPriority`),
+    but always in the order they were queued for any single recipient. A token bucket
+    shared by every game keeps the bot under a global send budget.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 10):
+        self.bucket = TokenBucket(rate, burst)
+        # recipient id -> messages waiting to be sent to them, in order
+        self._pending = {}
+        # heap of (priority, sequence, recipient id) for recipients with pending messages
+        self._ready = []
+        # recipients with a message currently being sent
+        self._in_flight = set()
+        self._sequence = itertools.count()
+        # game id -> number of undelivered messages for that game
+        self._backlog = defaultdict(int)
+        self._wakeup = None
+        self._worker = None
+
+    def enqueue(self, user, content=None, *, priority=DMPriority.FLAVOR, game=None, **kwargs):
+        """Queue a DM and return a future that resolves to the sent message."""
+        loop = asyncio.get_event_loop()
+        self._ensure_worker(loop)
+
+        future = loop.create_future()
+        future.add_done_callback(_consume_exception)
+        game_id = game.channel.id if game is not None else None
+        item = QueuedDM(priority, user, content, kwargs, future, game_id)
+
+        self._pending.setdefault(user.id, deque()).append(item)
+        self._backlog[game_id] += 1
+        if user.id not in self._in_flight:
+            self._schedule(user.id)
+        return future
+
+    async def send(self, user, content=None, *, priority=DMPriority.FLAVOR, game=None, **kwargs):
+        """Queue a DM and wait until it has been delivered."""
+        return await self.enqueue(user, content, priority=priority, game=game, **kwargs)
+
+    def backlog(self, game=None) -> int:
+        """Number of DMs still waiting to be delivered for the given game."""
+        if game is None:
+            return sum(self._backlog.values())
+        return self._backlog.get(game.channel.id, 0)
+
+    async def drain(self, timeout: float = 10.0):
+        """Waits up to `timeout` seconds for queued DMs to be delivered, then stops the worker.
+        DMs that are still queued by then are cancelled."""
+        deadline = time.monotonic() + timeout
+        while self.backlog() > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        if self.backlog() > 0:
+            logger.warning('Dropping %s undelivered DMs', self.backlog())
+        for queue in self._pending.values():
+            for item in queue:
+                item.future.cancel()
+        self._pending.clear()
+        self._ready.clear()
+        self._backlog.clear()
+        self.close()
+
+    def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def _ensure_worker(self, loop):
+        if self._worker is not None and not self._worker.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._worker = loop.create_task(self._run())
+
+    def _schedule(self, recipient_id):
+        queue = self._pending[recipient_id]
+        priority = min(item.priority for item in queue)
+        heapq.heappush(self._ready,
+                       (priority, next(self._sequence), recipient_id))
+        self._wakeup.set()
+
+    def _next_recipient(self):
+        while self._ready:
+            _, _, recipient_id = heapq.heappop(self._ready)
+            # entries go stale once a recipient is drained or already being served
+            if recipient_id in self._in_flight or not self._pending.get(recipient_id):
+                continue
+            return recipient_id
+        return None
+
+    async def _run(self):
+        while True:
+            if not self._ready:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            await self.bucket.acquire()
+            recipient_id = self._next_recipient()
+            if recipient_id is None:
+                self.bucket.release()
+                continue
+
+            self._in_flight.add(recipient_id)
+            item = self._pending[recipient_id].popleft()
+            asyncio.ensure_future(self._deliver(recipient_id, item))
+
+    async def _deliver(self, recipient_id, item):
+        try:
+            message = await item.user.send(item.content, **item.kwargs)
+        except Exception as exc:  # pylint: disable=broad-except
+            if not item.future.done():
+                item.future.set_exception(exc)
+        else:
+            if not item.future.done():
+                item.future.set_result(message)
+        finally:
+            self._backlog[item.game_id] -= 1
+            if self._backlog[item.game_id] <= 0:
+                del self._backlog[item.game_id]
+            self._in_flight.discard(recipient_id)
+            if self._pending.get(recipient_id):
+                self._schedule(recipient_id)
+            else:
+                self._pending.pop(recipient_id, None)
@@ -0,0 +1,19 @@
+import typing
+
+import discord
+
+
+class EmbedCache:
+    """Embeds that only change when roles or cogs are reloaded, built the first time they're sent."""
+
+    def __init__(self):
+        self.embeds: typing.Dict[typing.Hashable, discord.Embed] = {}
+
+    def get(self, key: typing.Hashable, build: typing.Callable[[], discord.Embed]) -> discord.Embed:
+        embed = self.embeds.get(key)
+        if embed is None:
+            embed = self.embeds[key] = build()
+        return embed
+
+    def clear(self):
+        self.embeds.clear()
@@ -0,0 +1,83 @@
+import asyncio
+import typing
+
+import discord
+
+MESSAGE_LIMIT = 2000
+EMBED_DESCRIPTION_LIMIT = 2048
+EMBED_FIELD_LIMIT = 1024
+PAGE_EMOJIS = ['◀️', '▶️']
+
+
+def chunk_lines(lines: typing.Iterable[str], limit: int = MESSAGE_LIMIT,
+                prefix: str = '', suffix: str = '', header: str = '') -> typing.List[str]:
+    """Splits lines into as few chunks as possible, each at most `limit` characters long
+    once wrapped in `prefix` and `suffix`. Lines are never split across chunks, lines
+    that don't fit in a chunk on their own are truncated.
+    `header` is put in front of the first chunk, outside of `prefix`.
+    """
+    chunks = []
+    current = []
+    size = 0
+
+    def flush():
+        chunks.append((header if not chunks else '') + prefix + '\n'.join(current) + suffix)
+
+    for line in lines:
+        room = limit - len(prefix) - len(suffix) - (len(header) if not chunks else 0)
+        # every line but the first one of a chunk takes a newline too
+        if current and size + 1 + len(line) > room:
+            flush()
+            current, size = [], 0
+            room = limit - len(prefix) - len(suffix)
+        line = line[:room] if not current else line
+        size += len(line) + (1 if current else 0)
+        current.append(line)
+
+    if current or (header and not chunks):
+        flush()
+    return chunks
+
+
+async def send_chunked(destination: discord.abc.Messageable, lines: typing.Iterable[str],
+                       **kwargs) -> typing.List[discord.Message]:
+    """Sends lines with as few messages as possible. Takes the same arguments as `chunk_lines`."""
+    return [await destination.send(chunk) for chunk in chunk_lines(lines, **kwargs)]
+
+
+def embed_pages(lines: typing.Iterable[str], title: str = None, color: int = 0x000000,
+                prefix: str = '', suffix: str = '') -> typing.List[discord.Embed]:
+    """Splits lines into embeds, numbering them if there is more than one."""
+    chunks = chunk_lines(lines, limit=EMBED_DESCRIPTION_LIMIT,
+                         prefix=prefix, suffix=suffix)
+    pages = []
+    for num, chunk in enumerate(chunks, 1):
+        embed = discord.Embed(title=title, description=chunk, color=color)
+        if len(chunks) > 1:
+            embed.set_footer(text=f'Page {num}/{len(chunks)}')
+        pages.append(embed)
+    return pages
+
+
+async def paginate(bot, destination: discord.abc.Messageable, author: discord.abc.User,
+                   pages: typing.List[discord.Embed], timeout: float = 60.0):
+    """Sends a list of embeds as one message that `author` can flip through with reactions.
+    A single page is sent as-is, without any reactions."""
+    message = await destination.send(embed=pages[0])
+    if len(pages) == 1:
+        return message
+
+    for emoji in PAGE_EMOJIS:
+        await message.add_reaction(emoji)
+
+    index = 0
+    while True:
+        try:
+            # removing a reaction also flips the page, so nobody needs to un-react
+            reaction, _user = await bot.waiters.wait_for_reaction(
+                message.id, author.id, PAGE_EMOJIS, timeout=timeout, removals=True)
+        except asyncio.TimeoutError:
+            return message
+        step = -1 if str(reaction.emoji) == PAGE_EMOJIS[0] else 1
+        index = (index + step) % len(pages)
+        await message.edit(embed=pages[index])
@@ -1,14 +1,122 @@
-import random
+import asyncio
 import logging
-import requests
+import secrets
+import time
+
+import aiohttp
 
 logger = logging.getLogger('godfather')
 
+__all__ = ['EntropyPool', 'entropy_pool', 'random_below', 'get_random_sequence']
+
+RANDOM_ORG_URL = 'https://www.random.org/integers/'
+
+
+class EntropyPool:
+    """Random bytes from random.org, fetched in the background.
+
+    Nothing ever waits on the network: taking bytes only reads what was
+    prefetched, and callers fall back to `secrets` when the pool is empty.
+    After `max_failures` failed fetches in a row the pool stops asking
+    random.org for `cooldown` seconds. A pool that was never started stays
+    empty, which is how the bot runs offline.
+    """
+
+    def __init__(self, size: int = 4096, fetch_size: int = 2048, timeout: float = 5.0,
+                 interval: float = 30.0, max_failures: int = 3, cooldown: float = 300.0):
+        self.size = size
+        # random.org hands out at most 10,000 integers per request
+        self.fetch_size = min(fetch_size, 10000)
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.interval = interval
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.failures = 0
+        # monotonic time until which random.org isn't asked for anything
+        self.open_until = 0.0
+        self._buffer = bytearray()
+        self._worker = None
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def take(self, count: int) -> bytes:
+        """Up to `count` prefetched bytes, fewer if the pool is running low."""
+        taken = bytes(self._buffer[:count])
+        del self._buffer[:count]
+        return taken
+
+    def start(self, loop=None):
+        if self._worker is not None and not self._worker.done():
+            return
+        loop = loop or asyncio.get_event_loop()
+        self._worker = loop.create_task(self._run())
+
+    def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
 
-def get_random_sequence(low: int, high: int):
-    """Generate (pseudo-)random number sequence of all numbers in 
-    a closed interval. Uses random.org, falls back to standard
-    random.sample() if an error occurs.
+    @property
+    def available(self) -> bool:
+        """Whether random.org may be asked for more bytes right now."""
+        return time.monotonic() >= self.open_until
+
+    async def refill(self, session: aiohttp.ClientSession):
+        """Fetches one batch of bytes. Failures only count towards the circuit breaker."""
+        count = min(self.fetch_size, self.size - len(self._buffer))
+        if count <= 0 or not self.available:
+            return
+        params = {'num': count, 'min': 0, 'max': 255, 'col': 1,
+                  'base': 16, 'format': 'plain', 'rnd': 'new'}
+        try:
+            async with session.get(RANDOM_ORG_URL, params=params, timeout=self.timeout) as resp:
+                resp.raise_for_status()
+                text = await resp.text()
+            self._buffer.extend(int(line, 16) for line in text.split())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+            self.failures += 1
+            if self.failures >= self.max_failures:
+                self.open_until = time.monotonic() + self.cooldown
+                self.failures = 0
+                logger.warning('random.org failed %s times, using local randomness for %ss: %r',
+                               self.max_failures, self.cooldown, exc)
+            else:
+                logger.debug('Fetching random bytes from random.org failed: %r', exc)
+        else:
+            self.failures = 0
+
+    async def _run(self):
+        async with aiohttp.ClientSession() as session:
+            while True:
+                if len(self._buffer) < self.size // 2:
+                    await self.refill(session)
+                await asyncio.sleep(self.interval)
+
+
+# started by the bot unless random.org is turned off in the config
+entropy_pool = EntropyPool()
+
+
+def random_below(upper: int, pool: EntropyPool = entropy_pool) -> int:
+    """A uniformly random int in [0, upper), from the pool while it lasts, `secrets` otherwise."""
+    bits = (upper - 1).bit_length()
+    num_bytes = (bits + 7) // 8
+    while num_bytes:
+        chunk = pool.take(num_bytes)
+        if len(chunk) < num_bytes:
+            break
+        # rejection sampling, so every number is equally likely
+        number = int.from_bytes(chunk, 'big') & ((1 << bits) - 1)
+        if number < upper:
+            return number
+    return secrets.randbelow(upper)
+
+
+def get_random_sequence(low: int, high: int, pool: EntropyPool = entropy_pool):
+    """Random permutation of all numbers in the closed interval [low, high].
+    Uses random.org bytes prefetched by `pool`, and `secrets` once they run out,
+    so it never blocks.
     Arguments:
         low: int, high: int
     Returns:
@@ -17,17 +125,9 @@ def get_random_sequence(low: int, high: int):
     Return Type:
         list[int]"""
 
-    # Send HTTP request to random.org
-    resp = requests.get('https://www.random.org/sequences/'
-                        f'?min={low}&max={high}&col=1&'
-                        'format=plain&rnd=new')
-
-    # Check if status is OK
-    # If so, read through each line, form a sequence by turning
-    # everything into an int, and return it
-    if resp.status_code == 200:
-        return list(map(int, resp.iter_lines()))
-
-    # If an error is shown, fallback to standard random
-    logger.debug('random.org down, falling back to random.sample()')
-    return random.sample(range(low, high + 1), high - low + 1)
+    sequence = list(range(low, high + 1))
+    # Fisher-Yates shuffle
+    for idx in range(len(sequence) - 1, 0, -1):
+        swap = random_below(idx + 1, pool)
+        sequence[idx], sequence[swap] = sequence[swap], sequence[idx]
+    return sequence
@@ -0,0 +1,48 @@
+import typing
+from collections import defaultdict
+
+from Levenshtein import jaro_winkler
+
+# how close a name has to be to be suggested
+SUGGESTION_THRESHOLD = 0.85
+
+
+def trigrams(text: str) -> typing.Set[str]:
+    # padded so short names and first letters get trigrams of their own
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Trigram postings over a set of names, for typo tolerant lookups.
+
+    Only names sharing a trigram with the query are scored, best matches first.
+    """
+
+    def __init__(self, names: typing.Iterable[str] = ()):
+        # casefolded name -> name as it should be shown
+        self.names: typing.Dict[str, str] = {}
+        self.postings: typing.Dict[str, typing.Set[str]] = defaultdict(set)
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str):
+        key = name.casefold()
+        self.names[key] = name
+        for trigram in trigrams(key):
+            self.postings[trigram].add(key)
+
+    def get(self, query: str) -> typing.Optional[str]:
+        """Returns the name `query` spells, ignoring case."""
+        return self.names.get(query.casefold())
+
+    def search(self, query: str, k: int = 3,
+               threshold: float = SUGGESTION_THRESHOLD) -> typing.List[typing.Tuple[str, float]]:
+        """Returns up to `k` (name, score) pairs scoring above `threshold`, best first."""
+        query = query.casefold()
+        candidates = {key for trigram in trigrams(query)
+                      for key in self.postings.get(trigram, ())}
+        scored = ((self.names[key], jaro_winkler(query, key)) for key in candidates)
+        matches = sorted((match for match in scored if match[1] > threshold),
+                         key=lambda match: (-match[1], match[0]))
+        return matches[:k]
@@ -58,14 +58,9 @@ async def confirm(bot: Bot, prompter: Member, channel: TextChannel,
     await msg.add_reaction('🇾')
     await msg.add_reaction('🇳')
 
-    def check(reaction, user):
-        return (user == prompter
-                and str(reaction.emoji) in ['🇾', '🇳']
-                and reaction.message.id == msg.id)
-
     try:
-        reaction, _user = await bot.wait_for(
-            'reaction_add', timeout=30.0, check=check)
+        reaction, _user = await bot.waiters.wait_for_reaction(
+            msg.id, prompter.id, ['🇾', '🇳'], timeout=30.0)
         return str(reaction.emoji) == '🇾'
     except asyncio.TimeoutError:
         await channel.send(content='Prompt timed out.')
@@ -83,11 +78,12 @@ async def choice(bot: Bot, prompter: Member, channel: TextChannel, message: str,
     await channel.send(content=text)
 
     def check(msg: Message):
-        return msg.author == prompter and msg.content.isdigit()
+        return msg.content.isdigit()
 
     try:
         while True:
-            response = await bot.wait_for('message', timeout=30.0, check=check)
+            response = await bot.waiters.wait_for_message(
+                channel.id, prompter.id, check=check, timeout=30.0)
 
             if int(response.content) in range(1, len(options)+1):
                 break
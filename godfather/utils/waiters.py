@@ -0,0 +1,91 @@
+import asyncio
+import typing
+from collections import defaultdict
+
+
+class WaiterRegistry:
+    """Routes reactions and messages to the prompts waiting on them.
+
+    Reaction waiters are keyed by (message id, user id) and message waiters by
+    (channel id, user id), so every event is matched with a single dict lookup
+    instead of running every registered check like `bot.wait_for` does.
+    Removed reactions only reach the waiters that asked for them.
+    """
+
+    def __init__(self):
+        self._reactions = defaultdict(list)
+        # waiters that also take removed reactions, these are in _reactions too
+        self._removals = defaultdict(list)
+        self._messages = defaultdict(list)
+
+    async def wait_for_reaction(self, message_id: int, user_id: int,
+                                emojis: typing.Optional[typing.Iterable[str]] = None,
+                                timeout: typing.Optional[float] = 30.0,
+                                removals: bool = False):
+        """Wait for `user_id` to react on `message_id`, optionally with one of `emojis`.
+        With `removals`, removing a reaction counts too.
+        Returns a (reaction, user) tuple, raises asyncio.TimeoutError on timeout."""
+        check = None
+        if emojis is not None:
+            emojis = set(emojis)
+
+            def check(reaction, _user):
+                return str(reaction.emoji) in emojis
+
+        tables = (self._reactions, self._removals) if removals else (self._reactions,)
+        return await self._wait(tables, (message_id, user_id), check, timeout)
+
+    async def wait_for_message(self, channel_id: int, user_id: int,
+                               check: typing.Optional[typing.Callable] = None,
+                               timeout: typing.Optional[float] = 30.0):
+        """Wait for `user_id` to send a message in `channel_id` that passes `check`.
+        Returns the message, raises asyncio.TimeoutError on timeout."""
+        return await self._wait((self._messages,), (channel_id, user_id), check, timeout)
+
+    def feed_reaction(self, reaction, user) -> bool:
+        """Resolve the waiters for a reaction. Returns whether any waiter matched."""
+        return self._feed(self._reactions, (reaction.message.id, user.id),
+                          (reaction, user))
+
+    def feed_reaction_remove(self, reaction, user) -> bool:
+        """Resolve the waiters that take removed reactions. Returns whether any waiter matched."""
+        return self._feed(self._removals, (reaction.message.id, user.id),
+                          (reaction, user))
+
+    def feed_message(self, message) -> bool:
+        """Resolve the waiters for a message. Returns whether any waiter matched."""
+        return self._feed(self._messages, (message.channel.id, message.author.id),
+                          (message,))
+
+    def __len__(self):
+        return sum(map(len, self._reactions.values())) \
+            + sum(map(len, self._messages.values()))
+
+    @staticmethod
+    async def _wait(tables, key, check, timeout):
+        future = asyncio.get_event_loop().create_future()
+        waiter = (check, future)
+        for table in tables:
+            table[key].append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            for table in tables:
+                waiters = table.get(key)
+                if waiters is not None:
+                    waiters.remove(waiter)
+                    if len(waiters) == 0:
+                        del table[key]
+
+    @staticmethod
+    def _feed(table, key, args) -> bool:
+        waiters = table.get(key)
+        if not waiters:
+            return False
+        matched = False
+        for check, future in waiters:
+            if future.done() or (check is not None and not check(*args)):
+                continue
+            future.set_result(args if len(args) > 1 else args[0])
+            matched = True
+        return matched
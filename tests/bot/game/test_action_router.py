@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import discord
+
+from godfather.game import Game, Phase
+from godfather.game.action_router import ActionRouter
+
+
+class ActionRouterTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.bot = Mock(games={}, global_prefix='=', all_commands={'help': Mock()})
+        self.bot.get_context = AsyncMock()
+        self.bot.action_router = ActionRouter(self.bot)
+
+        self.game = Game(Mock(**{'id': 1}), self.bot)
+        self.bot.games[1] = self.game
+        self.user = Mock(spec=discord.Member, id=10, bot=False)
+        self.game.players.add(self.user)
+
+        self.handler = AsyncMock()
+        self.player = self.game.players[self.user]
+        self.player.role = Mock(**{'pm_commands.return_value': {'shoot': self.handler}})
+        self.game.phase = Phase.NIGHT
+
+    def message(self, content):
+        return Mock(guild=None, author=self.user, content=content)
+
+    async def test_routes_night_action(self):
+        self.assertTrue(await self.bot.action_router.route(self.message('=shoot 2')))
+        self.handler.assert_awaited_once()
+        _ctx, game, player, args = self.handler.call_args.args
+        self.assertIs(game, self.game)
+        self.assertIs(player, self.player)
+        self.assertEqual(args, ['shoot', '2'])
+
+    async def test_ignores_commands_and_day_messages(self):
+        self.assertFalse(await self.bot.action_router.route(self.message('=help')))
+        self.assertFalse(await self.bot.action_router.route(self.message('=heal 2')))
+        self.game.phase = Phase.DAY
+        self.assertFalse(await self.bot.action_router.route(self.message('=shoot 2')))
+        self.handler.assert_not_awaited()
+
+    def test_stale_games_are_dropped(self):
+        self.assertIs(self.bot.action_router.game_for(self.user), self.game)
+        del self.bot.games[1]
+        self.assertIsNone(self.bot.action_router.game_for(self.user))
+        self.assertNotIn(self.user.id, self.bot.action_router.player_games)
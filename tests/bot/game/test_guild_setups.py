@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock, Mock
+
+from godfather.game import Game
+from godfather.game.guild_setups import GuildSetupLibrary
+from godfather.game.setup import Setup
+from godfather.game.setup_catalog import SetupCatalog
+
+
+def make_db(rows):
+    db = MagicMock()
+    cursor = db.conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = rows
+    return db, cursor
+
+
+class GuildSetupLibraryTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_catalogs_are_read_once(self):
+        db, cursor = make_db([('ours', 'name: ours\nroles: [Cop, Goon, Vanilla]')])
+        library = GuildSetupLibrary(db)
+        await library.create_table()
+        self.assertEqual(len(library.cached(1)), 0)
+
+        catalog = await library.catalog(1)
+        self.assertIs(await library.catalog(1), catalog)
+        self.assertEqual(catalog['ours'].roles, ('Cop', 'Goon', 'Vanilla'))
+        # the table is created once, the guild's setups are selected once
+        self.assertEqual(cursor.execute.call_count, 2)
+
+    async def test_writes_reload_the_catalog(self):
+        db, cursor = make_db([])
+        library = GuildSetupLibrary(db)
+        self.assertEqual(len(await library.catalog(1)), 0)
+
+        setup = Setup('Cop, Goon, Vanilla').renamed('ours')
+        cursor.fetchall.return_value = [('ours', setup.to_yaml())]
+        await library.save(1, setup)
+        self.assertEqual(list(library.cached(1)), ['ours'])
+
+        cursor.rowcount = 0
+        self.assertFalse(await library.delete(1, 'missing'))
+
+    async def test_find_setup_searches_guild_setups(self):
+        game = Game(Mock(), Mock())
+        game.bot.setups = SetupCatalog([Setup('{name: global, roles: [Cop, Goon, Vanilla]}')])
+        game.bot.guild_setups = GuildSetupLibrary()
+        guild_setup = Setup('{name: ours, roles: [Doctor, Goon, Vanilla, Vanilla]}')
+        game.bot.guild_setups.catalogs[game.channel.guild.id] = SetupCatalog([guild_setup])
+        for num in range(4):
+            game.players.add(Mock(id=num))
+
+        self.assertIs(await game.find_setup(), guild_setup)
+        self.assertIs(await game.find_setup('ours'), guild_setup)
+        with self.assertRaises(ValueError):
+            await game.find_setup('global')
@@ -0,0 +1,96 @@
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import discord
+
+from godfather.game import Game, Phase
+from godfather.game.setup import Setup
+from godfather.utils import DMDispatcher
+
+# a whole night in a 100 player game, from prompts to the day announcement
+NIGHT_BUDGET = 2.0
+
+
+def make_member(num):
+    member = Mock(spec=discord.Member, id=num, bot=False)
+    member.name = f'Player{num:03}'
+    member.__str__ = Mock(return_value=f'Player{num:03}#{num:04}')
+    member.send = AsyncMock()
+    return member
+
+
+class LargeGameTestCase(unittest.IsolatedAsyncioTestCase):
+    @patch('godfather.game.setup.get_random_sequence', new=lambda low, high: list(range(low, high + 1)))
+    def setUp(self):
+        channel = MagicMock(id=1)
+        channel.send = AsyncMock()
+        self.game = Game(channel, Mock(global_prefix='='))
+        self.game.bot.dms = DMDispatcher(rate=10000, burst=10000)
+        self.members = [make_member(num) for num in range(1, 101)]
+        for member in self.members:
+            self.game.players.add(member)
+
+        self.game.setup = Setup(
+            '[Goon, Vanilla Mafia x 19, Vigilante x 10, Doctor x 10, Vanilla x 60]')
+        self.game.setup.prepare_roles(self.game)
+        self.game.phase = Phase.DAY
+        self.game.cycle = 1
+
+    def tearDown(self):
+        self.game.bot.dms.close()
+
+    async def test_night_within_budget(self):
+        game = self.game
+        start = time.perf_counter()
+        await game.increment_phase()
+        self.assertEqual(game.phase, Phase.NIGHT)
+        # the playerlist doesn't fit in a single DM anymore
+        self.assertGreater(len(game.night_playerlist), 1)
+
+        ctx = Mock(send=AsyncMock())
+        vigilantes = game.players.filter(role='Vigilante')
+        for player in game.players.filter(action_only=True):
+            if player in vigilantes:
+                # every vigilante shoots a mafioso
+                target = vigilantes.index(player) + 2
+                await player.role.on_pm_command(ctx, game, player, ['shoot', str(target)])
+            else:
+                await player.role.on_pm_command(ctx, game, player, ['noaction'])
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(game.phase, Phase.DAY)
+        self.assertEqual(game.cycle, 2)
+        self.assertEqual(len(game.players.filter(is_alive=True)), 90)
+        self.assertLess(elapsed, NIGHT_BUDGET)
+
+    async def test_votes_follow_the_voter(self):
+        game = self.game
+        game.votes.start_day(game.players.filter(is_alive=True))
+        voter, first, second = game.players[0], game.players[1], game.players[2]
+
+        game.votes.vote(voter, first)
+        game.votes.vote(voter, second)
+        self.assertEqual(game.votes[first.user.id], [])
+        self.assertEqual(game.votes[second.user.id], [voter])
+        self.assertNotIn(voter, game.votes['notvoting'])
+
+        self.assertTrue(game.votes.unvote(voter))
+        self.assertFalse(game.votes.unvote(voter))
+        self.assertEqual(game.votes[second.user.id], [])
+        self.assertIn(voter, game.votes['notvoting'])
+
+    async def test_replacement_resends_action(self):
+        game = self.game
+        await game.increment_phase()
+        ctx = Mock(send=AsyncMock())
+        player = game.players.filter(role='Vigilante')[0]
+        await player.role.on_pm_command(ctx, game, player, ['noaction'])
+
+        game.replace(player, make_member(200))
+        await player.role.on_pm_command(ctx, game, player, ['shoot', '2'])
+
+        actions = [action for action in game.night_actions if action['player'] is player]
+        self.assertEqual(len(actions), 1)
+        self.assertEqual(actions[0]['action'], 'shoot')
+        self.assertEqual(len(game.night_actions), 1)
@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import discord
+
+from godfather.game import Game, Phase
+
+
+class LiveBoardTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.game = Game(MagicMock(), Mock())
+        self.game.channel.send = AsyncMock(return_value=AsyncMock())
+        self.game.board.debounce = 0.01
+        for num in range(3):
+            user = Mock(spec=discord.Member, id=num)
+            user.name = f'Player{num}'
+            self.game.players.add(user)
+
+    async def test_disabled_by_default(self):
+        self.game.phase = Phase.DAY
+        self.game.board.schedule()
+        await asyncio.sleep(0.05)
+        self.game.channel.send.assert_not_called()
+
+    async def test_changes_are_coalesced(self):
+        self.game.config.set('live_board', 'on')
+        self.game.phase = Phase.DAY
+        for _ in range(5):
+            self.game.board.schedule()
+        await asyncio.sleep(0.05)
+        self.game.channel.send.assert_awaited_once()
+        self.game.board.message.pin.assert_awaited_once()
+
+        self.game.board.schedule()
+        self.game.board.schedule()
+        await asyncio.sleep(0.05)
+        # later changes edit the same message
+        self.game.channel.send.assert_awaited_once()
+        self.game.board.message.edit.assert_awaited_once()
+
+    async def test_changes_during_an_edit_are_not_lost(self):
+        self.game.config.set('live_board', 'on')
+        self.game.phase = Phase.DAY
+        board = self.game.board
+        sent = asyncio.Event()
+
+        async def slow_send(*args, **kwargs):
+            # a change comes in while the board is being sent
+            board.schedule()
+            sent.set()
+            return AsyncMock()
+        self.game.channel.send = AsyncMock(side_effect=slow_send)
+
+        board.schedule()
+        await sent.wait()
+        await asyncio.sleep(0.05)
+        self.game.channel.send.assert_awaited_once()
+        board.message.edit.assert_awaited_once()
+
+    async def test_turning_off_unpins(self):
+        self.game.config.set('live_board', 'on')
+        self.game.phase = Phase.DAY
+        self.game.board.schedule()
+        await asyncio.sleep(0.05)
+        message = self.game.board.message
+
+        self.game.config.set('live_board', 'off')
+        self.game.board.schedule()
+        await asyncio.sleep(0)
+        message.unpin.assert_awaited_once()
+        self.assertIsNone(self.game.board.message)
+
+    def test_render_standby(self):
+        self.game.phase = Phase.STANDBY
+        self.assertNotIn('Night', self.game.board.render().author.name)
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import Mock
+
+from godfather.game.name_index import NameIndex
+
+
+def make_player(name, nick=None, discrim='0001'):
+    user = Mock(nick=nick)
+    user.name = name
+    user.__str__ = Mock(return_value=f'{name}#{discrim}')
+    return Mock(user=user)
+
+
+class NameIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex()
+        self.lemon = make_player('LemonGrass', nick='Lemmy')
+        self.lime = make_player('Lime')
+        self.orange = make_player('Orange')
+        for player in (self.lemon, self.lime, self.orange):
+            self.index.add(player)
+
+    def test_exact_and_nick_matches(self):
+        self.assertEqual(self.index.find('lemongrass'), [self.lemon])
+        self.assertEqual(self.index.find('LEMMY'), [self.lemon])
+        self.assertEqual(self.index.find('Lime#0001'), [self.lime])
+
+    def test_prefix_and_fuzzy_matches(self):
+        self.assertEqual(self.index.find('lem'), [self.lemon])
+        self.assertCountEqual(self.index.find('l'), [self.lemon, self.lime])
+        self.assertEqual(self.index.find('oragne'), [self.orange])
+        self.assertEqual(self.index.find('banana'), [])
+
+    def test_refresh_after_nick_change(self):
+        self.lemon.user.nick = 'Grass'
+        self.index.refresh(self.lemon)
+        self.assertEqual(self.index.find('grass'), [self.lemon])
+        self.assertNotIn('lemmy', self.index.exact)
+
+        self.index.remove(self.lime)
+        self.assertEqual(self.index.find('lim'), [])
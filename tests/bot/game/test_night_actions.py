@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import Mock
+
+from godfather.game import Player
+from godfather.game.night_actions import NightActions
+
+
+class VisitGraphTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.actions = NightActions(Mock(cycle=1))
+        self.players = [Player(Mock(id=num)) for num in range(4)]
+        for player in self.players:
+            player.role = Mock(spec=[])
+
+    async def test_visits_are_recorded_both_ways(self):
+        first, second, third, fourth = self.players
+        await third.visit(first, self.actions)
+        await third.visit(second, self.actions)
+        await fourth.visit(first, self.actions)
+        # self visits don't count
+        await first.visit(first, self.actions)
+
+        self.assertEqual(self.actions.visits.visitors(third), [first, second])
+        self.assertEqual(self.actions.visits.visited(first), [third, fourth])
+        self.assertEqual(self.actions.visits.visitors(first), [])
+
+    async def test_reset_keeps_history(self):
+        first, second, *_ = self.players
+        await second.visit(first, self.actions)
+        self.actions.reset()
+
+        self.assertEqual(self.actions.visits.visitors(second), [])
+        self.assertEqual(self.actions.visit_history[1].visitors(second), [first])
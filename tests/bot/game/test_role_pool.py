@@ -0,0 +1,66 @@
+import random
+import unittest
+from collections import Counter
+
+from godfather.game.role_pool import AliasTable, RolePool, RoleSampler
+from godfather.game.setup import Setup, SetupLoadError
+
+
+class RolePoolTestCase(unittest.TestCase):
+    def test_alias_table_follows_weights(self):
+        table = AliasTable(['Vanilla', 'Cop', 'Veteran'], [6, 3, 1])
+        rng = random.Random(1)
+        draws = Counter(table.draw(rng) for _ in range(10000))
+        self.assertAlmostEqual(draws['Vanilla'] / 10000, 0.6, delta=0.03)
+        self.assertAlmostEqual(draws['Cop'] / 10000, 0.3, delta=0.03)
+        self.assertAlmostEqual(draws['Veteran'] / 10000, 0.1, delta=0.03)
+
+    def test_sampler_never_draws_excluded_roles(self):
+        pools = {'Mafia Killing': RolePool('Mafia Killing', {'Goon': 1, 'Godfather': 1})}
+        sampler = RoleSampler(pools, random.Random(2))
+        sampler.exclude('Godfather')
+        self.assertEqual({sampler.draw('Mafia Killing') for _ in range(50)}, {'Goon'})
+        sampler.exclude('Goon')
+        with self.assertRaises(ValueError):
+            sampler.draw('Mafia Killing')
+
+    def test_setup_weights(self):
+        setup = Setup({'roles': ['Random Town x 3', 'Goon'], 'weights': {'Veteran': 0, 'Vanilla': 5}})
+        pool = setup.pools['Random Town']
+        self.assertNotIn('Veteran', pool.weights)
+        self.assertEqual(pool.weights['Vanilla'], 5)
+        self.assertEqual(pool.weights['Cop'], 1)
+        self.assertEqual(Setup.from_compiled(setup.compiled()).weights, setup.weights)
+
+        with self.assertRaises(SetupLoadError):
+            Setup({'roles': ['Random Town x 3', 'Goon'], 'weights': {'Mayor': 2}})
+        with self.assertRaises(SetupLoadError):
+            Setup({'roles': ['Random Town x 3', 'Goon'], 'weights': {'Vanilla': -1}})
+
+
+class FeasibilityTestCase(unittest.TestCase):
+    def test_unique_roles_can_run_out(self):
+        with self.assertRaisesRegex(SetupLoadError, 'only be used once'):
+            Setup('[Goon, Goon, Vanilla]')
+        with self.assertRaisesRegex(SetupLoadError, 'enough unique roles'):
+            Setup({'roles': ['Mafia Killing x 3', 'Vanilla'], 'weights': {}})
+        with self.assertRaisesRegex(SetupLoadError, 'No roles are left'):
+            Setup('[Godfather, Goon, Mafia Killing, Vanilla]')
+
+    def test_executioners_need_town(self):
+        with self.assertRaisesRegex(SetupLoadError, 'Town target'):
+            Setup('[Executioner, Goon, Serial Killer]')
+        with self.assertRaisesRegex(SetupLoadError, 'Town target'):
+            Setup('[Neutral Evil, Goon, Random Mafia]')
+        Setup('[Neutral Evil, Goon, Random Town]')
+
+    def test_constrained_slots_are_always_dealt(self):
+        # Random Mafia can only become Goon or Godfather here, same as Mafia Killing
+        setup = Setup({'roles': ['Random Mafia', 'Mafia Killing', 'Vanilla x 3'],
+                       'weights': {'Consigliere': 0, 'Consort': 0, 'Framer': 0,
+                                   'Janitor': 0, 'Vanilla Mafia': 0}})
+        self.assertEqual(set(setup.matching.values()), {'Goon', 'Godfather'})
+        for _ in range(20):
+            self.assertCountEqual(setup.deal_roles()[:2], ['Goon', 'Godfather'])
+        self.assertEqual(setup.deal_roles(setup.matching)[:2],
+                         [setup.matching[0], setup.matching[1]])
@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import Mock
+
+from godfather.game import Player
+from godfather.game.types import Priority
+from godfather.roles import all_roles
+
+
+class RoleTableTestCase(unittest.TestCase):
+    def test_table_swapped_with_role(self):
+        player = Player(Mock())
+        player.role = all_roles['Vigilante']()
+        self.assertEqual(player.table.verbs, ('shoot', 'noaction'))
+        self.assertEqual(player.table.priority, Priority.SHOOTER)
+        self.assertTrue(player.has_hook('on_night'))
+        self.assertFalse(player.has_hook('on_visit'))
+
+        player.role = all_roles['Veteran']()
+        self.assertTrue(player.has_hook('on_visit'))
+        # tables are shared by every instance of a role
+        self.assertIs(player.table, all_roles['Veteran']().table)
+
+    def test_independent_wins(self):
+        player = Player(Mock())
+        player.role = all_roles['Survivor']()
+        self.assertTrue(player.can_win_independently)
+        player.role = all_roles['Vanilla']()
+        self.assertFalse(player.can_win_independently)
+
+    def test_unregistered_roles_fall_back(self):
+        player = Player(Mock())
+        player.role = Mock(spec=['on_night'])
+        self.assertIsNone(player.table)
+        self.assertTrue(player.has_hook('on_night'))
+        self.assertFalse(player.has_hook('on_visit'))
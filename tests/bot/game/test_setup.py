@@ -0,0 +1,125 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import discord
+
+from godfather.game import Game
+from godfather.game.setup import Setup, SetupLoadError
+from godfather.utils import DMDispatcher
+
+
+def make_member(num):
+    member = Mock(spec=discord.Member, id=num)
+    member.name = f'Player{num}'
+    member.__str__ = Mock(return_value=f'Player{num}')
+    member.send = AsyncMock()
+    return member
+
+
+class AssignRolesTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.game = Game(Mock(), Mock())
+        self.game.bot.dms = DMDispatcher(rate=1000, burst=100)
+        self.members = [make_member(i) for i in range(1, 5)]
+        for member in self.members:
+            self.game.players.add(member)
+        self.setup = Setup('[Goon, Vanilla Mafia, Vanilla, Vanilla]')
+
+    def tearDown(self):
+        self.game.bot.dms.close()
+
+    @patch('godfather.game.setup.get_random_sequence', new=lambda low, high: list(range(low, high + 1)))
+    def test_prepare_roles(self):
+        role_pms = self.setup.prepare_roles(self.game)
+
+        roles = [player.role.name for player in self.game.players]
+        self.assertEqual(roles, ['Goon', 'Vanilla Mafia', 'Vanilla', 'Vanilla'])
+        # mafia get their team list, town only get their role PM
+        self.assertEqual([len(role_pms[player]) for player in self.game.players],
+                         [2, 2, 1, 1])
+        self.assertEqual(role_pms[self.game.players[0]][1],
+                         'Your team consists of: Player1 (Goon), Player2 (Vanilla Mafia)')
+        for member in self.members:
+            member.send.assert_not_called()
+
+    @patch('godfather.game.setup.get_random_sequence', new=lambda low, high: list(range(low, high + 1)))
+    async def test_send_role_pms_collects_forbidden(self):
+        self.members[2].send.side_effect = discord.Forbidden(
+            Mock(status=403, reason='Forbidden'), 'Cannot send messages to this user')
+
+        role_pms = self.setup.prepare_roles(self.game)
+        no_dms = await self.setup.send_role_pms(self.game, role_pms)
+
+        self.assertEqual(no_dms, [self.members[2]])
+        self.assertEqual(self.members[0].send.call_count, 2)
+        self.assertEqual(self.members[3].send.call_count, 1)
+
+    @patch('godfather.game.setup.get_random_sequence', new=lambda low, high: list(range(low, high + 1)))
+    def test_team_message_follows_deaths(self):
+        self.setup.prepare_roles(self.game)
+        team_message = self.game.players.team_message('mafia')
+        self.assertIs(self.game.players.team_message('mafia'), team_message)
+
+        self.game.players[1].is_alive = False
+        # a team of one doesn't get a team message
+        self.assertIsNone(self.game.players.team_message('mafia'))
+
+    @patch('godfather.game.setup.get_random_sequence', new=lambda low, high: list(range(low, high + 1)))
+    def test_team_message_follows_renames(self):
+        self.setup.prepare_roles(self.game)
+        self.game.players.team_message('mafia')
+
+        self.members[0].name = 'Renamed'
+        self.game.players.renamed(self.game.players[0])
+        self.assertEqual(self.game.players.team_message('mafia'),
+                         'Your team consists of: Renamed (Goon), Player2 (Vanilla Mafia)')
+
+
+SETUPLIST = """
+- name: ss3
+  roles:
+  - Vanilla
+  - Goon
+  - Super Saint
+- name: dethy
+  night_start: true
+  roles: [Cop, Insane Cop, Naive Cop, Paranoid Cop, Goon]
+"""
+
+
+class LoadSetupListTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / 'setups.yaml'
+        self.path.write_text(SETUPLIST)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_setups_are_read_only(self):
+        setup = Setup({'name': 'ss3', 'roles': ['Vanilla', 'Goon', 'Super Saint']})
+        self.assertEqual(setup.roles, ('Vanilla', 'Goon', 'Super Saint'))
+        with self.assertRaises(TypeError):
+            setup.flags['night_start'] = True
+        with self.assertRaises(SetupLoadError):
+            Setup({'roles': ['Vanilla', 'Mayor', 'Goon']})
+
+    def test_unchanged_list_is_loaded_from_cache(self):
+        setups = Setup.load_setuplist(self.path)
+        with patch.object(Setup, 'parse_setuplist') as parse_setuplist:
+            cached = Setup.load_setuplist(self.path)
+        parse_setuplist.assert_not_called()
+
+        self.assertEqual(list(cached), ['ss3', 'dethy'])
+        self.assertEqual(cached['dethy'].roles, setups['dethy'].roles)
+        self.assertTrue(cached['dethy'].flags['night_start'])
+        self.assertFalse(cached['ss3'].flags['night_start'])
+        self.assertEqual(cached['ss3'].total_players, 3)
+
+    def test_changed_list_is_parsed_again(self):
+        Setup.load_setuplist(self.path)
+        self.path.write_text(SETUPLIST.replace('Super Saint', 'Jester'))
+        setups = Setup.load_setuplist(self.path)
+        self.assertEqual(setups['ss3'].roles, ('Vanilla', 'Goon', 'Jester'))
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import patch
+
+from godfather.game.setup import Setup, SetupLoadError
+from godfather.game.setup_cache import CustomSetupCache, setup_code
+
+
+class CustomSetupCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_submissions_are_parsed_once(self):
+        cache = CustomSetupCache()
+        code, setup = await cache.load('Vigilante, Goon, Vanilla x5')
+        self.assertEqual(code, setup_code('  Vigilante, Goon, Vanilla x5\n'))
+        with patch('godfather.game.setup_cache.Setup') as parse:
+            self.assertEqual(await cache.load('Vigilante, Goon, Vanilla x5'), (code, setup))
+        parse.assert_not_called()
+        self.assertIs(cache.get(code), setup)
+
+    async def test_large_submissions_and_errors(self):
+        cache = CustomSetupCache()
+        setup_data = '\n'.join(['name: big', 'roles:', *['- Vanilla'] * 90, '- Goon'])
+        _, setup = await cache.load(setup_data)
+        self.assertEqual(setup.total_players, 91)
+        with self.assertRaises(SetupLoadError):
+            await cache.load('Goon, Goon, Vanilla')
+        self.assertEqual(len(cache.setups), 1)
+
+    def test_least_recently_used_setups_are_evicted(self):
+        cache = CustomSetupCache(maxsize=2)
+        setups = [Setup(f'Goon, Vanilla x {num}') for num in range(2, 5)]
+        cache.put('a', setups[0])
+        cache.put('b', setups[1])
+        cache.get('a')
+        cache.put('c', setups[2])
+        self.assertIsNone(cache.get('b'))
+        self.assertIs(cache.get('a'), setups[0])
+
+    async def test_resolve_codes(self):
+        cache = CustomSetupCache(maxsize=1)
+        code, setup = await cache.resolve('Cop, Goon, Vanilla')
+        self.assertEqual(await cache.resolve(f' {code} '), (code, setup))
+
+        await cache.resolve('Doctor, Goon, Vanilla')
+        # evicted codes get a clear error instead of being parsed as a setup
+        with self.assertRaisesRegex(SetupLoadError, 'expired setup code'):
+            await cache.resolve(code)
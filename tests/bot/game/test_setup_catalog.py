@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import Mock
+
+from godfather.game import Game
+from godfather.game.setup import Setup
+from godfather.game.guild_setups import GuildSetupLibrary
+from godfather.game.setup_catalog import SetupCatalog
+
+
+class SetupCatalogTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ss3 = Setup('{name: ss3, roles: [Vanilla, Goon, Super Saint]}')
+        self.dethy = Setup('{name: dethy, roles: [Cop, Insane Cop, Naive Cop, Paranoid Cop, Goon]}')
+        self.random = Setup('{name: random, roles: [Random Town x 3, Cop, Goon]}')
+        self.catalog = SetupCatalog([self.ss3, self.random, self.dethy])
+
+    def test_lookups(self):
+        self.assertIs(self.catalog['dethy'], self.dethy)
+        self.assertEqual(list(self.catalog), ['ss3', 'random', 'dethy'])
+        self.assertEqual(self.catalog.for_players(5), [self.dethy, self.random])
+        self.assertEqual(self.catalog.for_players(4), [])
+        self.assertEqual(self.catalog.with_role('goon'), [self.ss3, self.random, self.dethy])
+        self.assertEqual(self.catalog.with_role('Random Town'), [self.random])
+
+    async def test_find_setup_with_one_candidate(self):
+        game = Game(Mock(), Mock())
+        game.bot.setups = self.catalog
+        game.bot.guild_setups = GuildSetupLibrary()
+        for num in range(3):
+            game.players.add(Mock(id=num))
+        self.assertIs(await game.find_setup(), self.ss3)
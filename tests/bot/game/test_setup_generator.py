@@ -0,0 +1,42 @@
+import random
+import unittest
+from unittest.mock import Mock
+
+from godfather.game import Game
+from godfather.game.guild_setups import GuildSetupLibrary
+from godfather.game.setup_catalog import SetupCatalog
+from godfather.game.setup_generator import SetupGenerator, balance
+from godfather.game.types import LARGE_GAME_MAX_PLAYERS
+
+
+class SetupGeneratorTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.generator = SetupGenerator(random.Random(1))
+
+    def test_every_player_count(self):
+        for num_players in range(3, LARGE_GAME_MAX_PLAYERS + 1):
+            setup = self.generator.get(num_players)
+            self.assertEqual(setup.total_players, num_players)
+            num_mafia = sum('Mafia' in role for role in setup.roles)
+            self.assertGreaterEqual(num_mafia, 1)
+            self.assertLess(num_mafia * 2, num_players)
+            self.assertLess(balance(setup.roles), 0.5)
+            # and the roles can actually be dealt
+            self.assertEqual(len(setup.deal_roles(setup.matching)), num_players)
+
+    def test_best_setup_is_cached(self):
+        self.assertIs(self.generator.get(13), self.generator.get(13))
+
+    def test_out_of_range(self):
+        for num_players in (2, LARGE_GAME_MAX_PLAYERS + 1):
+            with self.assertRaises(ValueError):
+                self.generator.get(num_players)
+
+    async def test_find_setup_falls_back_to_generated(self):
+        game = Game(Mock(), Mock())
+        game.bot.setups = SetupCatalog()
+        game.bot.guild_setups = GuildSetupLibrary()
+        game.bot.setup_generator = self.generator
+        for num in range(11):
+            game.players.add(Mock(id=num))
+        self.assertIs(await game.find_setup(), self.generator.get(11))
@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import discord
+
+from godfather.utils.dm_dispatcher import DMDispatcher, DMPriority
+
+
+def make_user(user_id, sent):
+    user = Mock(id=user_id)
+
+    async def send(content, **_kwargs):
+        sent.append((user_id, content))
+        return content
+
+    user.send = send
+    return user
+
+
+class DMDispatcherTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.dispatcher = DMDispatcher(rate=1000, burst=1)
+        self.sent = []
+
+    def tearDown(self):
+        self.dispatcher.close()
+
+    async def test_priority_lanes(self):
+        users = [make_user(i, self.sent) for i in range(3)]
+        futures = [
+            self.dispatcher.enqueue(users[0], 'flavor', priority=DMPriority.FLAVOR),
+            self.dispatcher.enqueue(users[1], 'role pm', priority=DMPriority.ROLE_PM),
+            self.dispatcher.enqueue(users[2], 'result', priority=DMPriority.ACTION_RESULT),
+        ]
+        await asyncio.gather(*futures)
+        self.assertEqual([content for _, content in self.sent],
+                         ['result', 'role pm', 'flavor'])
+
+    async def test_per_recipient_ordering(self):
+        user = make_user(1, self.sent)
+        futures = [
+            self.dispatcher.enqueue(user, 'first', priority=DMPriority.FLAVOR),
+            self.dispatcher.enqueue(user, 'second', priority=DMPriority.ACTION_RESULT),
+        ]
+        await asyncio.gather(*futures)
+        self.assertEqual(self.sent, [(1, 'first'), (1, 'second')])
+
+    async def test_forbidden_propagates(self):
+        user = Mock(id=1)
+        user.send = AsyncMock(side_effect=discord.Forbidden(
+            Mock(status=403, reason='Forbidden'), 'Cannot send messages to this user'))
+        with self.assertRaises(discord.Forbidden):
+            await self.dispatcher.send(user, 'hello')
+
+    async def test_backlog_gauge(self):
+        game = Mock(**{'channel.id': 42})
+        user = make_user(1, self.sent)
+        future = self.dispatcher.enqueue(user, 'hello', game=game)
+        self.assertEqual(self.dispatcher.backlog(game), 1)
+        await future
+        self.assertEqual(self.dispatcher.backlog(game), 0)
+
+    async def test_drain(self):
+        user = make_user(1, self.sent)
+        delivered = self.dispatcher.enqueue(user, 'first')
+        await self.dispatcher.drain(timeout=1)
+        self.assertEqual(await delivered, 'first')
+        self.assertIsNone(self.dispatcher._worker)
+
+    async def test_drain_cancels_leftovers(self):
+        user = Mock(id=1)
+
+        async def slow_send(*_args, **_kwargs):
+            await asyncio.sleep(1)
+        user.send = slow_send
+        self.dispatcher.enqueue(user, 'slow')
+        queued = self.dispatcher.enqueue(user, 'never sent')
+        await self.dispatcher.drain(timeout=0.05)
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(self.dispatcher.backlog(), 0)
@@ -0,0 +1,24 @@
+import unittest
+from unittest.mock import Mock
+
+import discord
+
+from godfather.utils import EmbedCache
+
+
+class EmbedCacheTestCase(unittest.TestCase):
+    def test_embeds_are_built_once(self):
+        cache = EmbedCache()
+        build = Mock(side_effect=discord.Embed)
+        first = cache.get('rolelist', build)
+        self.assertIs(cache.get('rolelist', build), first)
+        build.assert_called_once()
+
+        cache.get(('roleinfo', 'Cop'), build)
+        self.assertEqual(build.call_count, 2)
+
+    def test_clear_rebuilds(self):
+        cache = EmbedCache()
+        first = cache.get('help', discord.Embed)
+        cache.clear()
+        self.assertIsNot(cache.get('help', discord.Embed), first)
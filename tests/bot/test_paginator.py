@@ -0,0 +1,36 @@
+import unittest
+
+from godfather.utils.paginator import chunk_lines, embed_pages
+
+
+class PaginatorTestCase(unittest.TestCase):
+    def test_short_output_is_one_chunk(self):
+        self.assertEqual(chunk_lines(['a', 'b'], header='**x** ', prefix='```\n', suffix='```'),
+                         ['**x** ```\na\nb```'])
+
+    def test_chunks_respect_limit(self):
+        lines = [f'{num}. {"x" * 30}' for num in range(1, 101)]
+        chunks = chunk_lines(lines, limit=500, header='**Players**\n',
+                             prefix='```\n', suffix='```')
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), 500)
+            self.assertTrue(chunk.endswith('```'))
+        self.assertTrue(chunks[0].startswith('**Players**\n```'))
+        # every line is sent exactly once, in order
+        joined = '\n'.join(chunk.split('```')[1].strip('\n') for chunk in chunks)
+        self.assertEqual(joined.split('\n'), lines)
+
+    def test_long_lines_are_truncated(self):
+        chunks = chunk_lines(['y' * 50], limit=20)
+        self.assertEqual(chunks, ['y' * 20])
+
+    def test_embed_pages_are_numbered(self):
+        pages = embed_pages(['z' * 100] * 50, title='Setups')
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(pages[-1].footer.text, 'Page 3/3')
+        self.assertEqual(len(embed_pages(['z'])[0].footer), 0)
+
+    def test_nothing_to_send(self):
+        self.assertEqual(chunk_lines([]), [])
+        self.assertEqual(chunk_lines([], header='**Players: 0**'), ['**Players: 0**'])
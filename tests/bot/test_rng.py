@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from godfather.utils.rng import EntropyPool, get_random_sequence, random_below
+
+
+def response(text=None, exc=None):
+    resp = MagicMock()
+    resp.__aenter__.return_value = resp
+    resp.text = AsyncMock(return_value=text)
+    if exc is not None:
+        resp.__aenter__.side_effect = exc
+    return resp
+
+
+class EntropyPoolTestCase(unittest.IsolatedAsyncioTestCase):
+    def test_empty_pool_falls_back(self):
+        pool = EntropyPool()
+        self.assertEqual(sorted(get_random_sequence(3, 12, pool)), list(range(3, 13)))
+        self.assertEqual(get_random_sequence(5, 5, pool), [5])
+
+    def test_uses_pool_bytes(self):
+        pool = EntropyPool()
+        pool._buffer.extend([0xff, 2, 7])
+        # 0xff is out of range for a draw below 6 and gets rejected
+        self.assertEqual(random_below(6, pool), 2)
+        self.assertEqual(len(pool), 1)
+        # 7 is rejected too, and the empty pool hands over to secrets
+        self.assertIn(random_below(6, pool), range(6))
+        self.assertEqual(len(pool), 0)
+
+    async def test_refill(self):
+        pool = EntropyPool(size=4)
+        session = MagicMock()
+        session.get.return_value = response('0a\nff\n00\n')
+        await pool.refill(session)
+        self.assertEqual(pool.take(4), bytes([0x0a, 0xff, 0x00]))
+        self.assertEqual(session.get.call_args[1]['params']['num'], 4)
+
+    async def test_circuit_breaker(self):
+        pool = EntropyPool(max_failures=2, cooldown=60)
+        session = MagicMock()
+        session.get.side_effect = lambda *args, **kwargs: response(exc=asyncio.TimeoutError())
+        await pool.refill(session)
+        self.assertTrue(pool.available)
+        await pool.refill(session)
+        self.assertFalse(pool.available)
+        await pool.refill(session)
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(len(pool), 0)
@@ -0,0 +1,35 @@
+import unittest
+from unittest import mock
+
+import yaml
+
+from godfather.roles import all_roles, manifest, role_categories, role_registry
+
+
+class RoleManifestTestCase(unittest.TestCase):
+    def test_manifest_is_up_to_date(self):
+        # run `python -m godfather.roles` if this fails
+        self.assertIsNotNone(manifest.read_manifest())
+
+    def test_manifest_covers_setups(self):
+        with open('setups/setups.yaml') as file:
+            setups = yaml.safe_load(file)
+        self.assertEqual(manifest.check_setups(role_registry, setups), [])
+        broken = [{'name': 'broken', 'roles': ['Cop', 'Mayor x 2', 'Random Town']}]
+        self.assertEqual(manifest.check_setups(role_registry, broken),
+                         ["broken: unknown role 'Mayor'"])
+
+    def test_stale_manifest_is_ignored(self):
+        with mock.patch.object(manifest, 'source_digest', return_value='stale'):
+            self.assertIsNone(manifest.read_manifest())
+
+    def test_roles_are_imported_on_lookup(self):
+        roles = manifest.LazyRoles(role_registry)
+        categories = manifest.LazyCategories(roles)
+        self.assertIn('Cop', roles)
+        self.assertIn('Dethy Cop', categories)
+        self.assertEqual(roles.loaded, {})
+
+        self.assertIs(roles['Cop'], all_roles['Cop'])
+        self.assertEqual(categories['Dethy Cop'], role_categories['Dethy Cop'])
+        self.assertEqual(set(roles.loaded), {'Cop', 'Insane Cop', 'Naive Cop', 'Paranoid Cop'})
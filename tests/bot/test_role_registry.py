@@ -0,0 +1,29 @@
+import unittest
+from unittest import mock
+
+from godfather.roles import all_roles, role_categories, role_registry
+from godfather.roles.base import Role
+
+
+class RoleRegistryTestCase(unittest.TestCase):
+    def test_registry_matches_role_classes(self):
+        self.assertEqual(set(role_registry), set(all_roles))
+        consort = role_registry['Consort']
+        self.assertEqual(consort.faction, 'Mafia')
+        self.assertEqual(consort.categories, ('Random Mafia', 'Mafia Support'))
+        self.assertEqual(consort.verbs, ('block', 'noaction'))
+        self.assertTrue(role_registry['Veteran'].unique)
+        self.assertIn(all_roles['Vigilante'], role_categories['Town Killing'])
+
+    def test_reading_metadata_doesnt_create_roles(self):
+        with mock.patch.object(Role, '__init__', side_effect=AssertionError):
+            for name, role_cls in all_roles.items():
+                self.assertEqual(role_cls.categories, role_registry[name].categories)
+                self.assertIsNotNone(role_cls.faction)
+
+    def test_registry_is_read_only(self):
+        with self.assertRaises(TypeError):
+            role_registry['Cop'] = None
+        with self.assertRaises(TypeError):
+            role_categories['Random Town'] = ()
+        self.assertIsInstance(role_categories['Random Town'], tuple)
@@ -0,0 +1,26 @@
+import unittest
+
+from godfather.utils.search import SearchIndex
+
+
+class SearchIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex(['Cop', 'Insane Cop', 'Consort', 'Consigliere',
+                                  'Serial Killer', 'Random Town', 'Town Killing'])
+
+    def test_exact_lookups_ignore_case(self):
+        self.assertEqual(self.index.get('insane cop'), 'Insane Cop')
+        self.assertIsNone(self.index.get('insane'))
+
+    def test_best_match_comes_first(self):
+        matches = self.index.search('consigleire')
+        self.assertEqual(matches[0][0], 'Consigliere')
+        self.assertEqual(self.index.search('serail killer')[0][0], 'Serial Killer')
+        self.assertEqual(self.index.search('rnadom town')[0][0], 'Random Town')
+
+    def test_results_are_ranked_and_limited(self):
+        matches = self.index.search('consor', k=2, threshold=0.5)
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(matches[0][0], 'Consort')
+        self.assertGreaterEqual(matches[0][1], matches[1][1])
+        self.assertEqual(self.index.search('xyzzy'), [])
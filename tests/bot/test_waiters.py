@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from godfather.utils.waiters import WaiterRegistry
+
+
+def make_reaction(message_id, emoji):
+    return Mock(**{'message.id': message_id, 'emoji': emoji})
+
+
+def make_message(channel_id, author_id, content):
+    return Mock(**{'channel.id': channel_id, 'author.id': author_id, 'content': content})
+
+
+class WaiterRegistryTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.waiters = WaiterRegistry()
+
+    async def test_reaction_routed_by_message_and_user(self):
+        task = asyncio.ensure_future(
+            self.waiters.wait_for_reaction(10, 1, ['🇾', '🇳']))
+        await asyncio.sleep(0)
+
+        # wrong user, wrong message and wrong emoji are all ignored
+        self.assertFalse(self.waiters.feed_reaction(make_reaction(10, '🇾'), Mock(id=2)))
+        self.assertFalse(self.waiters.feed_reaction(make_reaction(11, '🇾'), Mock(id=1)))
+        self.assertFalse(self.waiters.feed_reaction(make_reaction(10, '👍'), Mock(id=1)))
+
+        reaction = make_reaction(10, '🇾')
+        self.assertTrue(self.waiters.feed_reaction(reaction, Mock(id=1)))
+        result, _user = await task
+        self.assertIs(result, reaction)
+        self.assertEqual(len(self.waiters), 0)
+
+    async def test_message_check(self):
+        task = asyncio.ensure_future(self.waiters.wait_for_message(
+            5, 1, check=lambda msg: msg.content.isdigit()))
+        await asyncio.sleep(0)
+
+        self.assertFalse(self.waiters.feed_message(make_message(5, 1, 'hello')))
+        message = make_message(5, 1, '2')
+        self.assertTrue(self.waiters.feed_message(message))
+        self.assertIs(await task, message)
+
+    async def test_timeout_removes_waiter(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.waiters.wait_for_message(5, 1, timeout=0.01)
+        self.assertEqual(len(self.waiters), 0)
+
+    async def test_removals_only_reach_waiters_that_take_them(self):
+        prompt = asyncio.ensure_future(self.waiters.wait_for_reaction(10, 1, ['🇾']))
+        pages = asyncio.ensure_future(self.waiters.wait_for_reaction(11, 1, ['▶'], removals=True))
+        await asyncio.sleep(0)
+
+        self.assertFalse(self.waiters.feed_reaction_remove(make_reaction(10, '🇾'), Mock(id=1)))
+        self.assertFalse(prompt.done())
+        self.assertTrue(self.waiters.feed_reaction_remove(make_reaction(11, '▶'), Mock(id=1)))
+        await pages
+        self.assertEqual(len(self.waiters), 1)
+        prompt.cancel()